@@ -1,16 +1,34 @@
-import customtkinter as ctk
-from src.ui.main_window import PyVersionerApp
+import sys
+import time
+
+# Taken before anything heavy is imported, so the startup report covers the imports
+STARTED = time.perf_counter()
 
 __version__ = "1.0.0"
 
 
 def main():
+    # Any command-line arguments select the headless runner, which never imports the GUI toolkits
+    if len(sys.argv) > 1:
+        from src.cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:], version=__version__))
+
+    from src.utils.startup_timing import StartupTimer
+    timer = StartupTimer(STARTED)
+
+    import customtkinter as ctk
+    timer.mark("import customtkinter")
+    from src.ui.main_window import PyVersionerApp
+    timer.mark("import main window")
+
     ctk.set_appearance_mode("System")
     ctk.set_default_color_theme("blue")
     
-    app = PyVersionerApp(version=__version__)
+    app = PyVersionerApp(version=__version__, startup_timer=timer)
+    timer.mark("build window")
+    # Idle callbacks run once the pending redraws are done, i.e. after the first paint
+    app.after_idle(timer.mark, "first paint")
     app.mainloop()
 
 if __name__ == "__main__":
     main()
- 
\ No newline at end of file
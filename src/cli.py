@@ -0,0 +1,300 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+from src.utils.benchmark import TIMING_KEYS, summarize
+from src.utils.interpreter_cache import interpreter_cache
+from src.utils.outcomes import ERROR, FAILED, FINISHED, PASSED, STDERR_TAIL, TIMEOUT, digest
+from src.utils.python_env import time_python_script
+from src.utils.resources import summarize_samples
+from src.utils.worker_pool import worker_pool
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="pyversioner",
+        description="Run Python scripts across interpreters without the GUI.",
+    )
+    parser.add_argument("scripts", nargs="+", help="Python scripts, or folders to run every *.py file in")
+    parser.add_argument(
+        "-p", "--python", dest="interpreters", action="append", required=True,
+        help="Python interpreter to run with (repeat for several)"
+    )
+    parser.add_argument("-n", "--runs", type=int, default=1, help="Measured runs per script and interpreter")
+    parser.add_argument("-w", "--warmup", type=int, default=0, help="Unmeasured warmup runs")
+    parser.add_argument("-t", "--timeout", type=float, default=None, help="Per-run timeout in seconds")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Cells to run in parallel (1 for fair timing)")
+    parser.add_argument(
+        "--warm", action="store_true",
+        help="Run in a persistent worker per interpreter, so timings exclude interpreter startup"
+    )
+    parser.add_argument(
+        "--sample-interval", type=float, default=None,
+        help="Sample CPU, memory, threads and file descriptors every N seconds (Linux)"
+    )
+    parser.add_argument(
+        "--cache", action="store_true",
+        help="Reuse results of unchanged scripts, interpreters and package sets from earlier runs"
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Run every cell again, even cached or journaled ones (e.g. to re-measure a benchmark), and refresh the cache"
+    )
+    parser.add_argument(
+        "--resume", dest="resume_path",
+        help="Journal file of passed and failed cells; cells already in it are not run again unless their "
+             "script or interpreter changed"
+    )
+    parser.add_argument(
+        "--history", dest="history_path", nargs="?", const="", default=None,
+        help="Record runs in a SQLite run history (default location if no path is given) "
+             "and check them for timing regressions"
+    )
+    parser.add_argument(
+        "--fail-on-regression", action="store_true",
+        help="With --history: exit with status 1 when a script got slower than its history"
+    )
+    parser.add_argument("--json", dest="json_path", help="Write a JSON report to this path ('-' for stdout)")
+    parser.add_argument("--junit", dest="junit_path", help="Write a JUnit XML report to this path")
+    return parser
+
+
+def run_cell(python_path, script_path, runs=1, warmup=0, timeout=None, sample_interval=None, warm=False):
+    """Run one script with one interpreter and describe the outcome"""
+    cell = {
+        "script": script_path,
+        "interpreter": python_path,
+        "python_version": None,
+        "status": PASSED,
+        "returncode": None,
+        "error": None,
+        "stdout_sha256": None,
+        "stderr_sha256": None,
+        "stderr_tail": "",
+        "mode": "warm" if warm else "cold",
+        "measurements": [],
+        "resources": None,
+    }
+    version, return_code, error = interpreter_cache.get_version(python_path)
+    if not version:
+        cell.update(status=ERROR, error=error)
+        return cell
+    cell["python_version"] = version
+
+    for index in range(warmup + runs):
+        if warm:
+            stdout, stderr, return_code, timing = worker_pool.run(python_path, script_path, timeout=timeout)
+        else:
+            stdout, stderr, return_code, timing = time_python_script(
+                python_path, script_path, timeout=timeout, sample_interval=sample_interval
+            )
+        if timing is None:
+            cell.update(status=ERROR, error=stderr)
+            break
+        if index == warmup or return_code != 0 or timing["timed_out"]:
+            # Output of the first measured (or failing) run identifies the result
+            cell.update(
+                returncode=return_code,
+                stdout_sha256=digest(stdout),
+                stderr_sha256=digest(stderr),
+                stderr_tail=stderr[-STDERR_TAIL:],
+            )
+        if timing["timed_out"]:
+            cell.update(status=TIMEOUT, returncode=return_code, error=f"Timed out after {timeout} seconds")
+            break
+        if return_code != 0:
+            cell.update(status=FAILED, returncode=return_code, stderr_tail=stderr[-STDERR_TAIL:])
+            break
+        if index >= warmup:
+            cell["measurements"].append(timing)
+
+    for key in TIMING_KEYS:
+        cell[key] = summarize([m[key] for m in cell["measurements"]])
+    if warm:
+        cell["worker_startup"] = worker_pool.worker(python_path).startup
+    if sample_interval and not warm and cell["measurements"]:
+        # Summary of the first measured run; every measurement keeps its full series
+        cell["resources"] = summarize_samples(cell["measurements"][0]["samples"])
+    return cell
+
+
+def write_json(report, path):
+    text = json.dumps(report, indent=2)
+    if path == "-":
+        print(text)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+def write_junit(report, path):
+    """Write one test suite per interpreter and one test case per script"""
+    import xml.etree.ElementTree as ET
+
+    root = ET.Element("testsuites", name="pyversioner")
+    for interpreter in report["interpreters"]:
+        cells = [cell for cell in report["results"] if cell["interpreter"] == interpreter]
+        suite = ET.SubElement(
+            root, "testsuite",
+            name=interpreter,
+            tests=str(len(cells)),
+            failures=str(sum(cell["status"] in (FAILED, TIMEOUT) for cell in cells)),
+            errors=str(sum(cell["status"] == ERROR for cell in cells)),
+        )
+        for cell in cells:
+            wall = cell["wall"]["median"] if cell["wall"] else 0.0
+            case = ET.SubElement(
+                suite, "testcase",
+                classname=interpreter,
+                name=os.path.basename(cell["script"]),
+                file=cell["script"],
+                time=f"{wall:.6f}",
+            )
+            if cell["status"] in (FAILED, TIMEOUT):
+                failure = ET.SubElement(
+                    case, "failure",
+                    message=cell["error"] or f"Process exited with code {cell['returncode']}",
+                    type=cell["status"],
+                )
+                failure.text = cell["stderr_tail"]
+            elif cell["status"] == ERROR:
+                ET.SubElement(case, "error", message=cell["error"] or "Unknown error", type=ERROR)
+            ET.SubElement(case, "system-out").text = f"stdout sha256: {cell['stdout_sha256']}"
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def record_history(history, cell):
+    """Store a freshly run cell in the run history and check its timing against earlier runs"""
+    rows = [
+        dict(measurement, status="completed", returncode=0, stdout_sha256=cell["stdout_sha256"])
+        for measurement in cell["measurements"]
+    ]
+    if cell["status"] in (FAILED, TIMEOUT):
+        rows.append({
+            "status": "completed" if cell["status"] == FAILED else "timeout",
+            "returncode": cell["returncode"],
+            "stdout_sha256": cell["stdout_sha256"],
+        })
+    if not rows:
+        return None
+    return history.check(history.record(cell["interpreter"], cell["script"], rows, source="cli", mode=cell["mode"]))
+
+
+def format_cell(cell):
+    if cell["wall"]:
+        timing = f"median {cell['wall']['median'] * 1000:.1f} ms over {cell['wall']['runs']} {cell['mode']} runs"
+    else:
+        timing = cell["error"] or f"exit code {cell['returncode']}"
+    regression = cell.get("regression")
+    if regression and regression["status"] != "steady":
+        timing += f" ({regression['status']} {regression['change']:+.1%} vs history)"
+    cached = " (cached)" if cell.get("cached") else ""
+    return f"[{cell['status'].upper():7}] {cell['interpreter']} ({cell['python_version']}) {cell['script']}: {timing}{cached}"
+
+
+def main(argv=None, version=None):
+    args = build_parser().parse_args(argv)
+    if args.runs < 1 or args.warmup < 0 or args.jobs < 1:
+        print("error: --runs and --jobs must be at least 1 and --warmup at least 0", file=sys.stderr)
+        return 2
+    if args.sample_interval is not None and args.sample_interval <= 0:
+        print("error: --sample-interval must be positive", file=sys.stderr)
+        return 2
+
+    scripts = list(args.scripts)
+    if any(os.path.isdir(path) for path in scripts) or args.resume_path:
+        # Imported lazily: the batch module pulls in concurrent.futures and with it logging
+        from src.utils.batch import BatchJournal, find_scripts
+
+        scripts = [found for path in scripts for found in (find_scripts(path) if os.path.isdir(path) else [path])]
+    journal, done = None, {}
+    if args.resume_path:
+        journal = BatchJournal(args.resume_path, key_fields=("script", "interpreter"))
+        # --force reruns every cell, journaled ones included
+        done = {} if args.force else journal.load()
+
+    history = None
+    if args.history_path is not None:
+        from src.utils.run_history import RunHistory
+
+        history = RunHistory(args.history_path or None)
+
+    cache = None
+    if args.cache:
+        from src.utils.result_cache import result_cache as cache
+    # Everything besides the script and interpreter that shapes a cell
+    variant = {
+        "kind": "cli", "runs": args.runs, "warmup": args.warmup, "timeout": args.timeout,
+        "sample_interval": args.sample_interval, "warm": args.warm,
+    }
+
+    def run(python_path, script):
+        key = cache.key(python_path, script, variant) if cache else None
+        cell = cache.get(key) if key and not args.force else None
+        if cell:
+            cell = dict(cell, script=script, interpreter=python_path, cached=True)
+        else:
+            cell = run_cell(python_path, script, args.runs, args.warmup, args.timeout, args.sample_interval, args.warm)
+            # Timeouts and errors depend on the machine, not on the inputs
+            if key and cell["status"] in FINISHED:
+                cache.put(key, cell)
+            # Cached cells did not run, so they add nothing to the history
+            if history:
+                cell["regression"] = record_history(history, cell)
+        if journal:
+            journal.append(cell)
+        return cell
+
+    cells = [(python_path, script) for script in scripts for python_path in args.interpreters]
+    start = time.time()
+    # Keep stdout clean when it carries the JSON report
+    log = sys.stderr if args.json_path == "-" else sys.stdout
+    results = []
+    if args.jobs == 1:
+        for python_path, script in cells:
+            resumed = done.get((script, python_path))
+            results.append(resumed or run(python_path, script))
+            print(format_cell(results[-1]) + (" (resumed)" if resumed else ""), file=log)
+    else:
+        # Imported lazily: concurrent.futures pulls in logging, which is slow to import
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            futures = {
+                (script, python_path): executor.submit(run, python_path, script)
+                for python_path, script in cells if (script, python_path) not in done
+            }
+            for python_path, script in cells:
+                resumed = done.get((script, python_path))
+                results.append(resumed or futures[(script, python_path)].result())
+                print(format_cell(results[-1]) + (" (resumed)" if resumed else ""), file=log)
+
+    worker_pool.close()
+
+    report = {
+        "version": version,
+        "started": start,
+        "duration": time.time() - start,
+        "interpreters": args.interpreters,
+        "scripts": scripts,
+        "runs": args.runs,
+        "warmup": args.warmup,
+        "timeout": args.timeout,
+        "sample_interval": args.sample_interval,
+        "mode": "warm" if args.warm else "cold",
+        "history": history.path if history else None,
+        "results": results,
+    }
+    if args.json_path:
+        write_json(report, args.json_path)
+    if args.junit_path:
+        write_junit(report, args.junit_path)
+
+    if history:
+        history.close()
+    regressed = any((cell.get("regression") or {}).get("status") == "regression" for cell in results)
+    if args.fail_on_regression and regressed:
+        return 1
+    return 0 if all(cell["status"] == PASSED for cell in results) else 1
@@ -0,0 +1,188 @@
+import customtkinter as ctk
+import tkinter as tk
+import os
+import threading
+from tkinter import filedialog, messagebox
+from typing import List, Tuple
+
+from src.ui.package_table import CTkPackageTable
+from src.ui.ui_queue import UiQueue
+from src.utils.batch import BatchJournal, BatchRunner, DIFFERS, find_scripts, journal_path, output_status
+from src.utils.outcomes import CANCELLED, ERROR, FAILED, PASSED, TIMEOUT
+from src.utils.result_cache import result_cache
+from src.utils.run_history import run_history
+
+
+PENDING = "…"
+STATUS_MARKS = {PASSED: "✓", FAILED: "✗", TIMEOUT: "⏱", CANCELLED: "–", ERROR: "!"}
+
+
+def cell_text(record, baseline):
+    """Grid cell: status mark, duration, whether the output differs from the baseline and regressions"""
+    text = STATUS_MARKS.get(record["status"], "?")
+    if record["status"] == FAILED:
+        text += f" exit {record['returncode']}"
+    if record.get("wall") is not None:
+        text += f" {record['wall']:.2f}s"
+    if output_status(record, baseline) == DIFFERS:
+        text += " ≠"
+    if record.get("regression"):
+        text += f" slower {record['regression']['change']:+.0%}"
+    if record.get("cached"):
+        text += " (cached)"
+    return text
+
+
+class BatchWindow(ctk.CTkToplevel):
+    """Window running a folder of scripts against every environment as a script × environment grid"""
+    def __init__(self, environments: List[Tuple[str, str]], concurrency=None, timeout=None,
+                 title: str = "Batch Run"):
+        super().__init__()
+        self.title(title)
+        self.geometry(f"{max(800, 200 * (len(environments) + 1))}x700")
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(2, weight=1)
+        self.environments = environments
+        self.concurrency = concurrency
+        self.runner = None
+        self.ui_queue = UiQueue(self)
+        self.directory = None
+
+        options_frame = ctk.CTkFrame(self)
+        options_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 0))
+        options_frame.grid_columnconfigure(1, weight=1)
+
+        ctk.CTkButton(options_frame, text="Choose Folder", command=self.choose_folder, width=120).grid(
+            row=0, column=0, padx=5, pady=5
+        )
+        self.folder_label = ctk.CTkLabel(options_frame, text="No folder selected", anchor="w")
+        self.folder_label.grid(row=0, column=1, sticky="ew", padx=5, pady=5)
+
+        ctk.CTkLabel(options_frame, text="Pattern:").grid(row=0, column=2, padx=(10, 5))
+        self.pattern_entry = ctk.CTkEntry(options_frame, width=90)
+        self.pattern_entry.insert(0, "*.py")
+        self.pattern_entry.grid(row=0, column=3, padx=5)
+
+        ctk.CTkLabel(options_frame, text="Timeout (s):").grid(row=0, column=4, padx=(10, 5))
+        self.timeout_entry = ctk.CTkEntry(options_frame, width=60)
+        if timeout:
+            self.timeout_entry.insert(0, str(timeout))
+        self.timeout_entry.grid(row=0, column=5, padx=5)
+
+        self.resume_var = tk.BooleanVar(value=True)
+        ctk.CTkCheckBox(options_frame, text="Resume", variable=self.resume_var).grid(row=0, column=6, padx=5)
+
+        self.cache_var = tk.BooleanVar(value=True)
+        ctk.CTkCheckBox(options_frame, text="Reuse cached results", variable=self.cache_var).grid(
+            row=0, column=7, padx=5
+        )
+
+        self.start_button = ctk.CTkButton(options_frame, text="Start", command=self.start, width=80, state="disabled")
+        self.start_button.grid(row=0, column=8, padx=5)
+        self.cancel_button = ctk.CTkButton(
+            options_frame, text="Cancel", command=self.cancel, width=80, state="disabled",
+            fg_color="#8B0000", hover_color="#A52A2A"
+        )
+        self.cancel_button.grid(row=0, column=9, padx=5)
+
+        self.progress_label = ctk.CTkLabel(
+            self, text=f"Baseline for output differences (≠): {environments[0][0]}", anchor="w"
+        )
+        self.progress_label.grid(row=1, column=0, sticky="ew", padx=15, pady=(5, 0))
+
+        self._columns = [("name", "Script")] + [(f"env{index}", name) for index, (name, _) in enumerate(environments)]
+        self.table = CTkPackageTable(
+            self, [], columns=self._columns, sort_keys={}, placeholder_text="Filter scripts by path", noun="scripts"
+        )
+        self.table.grid(row=2, column=0, sticky="nsew", padx=10, pady=10)
+
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        self.focus_force()
+
+    def choose_folder(self):
+        directory = filedialog.askdirectory(title="Select Folder of Scripts", parent=self)
+        if directory:
+            self.directory = directory
+            self.folder_label.configure(text=directory)
+            self.start_button.configure(state="normal")
+
+    def start(self):
+        """Run every script of the folder in every environment"""
+        try:
+            timeout = self.timeout_entry.get().strip()
+            timeout = float(timeout) if timeout else None
+        except ValueError:
+            messagebox.showerror("Error", "Timeout must be a number of seconds.", parent=self)
+            return
+        scripts = find_scripts(self.directory, self.pattern_entry.get().strip() or "*.py")
+        if not scripts:
+            messagebox.showerror("Error", "No matching scripts in the selected folder.", parent=self)
+            return
+
+        # One row per script; cells are filled in place as results stream in
+        self._rows = {}
+        self._records = {}
+        for script in scripts:
+            row = {"name": os.path.relpath(script, self.directory)}
+            row.update({key: PENDING for key, _ in self._columns[1:]})
+            self._rows[script] = row
+        self.table.packages = list(self._rows.values())
+        self.table.populate_table()
+
+        journal = BatchJournal(journal_path(self.directory, [path for _, path in self.environments]))
+        # Unchecking the cache forces a rerun; the fresh results still refresh it
+        self.runner = BatchRunner(
+            self.environments, scripts, concurrency=self.concurrency, timeout=timeout, journal=journal,
+            cache=result_cache, force=not self.cache_var.get(), history=run_history
+        )
+        self._counts = {status: 0 for status in STATUS_MARKS}
+        self._finished = 0
+        self.start_button.configure(state="disabled")
+        self.cancel_button.configure(state="normal")
+        self._update_progress()
+
+        resume = self.resume_var.get()
+        # Reading the journal and queueing hundreds of cells stays off the Tk thread
+        threading.Thread(
+            target=self.runner.run, kwargs={"on_result": self._on_result, "resume": resume}, daemon=True
+        ).start()
+
+    def _on_result(self, record):
+        self.ui_queue.post(self.show_record, record)
+
+    def show_record(self, record):
+        script = record["script"]
+        self._records[(script, record["environment"])] = record
+        self._finished += 1
+        self._counts[record["status"]] = self._counts.get(record["status"], 0) + 1
+
+        baseline_name = self.environments[0][0]
+        row = self._rows[script]
+        for index, (name, _) in enumerate(self.environments):
+            current = self._records.get((script, name))
+            if current:
+                # A new baseline result can change the difference marks of the whole row
+                row[f"env{index}"] = cell_text(current, self._records.get((script, baseline_name)))
+        self.table.refresh()
+        self._update_progress()
+
+        if self._finished == self.runner.total:
+            self.start_button.configure(state="normal")
+            self.cancel_button.configure(state="disabled")
+
+    def _update_progress(self):
+        counts = ", ".join(f"{count} {status}" for status, count in self._counts.items() if count)
+        self.progress_label.configure(
+            text=f"{self._finished} of {self.runner.total} cells finished" + (f" ({counts})" if counts else "")
+            + f" - baseline for output differences (≠): {self.environments[0][0]}"
+        )
+
+    def cancel(self):
+        if self.runner:
+            self.runner.cancel()
+
+    def close(self):
+        self.cancel()
+        if self.runner:
+            self.runner.shutdown()
+        self.destroy()
@@ -4,19 +4,26 @@ from tkinter import filedialog, scrolledtext, messagebox
 import threading
 import platform
 
-from src.ui.package_table import PackageListWindow
-from src.utils.python_env import detect_python_version, get_installed_packages, run_python_script
+from src.ui.ui_queue import ConsoleWriter
+from src.utils.interpreter_cache import interpreter_cache
+
+
+NO_DISCOVERED = "No discovered interpreters"
+SELECT_DISCOVERED = "Select a discovered interpreter"
 
 
 class PythonEnvironmentFrame(ctk.CTkFrame):
     """Frame for configuring and running a Python environment"""
-    def __init__(self, master, title: str, **kwargs):
+    def __init__(self, master, title: str, app=None, on_remove=None, **kwargs):
         super().__init__(master, **kwargs)
-        # Store master without type enforcing
-        self._app_master = master
+        # Store the application without type enforcing; it may differ from the grid master
+        self._app_master = app or master
         self.title = title
         self.python_path = None
         self.version_info = None
+        self.last_result = None
+        # Bumped by every probe, so a slow probe of a replaced path is ignored
+        self._probe_generation = 0
         
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
@@ -25,6 +32,12 @@ class PythonEnvironmentFrame(ctk.CTkFrame):
         title_label = ctk.CTkLabel(self, text=title, font=ctk.CTkFont(size=10, weight="bold"))
         title_label.grid(row=0, column=0, sticky="w", padx=10, pady=(10, 5))
         
+        if on_remove:
+            remove_button = ctk.CTkButton(
+                self, text="Remove", width=70, command=lambda: on_remove(self)
+            )
+            remove_button.grid(row=0, column=0, sticky="e", padx=10, pady=(10, 5))
+        
         # Frame for Python selection
         selection_frame = ctk.CTkFrame(self)
         selection_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=5)
@@ -52,6 +65,16 @@ class PythonEnvironmentFrame(ctk.CTkFrame):
         )
         self.browse_button.grid(row=1, column=1, sticky="e", padx=5, pady=5)
         
+        # Interpreters found by discovery
+        self._discovered_paths = {}
+        self.discovered_menu = ctk.CTkOptionMenu(
+            selection_frame,
+            values=[NO_DISCOVERED],
+            command=self.select_discovered,
+            state="disabled"
+        )
+        self.discovered_menu.grid(row=2, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
+        
         # Get Python version button and label
         version_frame = ctk.CTkFrame(self)
         version_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=5)
@@ -72,6 +95,11 @@ class PythonEnvironmentFrame(ctk.CTkFrame):
         )
         self.get_packages_button.grid(row=0, column=2, sticky="e", padx=5, pady=5)
         
+        # Shown while the interpreter is being probed
+        self.probe_progress = ctk.CTkProgressBar(version_frame, mode="indeterminate", width=120)
+        self.probe_progress.grid(row=0, column=1, sticky="w", padx=5, pady=5)
+        self.probe_progress.grid_remove()
+        
         self.version_label = ctk.CTkLabel(self, text="Python version: Not checked")
         self.version_label.grid(row=3, column=0, sticky="w", padx=10, pady=5)
         
@@ -83,6 +111,7 @@ class PythonEnvironmentFrame(ctk.CTkFrame):
         self.console = scrolledtext.ScrolledText(
             self, 
             height=20, 
+            width=40,
             wrap=tk.WORD,
             font=("Courier New", 20),
             bg="#1e1e1e",
@@ -90,18 +119,41 @@ class PythonEnvironmentFrame(ctk.CTkFrame):
             insertbackground="#f0f0f0"
         )
         self.console.grid(row=5, column=0, sticky="nsew", padx=10, pady=5)
+        # Worker threads write through this queue; it flushes on the Tk main loop
+        self.output = ConsoleWriter(self.console)
         self.grid_rowconfigure(5, weight=1)
         
-        # Run button
+        # Run and benchmark buttons
+        run_frame = ctk.CTkFrame(self, fg_color="transparent")
+        run_frame.grid(row=6, column=0, sticky="ew", padx=10, pady=10)
+        run_frame.grid_columnconfigure(0, weight=1)
+        
         self.run_button = ctk.CTkButton(
-            self, 
+            run_frame, 
             text="Run Script", 
             command=self.run_script,
             state="disabled"
         )
-        self.run_button.grid(row=6, column=0, sticky="ew", padx=20, pady=10)
+        self.run_button.grid(row=0, column=0, sticky="ew", padx=10)
+        
+        ctk.CTkLabel(run_frame, text="Runs:").grid(row=0, column=1, padx=(10, 5))
+        self.runs_entry = ctk.CTkEntry(run_frame, width=50)
+        self.runs_entry.insert(0, "5")
+        self.runs_entry.grid(row=0, column=2, padx=5)
+        
+        self.benchmark_button = ctk.CTkButton(
+            run_frame, 
+            text="Benchmark", 
+            command=self.benchmark_script,
+            state="disabled",
+            width=100
+        )
+        self.benchmark_button.grid(row=0, column=3, sticky="e", padx=10)
         
-        # If use_system_var is checked initially, detect system Python
+        self.warm_var = tk.BooleanVar(value=False)
+        ctk.CTkCheckBox(run_frame, text="Warm vs cold", variable=self.warm_var).grid(row=0, column=4, padx=5)
+        
+        # If use_system_var is checked initially, detect system Python (in the background)
         if self.use_system_var.get():
             self.get_python_version()
     
@@ -116,9 +168,43 @@ class PythonEnvironmentFrame(ctk.CTkFrame):
             self.browse_button.configure(state="normal")
             self.python_path = None
             self.version_info = None
+            # Drop the result of a probe still running for the old path
+            self._probe_generation += 1
+            self.probe_progress.stop()
+            self.probe_progress.grid_remove()
+            if hasattr(self._app_master, 'probe_finished'):
+                self._app_master.probe_finished(self)
             self.version_label.configure(text="Python version: Not selected")
             self.get_packages_button.configure(state="disabled")
             self.run_button.configure(state="disabled")
+            self.benchmark_button.configure(state="disabled")
+    
+    def set_discovered(self, interpreters):
+        """Offer discovered interpreters in the selection menu"""
+        self._discovered_paths = {
+            f"{info['implementation']} {info['version']} - {info['path']}": info["path"]
+            for info in interpreters
+        }
+        if self._discovered_paths:
+            self.discovered_menu.configure(values=list(self._discovered_paths), state="normal")
+            self.discovered_menu.set(SELECT_DISCOVERED)
+        else:
+            self.discovered_menu.configure(values=[NO_DISCOVERED], state="disabled")
+            self.discovered_menu.set(NO_DISCOVERED)
+    
+    def select_discovered(self, label):
+        """Use a discovered interpreter"""
+        python_path = self._discovered_paths.get(label)
+        if not python_path:
+            return
+        
+        self.use_system_var.set(False)
+        self.toggle_path_selection()
+        self.python_path = python_path
+        self.path_entry.delete(0, tk.END)
+        self.path_entry.insert(0, python_path)
+        
+        self.get_python_version()
     
     def browse_python_executable(self):
         file_types = [("Python Executable", "python*.exe"), ("All Files", "*.*")] if platform.system() == "Windows" else [("All Files", "*")]
@@ -136,7 +222,7 @@ class PythonEnvironmentFrame(ctk.CTkFrame):
             self.get_python_version()
     
     def get_python_version(self):
-        """Get and display the Python version"""
+        """Probe the Python version in the background and display it when known"""
         if self.use_system_var.get():
             self.python_path = "python"
         elif not self.python_path:
@@ -145,7 +231,29 @@ class PythonEnvironmentFrame(ctk.CTkFrame):
                 return
             self.python_path = self.path_entry.get()
         
-        version, return_code, error = detect_python_version(self.python_path)
+        self._probe_generation += 1
+        generation = self._probe_generation
+        python_path = self.python_path
+        self.version_info = None
+        self.version_label.configure(text="Python version: Checking...")
+        self.get_packages_button.configure(state="disabled")
+        self.set_run_enabled(False)
+        self.probe_progress.grid()
+        self.probe_progress.start()
+        if hasattr(self._app_master, 'probe_started'):
+            self._app_master.probe_started(self)
+        
+        def probe():
+            version, return_code, error = interpreter_cache.get_version(python_path)
+            self.output.post(self._show_version, generation, version, error)
+        
+        threading.Thread(target=probe, daemon=True).start()
+    
+    def _show_version(self, generation, version, error):
+        if generation != self._probe_generation:
+            return
+        self.probe_progress.stop()
+        self.probe_progress.grid_remove()
         
         if version:
             self.version_info = version
@@ -153,13 +261,24 @@ class PythonEnvironmentFrame(ctk.CTkFrame):
 
             self.get_packages_button.configure(state="normal")
             if hasattr(self._app_master, 'script_path') and getattr(self._app_master, 'script_path', None):
-                self.run_button.configure(state="normal")
+                self.set_run_enabled(True)
         else:
             # Display error
             self.version_label.configure(text=f"Error: {error}")
             self.version_info = None
             self.get_packages_button.configure(state="disabled")
-            self.run_button.configure(state="disabled")
+            self.set_run_enabled(False)
+        
+        if hasattr(self._app_master, 'update_run_buttons'):
+            self._app_master.update_run_buttons()
+        if hasattr(self._app_master, 'probe_finished'):
+            self._app_master.probe_finished(self)
+    
+    def set_run_enabled(self, enabled: bool):
+        """Enable or disable the run and benchmark buttons"""
+        state = "normal" if enabled else "disabled"
+        self.run_button.configure(state=state)
+        self.benchmark_button.configure(state=state)
     
     def view_installed_packages(self):
         """Show a window with installed packages"""
@@ -167,15 +286,26 @@ class PythonEnvironmentFrame(ctk.CTkFrame):
             messagebox.showerror("Error", "No Python executable selected.")
             return
         
-        # Get packages
-        packages, return_code, error = get_installed_packages(self.python_path)
+        python_path = self.python_path
+        self.get_packages_button.configure(state="disabled", text="Loading...")
         
-        if packages:
-            window = PackageListWindow(packages, f"{self.title} - Installed Packages")
-        else:
-            # Display error
-            messagebox.showerror("Error", f"Failed to get package list: {error}")
-            print(f"View Packages Error: {error}")
+        def show(packages, error):
+            from src.ui.package_table import PackageListWindow
+            
+            self.get_packages_button.configure(state="normal" if self.version_info else "disabled", text="View Packages")
+            if packages:
+                window = PackageListWindow(packages, f"{self.title} - Installed Packages")
+            else:
+                # Display error
+                messagebox.showerror("Error", f"Failed to get package list: {error}")
+                print(f"View Packages Error: {error}")
+        
+        def fetch():
+            # Listing packages runs pip, which takes seconds on a cold cache
+            packages, return_code, error = interpreter_cache.get_packages(python_path)
+            self.output.post(show, packages, error)
+        
+        threading.Thread(target=fetch, daemon=True).start()
     
     def run_script(self):
         """Run the selected Python script"""
@@ -187,26 +317,115 @@ class PythonEnvironmentFrame(ctk.CTkFrame):
             messagebox.showerror("Error", "No Python script selected. Please select a script first.")
             return
         
-        # Store script path locally to avoid attribute access issues
+        # Runs go through the application's scheduler so they share its worker pool
+        self._app_master.run_environments([self])
+    
+    def begin_run(self, script_path):
+        """Prepare the console for a scheduled run"""
+        self.output.clear()
+        self.output.write(f"Queued {script_path} with {self.version_info}...\n\n")
+    
+    def show_started(self):
+        """Report that a scheduled run has started; safe to call from any thread"""
+        self.output.write("Running...\n\n")
+    
+    def append_output(self, stream, text):
+        """Append a chunk of streamed output to the console; safe to call from any thread"""
+        self.output.write(text)
+    
+    def show_result(self, result):
+        """Display the result of a scheduled run; safe to call from any thread"""
+        # Output spilled to disk is kept only while it is the frame's latest result
+        self._discard_last_output()
+        self.last_result = result
+        if result["status"] == "error":
+            self.output.write(f"Failed to run script: {result['stderr']}\n")
+            return
+        
+        if result["output"] is not None and result["output"].spilled:
+            self.output.write(f"\n\nOutput exceeded the memory cap; earlier output saved to {result['output'].spill_path}")
+        
+        if result["status"] == "timeout":
+            self.output.write(f"\n\nProcess timed out after {result['wall']:.2f}s\n")
+        elif result["status"] == "cancelled":
+            self.output.write("\n\nProcess cancelled.\n")
+        elif result["returncode"] != 0:
+            self.output.write(f"\n\nProcess exited with code {result['returncode']}\n")
+        else:
+            self.output.write(f"\n\nProcess completed successfully in {result['wall']:.2f}s.\n")
+        
+        resources = result.get("resources")
+        if resources and resources["peak_rss"] is not None:
+            self.output.write(
+                f"CPU time: {resources['user']:.2f}s user, {resources['sys']:.2f}s system; "
+                f"peak memory: {resources['peak_rss'] / (1024 * 1024):.1f} MB\n"
+            )
+    
+    def _discard_last_output(self):
+        if self.last_result and self.last_result["output"] is not None:
+            self.last_result["output"].discard()
+    
+    def destroy(self):
+        self._discard_last_output()
+        super().destroy()
+    
+    def show_history(self, check):
+        """Report how a run compares with earlier runs; safe to call from any thread"""
+        from src.utils.run_history import format_regression
+        
+        self.output.write(format_regression(check) + "\n")
+    
+    def record_benchmark(self, script_path, result):
+        """Store benchmark runs in the run history and report how they compare"""
+        # Imported lazily: sqlite3 is only needed once something is recorded
+        from src.utils.run_history import format_regression, run_history
+        
+        # A warm vs cold result holds one benchmark of each mode
+        benchmarks = [result["cold"], result["warm"]] if "cold" in result else [result]
+        for benchmark in benchmarks:
+            rows = run_history.record(
+                self.python_path, script_path,
+                [dict(timing, status="completed", returncode=0) for timing in benchmark["measurements"]],
+                source="benchmark", mode=benchmark["mode"]
+            )
+            check = run_history.check(rows)
+            if check:
+                self.output.write(f"{benchmark['mode'].capitalize()} runs: {format_regression(check)}\n")
+    
+    def benchmark_script(self):
+        """Benchmark the selected Python script with repeated timed runs"""
+        if not self.python_path:
+            messagebox.showerror("Error", "No Python executable selected.")
+            return
+            
+        if not hasattr(self._app_master, 'script_path') or not getattr(self._app_master, 'script_path', None):
+            messagebox.showerror("Error", "No Python script selected. Please select a script first.")
+            return
+        
+        try:
+            runs = int(self.runs_entry.get())
+        except ValueError:
+            messagebox.showerror("Error", "Number of runs must be an integer.")
+            return
+        
+        from src.utils.benchmark import benchmark_python_script, benchmark_warm_cold, format_benchmark, format_warm_cold
+        
         script_path = getattr(self._app_master, 'script_path')
+        warm = self.warm_var.get()
         
-        self.console.delete(1.0, tk.END)
-        self.console.insert(tk.END, f"Running {script_path} with {self.version_info}...\n\n")
+        self.output.clear()
+        self.output.write(f"Benchmarking {script_path} with {self.version_info} ({runs} runs, 1 warmup)...\n\n")
         
         def run():
-            stdout, stderr, return_code = run_python_script(self.python_path, script_path)
-            
-            self.console.insert(tk.END, "STDOUT:\n")
-            self.console.insert(tk.END, stdout or "No output\n")
-            
-            if stderr:
-                self.console.insert(tk.END, "\nSTDERR:\n")
-                self.console.insert(tk.END, stderr)
+            if warm:
+                result, return_code, error = benchmark_warm_cold(self.python_path, script_path, runs=runs)
+            else:
+                result, return_code, error = benchmark_python_script(self.python_path, script_path, runs=runs)
             
-            if return_code != 0:
-                self.console.insert(tk.END, f"\n\nProcess exited with code {return_code}\n")
+            if result:
+                self.output.write((format_warm_cold(result) if warm else format_benchmark(result)) + "\n")
+                self.record_benchmark(script_path, result)
             else:
-                self.console.insert(tk.END, "\n\nProcess completed successfully.\n")
+                self.output.write(f"Benchmark failed: {error}\n")
         
-        # Run in a separate thread to avoid freezing the UI
         threading.Thread(target=run, daemon=True).start()
@@ -0,0 +1,51 @@
+import time
+from typing import List, Tuple
+
+from src.ui.package_table import number_key
+from src.ui.results_window import MISSING, ResultsTableWindow
+from src.utils.run_history import format_regression, run_history
+
+
+def _status_text(run):
+    if run["status"] == "completed":
+        return "passed" if run["returncode"] == 0 else f"exit {run['returncode']}"
+    return run["status"]
+
+
+class HistoryWindow(ResultsTableWindow):
+    """Window listing the recorded runs of a script, newest first, with a regression check per environment"""
+    def __init__(self, script_path: str, environments: List[Tuple[str, str]], title: str = "Run History"):
+        names = {python_path: name for name, python_path in environments}
+        runs = run_history.runs(script_path=script_path)
+        lines = []
+        for name, python_path in environments:
+            latest = [run for run in runs if run["python_path"] == python_path][:1]
+            check = run_history.check(latest) if latest else None
+            lines.append(f"{name}: " + (format_regression(check) if latest else "no recorded runs"))
+
+        rows = []
+        for run in runs:
+            rows.append({
+                "started": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(run["started"])),
+                "environment": names.get(run["python_path"], run["python_path"]),
+                "version": run["python_version"] or MISSING,
+                "source": f"{run['source']} ({run['mode']})",
+                "status": _status_text(run),
+                "wall": f"{run['wall'] * 1000:.1f} ms" if run["wall"] is not None else MISSING,
+                "peak_rss": f"{run['peak_rss'] / (1024 * 1024):.1f} MB" if run["peak_rss"] is not None else MISSING,
+                "stdout": run["stdout_sha256"][:12] if run["stdout_sha256"] else MISSING,
+                # Runs of an edited script are not compared with the earlier ones
+                "script": run["script_hash"][:12],
+            })
+
+        columns = (
+            ("started", "Started"), ("environment", "Environment"), ("version", "Python"), ("source", "Source"),
+            ("status", "Status"), ("wall", "Wall"), ("peak_rss", "Peak RSS"), ("stdout", "Output"),
+            ("script", "Script Version"),
+        )
+        super().__init__(
+            f"{title} - {script_path}", "1100x700", columns, rows, summary="\n".join(lines),
+            sort_keys={"wall": number_key, "peak_rss": number_key}, sort_column="started", sort_reverse=True,
+            filter_keys=("environment", "status"),
+            placeholder_text="Filter by environment or status", noun="runs"
+        )
@@ -0,0 +1,34 @@
+from typing import List, Tuple
+
+from src.ui.package_table import number_key
+from src.ui.results_window import MISSING, ResultsTableWindow
+from src.utils.importtime import compare_imports
+
+
+class ImportTimeWindow(ResultsTableWindow):
+    """Window comparing per-module import times across environments"""
+    def __init__(self, profiles: List[Tuple[str, dict]], title: str = "Import Time Comparison"):
+        names = [name for name, _ in profiles]
+        totals = ", ".join(f"{name}: {profile['total'] / 1000:.1f} ms" for name, profile in profiles)
+
+        rows = []
+        for row in compare_imports(profiles):
+            table_row = {"name": row["module"], "regression": f"{row['regression'] / 1000:+.2f} ms"}
+            for index, name in enumerate(names):
+                timing = row["times"][name]
+                table_row[f"env{index}"] = (
+                    f"{timing['cumulative'] / 1000:.2f} ms (self {timing['self'] / 1000:.2f})" if timing else MISSING
+                )
+            rows.append(table_row)
+
+        columns = (
+            [("name", "Module")]
+            + [(f"env{index}", name) for index, name in enumerate(names)]
+            + [("regression", "Regression")]
+        )
+        super().__init__(
+            title, f"{max(700, 220 * (len(profiles) + 2))}x700", columns, rows,
+            summary=f"Total import time - {totals}\nBaseline: {names[0]}; rows are sorted by the largest regression.",
+            sort_keys={key: number_key for key, _ in columns[1:]}, sort_column="regression", sort_reverse=True,
+            placeholder_text="Filter modules by name", noun="modules"
+        )
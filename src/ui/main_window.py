@@ -1,23 +1,47 @@
 ﻿import customtkinter as ctk
 import tkinter as tk
+import os
+import threading
 from tkinter import filedialog, messagebox, scrolledtext
 
 from src.ui.environment_frame import PythonEnvironmentFrame
+from src.ui.ui_queue import UiQueue
+from src.utils.interpreter_cache import interpreter_cache
+from src.utils.resources import DEFAULT_SAMPLE_INTERVAL
+
+# Analysis windows and the modules behind them (asyncio, sqlite3, concurrent.futures
+# and others) are imported by the handlers that need them, so none of them delay
+# the first paint of the window.
+
+
+ENVIRONMENT_COLUMNS = 2
+CONCURRENCY_PARALLEL = "Parallel"
+CONCURRENCY_SERIAL_PINNED = "Serial (pinned)"
+CONCURRENCY_ASYNCIO = "Parallel (asyncio)"
+# Tool buttons wrap into rows so they fit the default window width
+TOOLS_PER_ROW = 7
+
 
 class PyVersionerApp(ctk.CTk):
-    def __init__(self, version="1.0.0"):
+    def __init__(self, version="1.0.0", startup_timer=None):
         super().__init__()
         
         # Store application version
         self.version = version
+        # Startup phases are timed until every environment's first interpreter probe answers
+        self.startup_timer = startup_timer
+        self._pending_probes = set()
         
         # Setup the window
         self.title("Python Version Comparison Tool")
         self.geometry("1200x800")
         self.minsize(800, 600)
         
-        # Initialize script path
+        # Initialize script path and the schedulers with runs in flight
         self.script_path = None
+        self.schedulers = []
+        self.discovered_interpreters = []
+        self.ui_queue = UiQueue(self)
         
         # Setup UI components
         self._create_menu()
@@ -33,7 +57,7 @@ class PyVersionerApp(ctk.CTk):
         self.menu.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Open Script", command=self.browse_script)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.quit)
+        file_menu.add_command(label="Exit", command=self.destroy)
         
         # Help menu
         help_menu = tk.Menu(self.menu, tearoff=0)
@@ -51,15 +75,19 @@ class PyVersionerApp(ctk.CTk):
         # Title frame with script selection
         self._create_title_frame()
         
-        # Environment frames
-        self.env1 = PythonEnvironmentFrame(self, "Environment 1")
-        self.env1.grid(row=2, column=0, sticky="nsew", padx=10, pady=10)
+        # Environment frames, laid out ENVIRONMENT_COLUMNS per row
+        self.environments = []
+        self._environment_count = 0
+        self.env_container = ctk.CTkScrollableFrame(self, fg_color="transparent")
+        self.env_container.grid(row=2, column=0, columnspan=2, sticky="nsew", padx=0, pady=0)
+        for column in range(ENVIRONMENT_COLUMNS):
+            self.env_container.grid_columnconfigure(column, weight=1)
         
-        self.env2 = PythonEnvironmentFrame(self, "Environment 2")
-        self.env2.grid(row=2, column=1, sticky="nsew", padx=10, pady=10)
-        
-        # Run together button
+        # Run together button, created first so new environments can update it
         self._create_run_frame()
+        
+        self.add_environment()
+        self.add_environment()
     
     def _create_title_frame(self):
         """Create the title frame with script selection."""
@@ -77,23 +105,156 @@ class PyVersionerApp(ctk.CTk):
             title_frame, text="Browse", command=self.browse_script
         )
         browse_button.grid(row=0, column=2, sticky="e", padx=5, pady=10)
+        
+        self.discover_button = ctk.CTkButton(
+            title_frame, text="Discover Interpreters", command=self.discover_interpreters
+        )
+        self.discover_button.grid(row=0, column=3, sticky="e", padx=5, pady=10)
 
     
     def _create_run_frame(self):
-        """Create the frame with the run button."""
+        """Create the frame with the run button and scheduling options."""
         run_frame = ctk.CTkFrame(self)
         run_frame.grid(row=3, column=0, columnspan=2, sticky="ew", padx=10, pady=10)
         run_frame.grid_columnconfigure(0, weight=1)
         
         self.run_together_button = ctk.CTkButton(
             run_frame,
-            text="Run in Both Environments",
-            command=self.run_both,
+            text="Run in All Environments",
+            command=self.run_all,
             height=40,
             font=ctk.CTkFont(size=14, weight="bold"),
             state="disabled",
         )
         self.run_together_button.grid(row=0, column=0, sticky="ew", padx=20, pady=10)
+        
+        self.cancel_button = ctk.CTkButton(
+            run_frame, text="Cancel", command=self.cancel_runs, state="disabled", width=80
+        )
+        self.cancel_button.grid(row=0, column=1, padx=5, pady=10)
+        
+        ctk.CTkLabel(run_frame, text="Concurrency:").grid(row=0, column=2, padx=(10, 5), pady=10)
+        self.concurrency_var = tk.StringVar(value=CONCURRENCY_PARALLEL)
+        ctk.CTkOptionMenu(
+            run_frame,
+            variable=self.concurrency_var,
+            values=[CONCURRENCY_PARALLEL, CONCURRENCY_ASYNCIO, CONCURRENCY_SERIAL_PINNED, "1", "2", "4", "8"],
+            width=140,
+        ).grid(row=0, column=3, padx=5, pady=10)
+        
+        ctk.CTkLabel(run_frame, text="Timeout (s):").grid(row=0, column=4, padx=(10, 5), pady=10)
+        self.timeout_entry = ctk.CTkEntry(run_frame, width=60, placeholder_text="none")
+        self.timeout_entry.grid(row=0, column=5, padx=5, pady=10)
+        
+        ctk.CTkButton(
+            run_frame, text="Add Environment", command=self.add_environment, width=120
+        ).grid(row=0, column=6, padx=(10, 20), pady=10)
+        
+        # Analysis tools comparing environments
+        tools_frame = ctk.CTkFrame(run_frame, fg_color="transparent")
+        tools_frame.grid(row=1, column=0, columnspan=7, sticky="ew", padx=15, pady=(0, 10))
+        
+        self.compare_packages_button = ctk.CTkButton(
+            tools_frame, text="Compare Packages", command=self.compare_packages, width=130
+        )
+        self.import_times_button = ctk.CTkButton(
+            tools_frame, text="Import Times", command=self.compare_import_times, width=130
+        )
+        self.profile_button = ctk.CTkButton(
+            tools_frame, text="Profile Functions", command=self.compare_profiles, width=130
+        )
+        self.microbench_button = ctk.CTkButton(
+            tools_frame, text="Microbenchmarks", command=self.compare_microbenchmarks, width=130
+        )
+        self.startup_button = ctk.CTkButton(
+            tools_frame, text="Startup Time", command=self.compare_startup, width=130
+        )
+        self.memory_button = ctk.CTkButton(
+            tools_frame, text="Memory Allocations", command=self.compare_memory, width=130
+        )
+        tools = [
+            self.compare_packages_button,
+            ctk.CTkButton(tools_frame, text="Compare Output", command=self.compare_output, width=130),
+            self.import_times_button,
+            self.profile_button,
+            ctk.CTkButton(tools_frame, text="Resource Usage", command=self.show_resources, width=130),
+            ctk.CTkButton(tools_frame, text="Batch Run", command=self.run_batch, width=130),
+            ctk.CTkButton(tools_frame, text="Run History", command=self.show_history, width=130),
+            self.microbench_button,
+            self.startup_button,
+            self.memory_button,
+        ]
+        for index, button in enumerate(tools):
+            button.grid(row=index // TOOLS_PER_ROW, column=index % TOOLS_PER_ROW, padx=5, pady=2)
+    
+    def add_environment(self):
+        """Add a new environment frame."""
+        frame = PythonEnvironmentFrame(
+            self.env_container,
+            f"Environment {self._environment_count + 1}",
+            app=self,
+            on_remove=self.remove_environment,
+        )
+        if self.discovered_interpreters:
+            frame.set_discovered(self.discovered_interpreters)
+        self._environment_count += 1
+        self.environments.append(frame)
+        self._layout_environments()
+        self.update_run_buttons()
+        return frame
+    
+    def remove_environment(self, frame):
+        """Remove an environment frame, keeping at least one."""
+        if len(self.environments) <= 1:
+            return
+        self.environments.remove(frame)
+        frame.destroy()
+        self._layout_environments()
+        self.update_run_buttons()
+        self.probe_finished(frame)
+    
+    def probe_started(self, frame):
+        """Note that an environment is probing its interpreter in the background."""
+        self._pending_probes.add(frame)
+    
+    def probe_finished(self, frame):
+        """Note that a probe answered; the startup report is due once the first ones have."""
+        self._pending_probes.discard(frame)
+        if self._pending_probes or not self.startup_timer or self.startup_timer.reported:
+            return
+        self.startup_timer.mark("interpreters probed")
+        self.startup_timer.report()
+    
+    def _layout_environments(self):
+        """Place environment frames in a grid."""
+        for index, frame in enumerate(self.environments):
+            frame.grid(
+                row=index // ENVIRONMENT_COLUMNS, column=index % ENVIRONMENT_COLUMNS,
+                sticky="nsew", padx=10, pady=10
+            )
+    
+    def discover_interpreters(self):
+        """Find installed interpreters in the background and offer them in every environment."""
+        self.discover_button.configure(state="disabled", text="Discovering...")
+        project_dirs = [os.getcwd()]
+        if self.script_path:
+            project_dirs.append(os.path.dirname(os.path.abspath(self.script_path)))
+        
+        def discover():
+            from src.utils.discovery import discover_interpreters
+            
+            interpreters, failures = discover_interpreters(project_dirs)
+            self.ui_queue.post(show, interpreters)
+        
+        def show(interpreters):
+            self.discovered_interpreters = interpreters
+            for env in self.environments:
+                env.set_discovered(interpreters)
+            self.discover_button.configure(
+                state="normal", text=f"Discover Interpreters ({len(interpreters)} found)"
+            )
+        
+        threading.Thread(target=discover, daemon=True).start()
     
     def browse_script(self):
         """Open file dialog to select a Python script."""
@@ -107,24 +268,359 @@ class PyVersionerApp(ctk.CTk):
             self.script_entry.delete(0, tk.END)
             self.script_entry.insert(0, script_path)
             
-            # Enable run buttons if Python versions are detected
-            if hasattr(self.env1, 'version_info') and self.env1.version_info:
-                self.env1.run_button.configure(state="normal")
-            if hasattr(self.env2, 'version_info') and self.env2.version_info:
-                self.env2.run_button.configure(state="normal")
+            self.update_run_buttons()
+    
+    def update_run_buttons(self):
+        """Enable run buttons for environments with a detected Python version."""
+        ready = [env for env in self.environments if env.version_info]
+        for env in ready:
+            env.set_run_enabled(bool(self.script_path))
+        
+        state = "normal" if self.script_path and ready else "disabled"
+        self.run_together_button.configure(state=state)
+    
+    def _create_scheduler(self):
+        """Create a run scheduler from the selected concurrency and timeout."""
+        concurrency = self.concurrency_var.get()
+        timeout = self.timeout_entry.get().strip()
+        timeout = float(timeout) if timeout else None
+        if concurrency == CONCURRENCY_ASYNCIO:
+            from src.utils.async_env import AsyncRunScheduler
             
-            if (hasattr(self.env1, 'version_info') and self.env1.version_info and
-                hasattr(self.env2, 'version_info') and self.env2.version_info):
-                self.run_together_button.configure(state="normal")
+            # All environments at once, driven from one event loop thread
+            return AsyncRunScheduler(timeout=timeout)
+        from src.utils.scheduler import RunScheduler, SERIAL_PINNED
+        
+        if concurrency == CONCURRENCY_PARALLEL:
+            concurrency = None
+        elif concurrency == CONCURRENCY_SERIAL_PINNED:
+            concurrency = SERIAL_PINNED
+        else:
+            concurrency = int(concurrency)
+        return RunScheduler(concurrency=concurrency, timeout=timeout, sample_interval=DEFAULT_SAMPLE_INTERVAL)
     
-    def run_both(self):
-        """Run the script in both environments."""
+    def run_environments(self, environments):
+        """Run the script in the given environments."""
         if not self.script_path:
             messagebox.showerror("Error", "Please select a Python script first.")
             return
         
-        self.env1.run_script()
-        self.env2.run_script()
+        environments = [env for env in environments if env.version_info and env.python_path]
+        if not environments:
+            messagebox.showerror("Error", "No environment has a valid Python executable.")
+            return
+        
+        try:
+            scheduler = self._create_scheduler()
+        except ValueError:
+            messagebox.showerror("Error", "Timeout must be a number of seconds.")
+            return
+        # Earlier runs may still be going; their scheduler stays reachable by Cancel until they finish
+        self.schedulers.append(scheduler)
+        
+        frames = {env.title: env for env in environments}
+        pending = set(frames)
+        
+        for env in environments:
+            env.begin_run(self.script_path)
+        self.cancel_button.configure(state="normal")
+        
+        script_path = self.script_path
+        
+        def on_result(name, result):
+            frames[name].show_result(result)
+            self.ui_queue.post(finish, name)
+            if result["status"] != "cancelled":
+                # Hashing and the database stay off the scheduler's threads and event loop
+                threading.Thread(target=record, args=(name, result), daemon=True).start()
+        
+        def record(name, result):
+            from src.utils.run_history import run_history
+            
+            rows = run_history.record_result(result["python_path"], script_path, result)
+            check = run_history.check(rows)
+            if check:
+                frames[name].show_history(check)
+        
+        def finish(name):
+            pending.discard(name)
+            if pending:
+                return
+            scheduler.shutdown()
+            self.schedulers.remove(scheduler)
+            if not self.schedulers:
+                self.cancel_button.configure(state="disabled")
+        
+        scheduler.run(
+            [(env.title, env.python_path) for env in environments],
+            script_path,
+            on_start=lambda name: frames[name].show_started(),
+            on_output=lambda name, stream, text, timestamp: frames[name].append_output(stream, text),
+            on_result=on_result,
+        )
+    
+    def run_all(self):
+        """Run the script in all environments."""
+        self.run_environments(self.environments)
+    
+    def cancel_runs(self):
+        """Cancel all scheduled and running script runs."""
+        for scheduler in self.schedulers:
+            scheduler.cancel()
+    
+    def compare_packages(self):
+        """Open a window comparing installed packages across environments."""
+        from src.ui.package_diff_window import PackageDiffWindow
+        
+        environments = [env for env in self.environments if env.version_info and env.python_path]
+        if len(environments) < 2:
+            messagebox.showerror("Error", "At least two environments with a valid Python executable are needed.")
+            return
+        
+        self.compare_packages_button.configure(state="disabled")
+        targets = [(env.title, env.python_path) for env in environments]
+        
+        def collect():
+            package_lists, errors = [], []
+            for title, python_path in targets:
+                packages, return_code, error = interpreter_cache.get_packages(python_path)
+                if packages is None:
+                    errors.append(f"{title}: {error}")
+                else:
+                    package_lists.append((title, packages))
+            self.ui_queue.post(show, package_lists, errors)
+        
+        def show(package_lists, errors):
+            self.compare_packages_button.configure(state="normal")
+            if errors:
+                messagebox.showerror("Error", "Failed to get package lists:\n" + "\n".join(errors))
+                return
+            PackageDiffWindow(package_lists)
+        
+        threading.Thread(target=collect, daemon=True).start()
+    
+    def compare_output(self):
+        """Open a window comparing the output of two environment runs."""
+        from src.ui.output_diff_window import OutputDiffWindow
+        
+        results = {
+            env.title: env.last_result for env in self.environments
+            if env.last_result and env.last_result["status"] != "error"
+        }
+        if len(results) < 2:
+            messagebox.showerror("Error", "Run the script in at least two environments first.")
+            return
+        OutputDiffWindow(results)
+    
+    def show_resources(self):
+        """Open a window with the CPU and memory curves of the last runs."""
+        from src.ui.resource_window import ResourceWindow
+        
+        results = {
+            env.title: env.last_result for env in self.environments
+            if env.last_result and env.last_result.get("resources")
+        }
+        if not results:
+            messagebox.showerror("Error", "Run the script in at least one environment first.")
+            return
+        ResourceWindow(results)
+    
+    def run_batch(self):
+        """Open a window running a folder of scripts against every environment."""
+        from src.ui.batch_window import BatchWindow
+        
+        environments = [env for env in self.environments if env.version_info and env.python_path]
+        if not environments:
+            messagebox.showerror("Error", "No environment has a valid Python executable.")
+            return
+        try:
+            scheduler = self._create_scheduler()
+        except ValueError:
+            messagebox.showerror("Error", "Timeout must be a number of seconds.")
+            return
+        BatchWindow(
+            [(env.title, env.python_path) for env in environments],
+            concurrency=scheduler.concurrency, timeout=scheduler.timeout
+        )
+    
+    def show_history(self):
+        """Open a window with the recorded runs of the selected script."""
+        from src.ui.history_window import HistoryWindow
+        
+        environments = self._ready_environments()
+        if not environments:
+            return
+        HistoryWindow(self.script_path, [(env.title, env.python_path) for env in environments])
+    
+    def _ready_environments(self, minimum=1):
+        """Environments with a detected interpreter, or None after reporting the problem."""
+        if not self.script_path:
+            messagebox.showerror("Error", "Please select a Python script first.")
+            return None
+        environments = [env for env in self.environments if env.version_info and env.python_path]
+        if len(environments) < minimum:
+            messagebox.showerror(
+                "Error", f"At least {minimum} environment(s) with a valid Python executable are needed."
+            )
+            return None
+        return environments
+    
+    def compare_import_times(self):
+        """Profile imports with -X importtime in every environment and compare them."""
+        from src.ui.import_time_window import ImportTimeWindow
+        from src.utils.importtime import profile_imports_all
+        
+        environments = self._ready_environments()
+        if not environments:
+            return
+        
+        self.import_times_button.configure(state="disabled", text="Profiling...")
+        targets = [(env.title, env.python_path) for env in environments]
+        script_path = self.script_path
+        
+        def profile():
+            results = profile_imports_all(targets, script_path)
+            self.ui_queue.post(show, results)
+        
+        def show(results):
+            self.import_times_button.configure(state="normal", text="Import Times")
+            errors = [f"{name}: {error}" for name, (profile, _, error) in results.items() if not profile]
+            if errors:
+                messagebox.showerror("Error", "Failed to profile imports:\n" + "\n".join(errors))
+                return
+            ImportTimeWindow([(name, profile) for name, (profile, _, _) in results.items()])
+        
+        threading.Thread(target=profile, daemon=True).start()
+    
+    def compare_profiles(self):
+        """Profile the script with cProfile in every environment and compare functions."""
+        from src.ui.profile_window import ProfileWindow
+        from src.utils.profiling import profile_all
+        
+        environments = self._ready_environments()
+        if not environments:
+            return
+        
+        self.profile_button.configure(state="disabled", text="Profiling...")
+        targets = [(env.title, env.python_path) for env in environments]
+        script_path = self.script_path
+        
+        def profile():
+            results = profile_all(targets, script_path)
+            self.ui_queue.post(show, results)
+        
+        def show(results):
+            self.profile_button.configure(state="normal", text="Profile Functions")
+            errors = [f"{name}: {error}" for name, (profile, _, error) in results.items() if not profile]
+            if errors:
+                messagebox.showerror("Error", "Failed to profile script:\n" + "\n".join(errors))
+                return
+            ProfileWindow([(name, profile) for name, (profile, _, _) in results.items()])
+        
+        threading.Thread(target=profile, daemon=True).start()
+    
+    def compare_memory(self):
+        """Trace allocations with tracemalloc in every environment and compare allocation sites."""
+        from src.ui.memory_window import MemoryWindow
+        from src.utils.memory_profile import memory_profile_all
+        
+        environments = self._ready_environments()
+        if not environments:
+            return
+        
+        self.memory_button.configure(state="disabled", text="Tracing...")
+        targets = [(env.title, env.python_path) for env in environments]
+        script_path = self.script_path
+        
+        def trace():
+            results = memory_profile_all(targets, script_path)
+            self.ui_queue.post(show, results)
+        
+        def show(results):
+            self.memory_button.configure(state="normal", text="Memory Allocations")
+            errors = [f"{name}: {error}" for name, (profile, _, error) in results.items() if not profile]
+            profiles = [(name, profile) for name, (profile, _, _) in results.items() if profile]
+            # tracemalloc needs 3.4+; older environments are left out rather than failing the comparison
+            if not profiles:
+                messagebox.showerror("Error", "Failed to trace allocations:\n" + "\n".join(errors))
+                return
+            MemoryWindow(profiles, errors)
+        
+        threading.Thread(target=trace, daemon=True).start()
+    
+    def compare_microbenchmarks(self):
+        """Time the functions and snippets marked in the script in every environment and compare them."""
+        from src.ui.microbench_window import MicrobenchWindow
+        from src.utils.microbench import find_benchmarks, microbenchmark_all
+        from src.utils.python_env import default_cpu
+        
+        environments = self._ready_environments()
+        if not environments:
+            return
+        try:
+            benchmarks = find_benchmarks(self.script_path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", str(e))
+            return
+        if not benchmarks:
+            messagebox.showerror(
+                "Error",
+                "No benchmarks are marked in the script. Put a '# benchmark' comment line above a function "
+                "taking no arguments, or around a snippet ending with '# end benchmark'."
+            )
+            return
+        
+        self.microbench_button.configure(state="disabled", text="Benchmarking...")
+        targets = [(env.title, env.python_path) for env in environments]
+        script_path = self.script_path
+        
+        def measure():
+            results = microbenchmark_all(targets, script_path, benchmarks, cpu=default_cpu())
+            self.ui_queue.post(show, results)
+        
+        def show(results):
+            self.microbench_button.configure(state="normal", text="Microbenchmarks")
+            errors = [f"{name}: {error}" for name, (result, _, error) in results.items() if not result]
+            if errors:
+                messagebox.showerror("Error", "Failed to run microbenchmarks:\n" + "\n".join(errors))
+                return
+            MicrobenchWindow([(name, result) for name, (result, _, _) in results.items()])
+        
+        threading.Thread(target=measure, daemon=True).start()
+    
+    def compare_startup(self):
+        """Time interpreter startup with common flags in every environment and rank them."""
+        from src.ui.startup_window import StartupWindow
+        from src.utils.python_env import default_cpu
+        from src.utils.startup import measure_startup_all
+        
+        environments = [env for env in self.environments if env.version_info and env.python_path]
+        if not environments:
+            messagebox.showerror("Error", "No environment has a valid Python executable.")
+            return
+        modules = ctk.CTkInputDialog(
+            title="Startup Time", text="Modules to time importing (comma separated, optional):"
+        ).get_input()
+        if modules is None:
+            return
+        modules = [module.strip() for module in modules.split(",") if module.strip()]
+        
+        self.startup_button.configure(state="disabled", text="Timing...")
+        targets = [(env.title, env.python_path) for env in environments]
+        
+        def measure():
+            results = measure_startup_all(targets, modules, cpu=default_cpu())
+            self.ui_queue.post(show, results)
+        
+        def show(results):
+            self.startup_button.configure(state="normal", text="Startup Time")
+            errors = [f"{name}: {error}" for name, (result, _, error) in results.items() if not result]
+            if errors:
+                messagebox.showerror("Error", "Failed to time interpreter startup:\n" + "\n".join(errors))
+                return
+            StartupWindow([(name, result) for name, (result, _, _) in results.items()])
+        
+        threading.Thread(target=measure, daemon=True).start()
     
     def show_about(self):
         """Show the about dialog."""
@@ -143,13 +639,28 @@ Python Version Comparison Tool
 USAGE:
 1. Select Python script with Browse button
 2. Configure environments
-3. Run script in both environments
+3. Add environments and run script in all of them
 4. Compare output
 
 FEATURES:
-- Compare Python versions side-by-side
+- Compare any number of Python versions side-by-side
+- Discover installed interpreters (PATH, pyenv, asdf, conda, virtualenvs)
+- Run in parallel or serially pinned to one core, with timeouts
 - Test compatibility across versions
 - View packages in each environment
+- Compare installed packages across environments
+- Diff script output between runs, ignoring timestamps, addresses, paths or versions
+- Compare per-module import times (-X importtime)
+- Compare per-function cProfile statistics
+- Sample CPU, memory, threads and file descriptors of each run
+- Benchmark warm (persistent worker) against cold interpreter runs
+- Batch-run a folder of scripts against all environments, resumable after a crash
+- Skip unchanged runs with a content-addressed result cache
+- Drive many interpreters from one asyncio event loop
+- Keep a history of every run and flag timing regressions against it
+- Microbenchmark functions or snippets marked with "# benchmark" comments
+- Rank interpreter startup time with -S, -I, -X frozen_modules and module imports
+- Compare tracemalloc allocation sites, at exit or at "# snapshot" comments
 """
         
         # Create a window for documentation
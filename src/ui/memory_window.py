@@ -0,0 +1,75 @@
+import customtkinter as ctk
+import tkinter as tk
+from typing import List, Tuple
+
+from src.ui.package_table import number_key
+from src.ui.results_window import MISSING, ResultsTableWindow
+from src.utils.memory_profile import EXIT_SNAPSHOT, compare_snapshots, find_snapshot, snapshot_labels
+
+
+GROUPS = {"Allocation sites": "sites", "Files": "files"}
+
+
+def _format_size(size):
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    return f"{size / 1024:.1f} KB"
+
+
+class MemoryWindow(ResultsTableWindow):
+    """Window comparing tracemalloc allocation statistics of one snapshot across environments"""
+    def __init__(self, profiles: List[Tuple[str, dict]], errors: List[str] = (), title: str = "Memory Allocations"):
+        self.profiles = profiles
+        self.errors = list(errors)
+        self.names = [name for name, _ in profiles]
+        columns = (
+            [("name", "Site")]
+            + [(f"env{index}", name) for index, name in enumerate(self.names)]
+            + [("growth", "Max Growth")]
+        )
+        super().__init__(
+            title, f"{max(800, 220 * (len(profiles) + 2))}x700", columns, first_row=1,
+            sort_keys={"growth": number_key}, sort_column="growth", sort_reverse=True,
+            placeholder_text="Filter by site or file", noun="rows"
+        )
+
+        options_frame = ctk.CTkFrame(self, fg_color="transparent")
+        options_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 0))
+        labels = snapshot_labels(profiles)
+        self.label_var = tk.StringVar(value=EXIT_SNAPSHOT if EXIT_SNAPSHOT in labels else labels[-1])
+        ctk.CTkLabel(options_frame, text="Snapshot:").grid(row=0, column=0, padx=5)
+        ctk.CTkOptionMenu(
+            options_frame, values=labels, variable=self.label_var, command=lambda _: self.show_snapshot()
+        ).grid(row=0, column=1, padx=5)
+        self.group_var = tk.StringVar(value=next(iter(GROUPS)))
+        ctk.CTkLabel(options_frame, text="Group by:").grid(row=0, column=2, padx=(15, 5))
+        ctk.CTkOptionMenu(
+            options_frame, values=list(GROUPS), variable=self.group_var, command=lambda _: self.show_snapshot()
+        ).grid(row=0, column=3, padx=5)
+
+        self.show_snapshot()
+
+    def show_snapshot(self):
+        """Fill the table with the selected snapshot and grouping"""
+        label = self.label_var.get()
+        totals = []
+        for name, profile in self.profiles:
+            snapshot = find_snapshot(profile, label)
+            totals.append(
+                f"{name}: {_format_size(snapshot['current'])} traced, peak {_format_size(snapshot['peak'])}"
+            )
+        self.summary_label.configure(
+            text="\n".join(totals + self.errors)
+            + f"\nBaseline: {self.names[0]}. Cells show live size (allocations) at the snapshot."
+        )
+
+        rows = []
+        for row in compare_snapshots(self.profiles, label, GROUPS[self.group_var.get()]):
+            table_row = {"name": row["site"], "growth": f"{row['growth'] / 1024:+.1f} KB"}
+            for index, name in enumerate(self.names):
+                stats = row["stats"][name]
+                table_row[f"env{index}"] = (
+                    f"{_format_size(stats['size'])} ({stats['count']})" if stats else MISSING
+                )
+            rows.append(table_row)
+        self.show_rows(rows)
@@ -0,0 +1,53 @@
+from typing import List, Tuple
+
+from src.ui.package_table import number_key
+from src.ui.results_window import MISSING, ResultsTableWindow
+from src.utils.microbench import compare_microbenchmarks, format_duration
+
+
+def _speedup_text(speedup):
+    if speedup is None:
+        return MISSING
+    text = f"{speedup['speedup']:.2f}x"
+    if speedup["ci"] is not None:
+        text += f" ± {speedup['ci']:.2f}"
+    return text if speedup["significant"] else text + " (not significant)"
+
+
+class MicrobenchWindow(ResultsTableWindow):
+    """Window comparing per-benchmark timings of marked functions and snippets across environments"""
+    def __init__(self, results: List[Tuple[str, dict]], title: str = "Microbenchmark Comparison"):
+        names = [name for name, _ in results]
+        first = results[0][1]
+        errors = [
+            f"{name}: {benchmark} failed: {error.strip().splitlines()[-1]}"
+            for name, result in results for benchmark, error in result["errors"].items()
+        ]
+
+        rows = []
+        for row in compare_microbenchmarks(results):
+            table_row = {"name": row["benchmark"]}
+            for index, name in enumerate(names):
+                stats = row["stats"][name]
+                table_row[f"env{index}"] = (
+                    f"{format_duration(stats['mean'])} ± {format_duration(stats['ci'] or 0)}" if stats else MISSING
+                )
+                if index:
+                    table_row[f"speedup{index}"] = _speedup_text(row["speedups"].get(name))
+            rows.append(table_row)
+
+        columns = (
+            [("name", "Benchmark")]
+            + [(f"env{index}", name) for index, name in enumerate(names)]
+            + [(f"speedup{index}", f"{name} speedup") for index, name in enumerate(names) if index]
+        )
+        super().__init__(
+            title, f"{max(800, 230 * (2 * len(results)))}x600", columns, rows,
+            summary=f"Baseline: {names[0]}. Cells show the mean time per call ± the 95% confidence interval; "
+                    f"speedups above 1 are faster than the baseline.\n"
+                    f"{first['processes']} processes per environment"
+                    + (f", pinned to CPU {first['cpu']}" if first["cpu"] is not None else "")
+                    + ("\n" + "\n".join(errors) if errors else ""),
+            sort_keys={key: number_key for key, _ in columns if key.startswith("speedup")},
+            placeholder_text="Filter benchmarks by name", noun="benchmarks"
+        )
@@ -0,0 +1,108 @@
+import customtkinter as ctk
+import tkinter as tk
+import itertools
+import threading
+from tkinter import scrolledtext
+from typing import Dict
+
+from src.ui.ui_queue import UiQueue
+from src.utils.output_diff import NORMALIZATION_RULES, diff_outputs, iter_diff_lines
+
+
+MAX_DIFF_LINES = 20000
+
+
+def result_text(result, stream):
+    """Full text of one stream of a run result, including output spilled to disk"""
+    if result.get("output") is not None:
+        return result["output"].text(stream)
+    return result.get(stream) or ""
+
+
+class OutputDiffWindow(ctk.CTkToplevel):
+    """Window comparing the output of two environment runs"""
+    def __init__(self, results: Dict[str, dict], title: str = "Output Comparison"):
+        super().__init__()
+        self.title(title)
+        self.geometry("1000x700")
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+        self.results = results
+        self.ui_queue = UiQueue(self)
+
+        names = list(results)
+        options_frame = ctk.CTkFrame(self)
+        options_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 0))
+
+        self.left_var = tk.StringVar(value=names[0])
+        self.right_var = tk.StringVar(value=names[1] if len(names) > 1 else names[0])
+        self.stream_var = tk.StringVar(value="stdout")
+        ctk.CTkOptionMenu(options_frame, variable=self.left_var, values=names).grid(row=0, column=0, padx=5, pady=5)
+        ctk.CTkLabel(options_frame, text="vs").grid(row=0, column=1, padx=5, pady=5)
+        ctk.CTkOptionMenu(options_frame, variable=self.right_var, values=names).grid(row=0, column=2, padx=5, pady=5)
+        ctk.CTkOptionMenu(options_frame, variable=self.stream_var, values=["stdout", "stderr"], width=90).grid(
+            row=0, column=3, padx=5, pady=5
+        )
+
+        # Normalization rules
+        self.rule_vars = {}
+        for column, name in enumerate(NORMALIZATION_RULES, start=4):
+            var = tk.BooleanVar(value=False)
+            ctk.CTkCheckBox(options_frame, text=f"Ignore {name}", variable=var).grid(
+                row=0, column=column, padx=5, pady=5
+            )
+            self.rule_vars[name] = var
+
+        self.compare_button = ctk.CTkButton(options_frame, text="Compare", command=self.compare, width=90)
+        self.compare_button.grid(row=0, column=len(NORMALIZATION_RULES) + 4, padx=5, pady=5)
+
+        self.diff_text = scrolledtext.ScrolledText(
+            self,
+            wrap=tk.NONE,
+            font=("Courier New", 14),
+            bg="#1e1e1e",
+            fg="#f0f0f0",
+        )
+        self.diff_text.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
+        self.diff_text.tag_configure("-", foreground="#f48771")
+        self.diff_text.tag_configure("+", foreground="#89d185")
+        self.diff_text.tag_configure("@", foreground="#75beff")
+
+        self.focus_force()
+        self.compare()
+
+    def compare(self):
+        """Diff the selected runs in the background and show the result"""
+        left, right, stream = self.left_var.get(), self.right_var.get(), self.stream_var.get()
+        rules = [name for name, var in self.rule_vars.items() if var.get()]
+        self.compare_button.configure(state="disabled")
+        self.diff_text.delete("1.0", tk.END)
+        self.diff_text.insert(tk.END, "Comparing...\n")
+
+        def run():
+            diff = diff_outputs(
+                result_text(self.results[left], stream), result_text(self.results[right], stream), rules
+            )
+            lines = []
+            for kind, text in iter_diff_lines(diff):
+                if len(lines) >= MAX_DIFF_LINES:
+                    lines.append(("@", f"... diff truncated after {MAX_DIFF_LINES} lines"))
+                    break
+                lines.append((kind, text))
+            self.ui_queue.post(self.show_diff, left, right, diff, lines)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def show_diff(self, left, right, diff, lines):
+        self.compare_button.configure(state="normal")
+        self.diff_text.delete("1.0", tk.END)
+        if diff["identical"]:
+            self.diff_text.insert(tk.END, f"{left} and {right} produced identical output.\n")
+            return
+        self.diff_text.insert(
+            tk.END, f"--- {left}\n+++ {right}\n{diff['removed']} lines removed, {diff['added']} lines added\n\n", "@"
+        )
+        # One insert per run of same-kind lines keeps large diffs fast
+        for kind, group in itertools.groupby(lines, key=lambda line: line[0]):
+            prefix = "" if kind == "@" else f"{kind} "
+            self.diff_text.insert(tk.END, "".join(f"{prefix}{text}\n" for _, text in group), kind)
@@ -0,0 +1,57 @@
+import customtkinter as ctk
+import tkinter as tk
+from typing import Dict, List, Tuple
+
+from src.ui.results_window import MISSING, ResultsTableWindow
+from src.utils.package_diff import diff_packages, has_differences, version_key
+
+
+class PackageDiffWindow(ResultsTableWindow):
+    """Window comparing installed packages across environments"""
+    def __init__(self, environments: List[Tuple[str, List[Dict[str, str]]]], title: str = "Package Comparison"):
+        self.diff = diff_packages(environments)
+        names = [name for name, _ in environments]
+
+        # Summary of changes against the baseline environment
+        summary_lines = [f"Baseline: {self.diff['baseline']}"]
+        for name, counts in self.diff["summary"].items():
+            summary_lines.append(
+                f"{name}: {counts['added']} added, {counts['removed']} removed, "
+                f"{counts['upgraded']} upgraded, {counts['downgraded']} downgraded, {counts['same']} same"
+            )
+
+        # Table rows: one version column per environment, then the change per environment
+        self._rows = []
+        for row in self.diff["rows"]:
+            table_row = {"name": row["name"], "_row": row}
+            for index, name in enumerate(names):
+                version = row["versions"][name]
+                change = row["changes"].get(name)
+                text = version or MISSING
+                if change and change != "same":
+                    text += f" ({change})"
+                table_row[f"env{index}"] = text
+            self._rows.append(table_row)
+
+        columns = [("name", "Package Name")] + [(f"env{index}", name) for index, name in enumerate(names)]
+        super().__init__(
+            title, f"{max(700, 220 * (len(environments) + 1))}x700", columns, first_row=1,
+            summary="\n".join(summary_lines),
+            # Cells read "1.2 (upgraded)"; sort on the version part
+            sort_keys={key: lambda text: version_key(text.split(" ")[0]) for key, _ in columns[1:]}
+        )
+
+        self.only_differences_var = tk.BooleanVar(value=True)
+        ctk.CTkCheckBox(
+            self, text="Only differences",
+            variable=self.only_differences_var, command=self.update_rows
+        ).grid(row=0, column=0, sticky="w", padx=15, pady=(10, 0))
+        self.update_rows()
+
+    def update_rows(self):
+        """Show all packages or only those that differ between environments"""
+        if self.only_differences_var.get():
+            rows = [row for row in self._rows if has_differences(row["_row"])]
+        else:
+            rows = self._rows
+        self.show_rows(rows)
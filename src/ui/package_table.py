@@ -1,67 +1,207 @@
+import re
+import tkinter as tk
 import customtkinter as ctk
-from typing import List, Dict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.utils.package_diff import version_key
+
+
+ROW_HEIGHT = 26
+COLUMNS = (("name", "Package Name"), ("version", "Version"))
+SORT_KEYS = {"version": version_key}
+
+
+def _natural_key(value: str):
+    """Sort key that orders embedded numbers numerically ("1.10" after "1.9")"""
+    return [(0, int(part), "") if part.isdigit() else (1, 0, part) for part in re.split(r"(\d+)", value.lower()) if part]
+
+
+def number_key(value: str):
+    """Sort key for cells starting with a number ("12.34 ms", "+1.20", "1.5x"); others sort lowest"""
+    try:
+        return float(value.split(" ")[0].rstrip("x%"))
+    except ValueError:
+        return float("-inf")
 
 
 class CTkPackageTable(ctk.CTkFrame):
-    """Table for displaying package information"""
-    def __init__(self, master, packages: List[Dict[str, str]], **kwargs):
+    """Table for displaying package information, rendering only the visible rows"""
+    def __init__(self, master, packages: List[Dict[str, str]],
+                 columns: Sequence[Tuple[str, str]] = COLUMNS,
+                 sort_keys: Optional[Dict[str, Callable]] = None,
+                 sort_column: str = "name", sort_reverse: bool = False,
+                 filter_keys: Sequence[str] = ("name",), placeholder_text: str = "Filter packages by name",
+                 noun: str = "packages", **kwargs):
         super().__init__(master, **kwargs)
         self.packages = packages
-        
+        self.columns = columns
+        self.filter_keys = filter_keys
+        # What a row is, for the "{shown} of {total} ..." count
+        self.noun = noun
+        self.sort_keys = SORT_KEYS if sort_keys is None else sort_keys
+        self.sort_column = sort_column
+        self.sort_reverse = sort_reverse
+        self.filter_text = ""
+        self.first_row = 0
+        self._view = []
+        self._row_widgets = []
+
         # Configure grid
-        self.grid_columnconfigure(0, weight=1)
-        self.grid_columnconfigure(1, weight=1)
+        for column in range(len(columns)):
+            self.grid_columnconfigure(column, weight=1)
         self.grid_rowconfigure(0, weight=0)
-        
-        # Create header
-        self.header_name = ctk.CTkLabel(
-            self, text="Package Name",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=("gray75", "gray25"), corner_radius=6
-        )
-        self.header_name.grid(row=0, column=0, sticky="ew", padx=(5, 2), pady=5)
-        
-        self.header_version = ctk.CTkLabel(
-            self, text="Version",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=("gray75", "gray25"), corner_radius=6
+        last = len(columns)
+
+        # Filter entry
+        self.filter_var = tk.StringVar()
+        self.filter_entry = ctk.CTkEntry(
+            self, textvariable=self.filter_var, placeholder_text=placeholder_text
         )
-        self.header_version.grid(row=0, column=1, sticky="ew", padx=(2, 5), pady=5)
-          # Create scrollable frame for package rows
-        self.scrollable_frame = ctk.CTkScrollableFrame(self)
-        self.scrollable_frame.grid(row=1, column=0, columnspan=2, sticky="nsew", padx=5, pady=5)
-        self.scrollable_frame.grid_columnconfigure(0, weight=1)
-        self.scrollable_frame.grid_columnconfigure(1, weight=1)
-        self.grid_rowconfigure(1, weight=1)
-        
+        self.filter_entry.grid(row=0, column=0, columnspan=last + 1, sticky="ew", padx=5, pady=(5, 0))
+        self.filter_var.trace_add("write", lambda *args: self.apply_filter(self.filter_var.get()))
+
+        # Create header; clicking a column sorts by it
+        self.header_buttons = {}
+        for column, (key, text) in enumerate(columns):
+            button = ctk.CTkButton(
+                self, text=text,
+                font=ctk.CTkFont(size=14, weight="bold"),
+                fg_color=("gray75", "gray25"), text_color=("gray10", "gray90"),
+                hover_color=("gray70", "gray30"), corner_radius=6,
+                command=lambda key=key: self.sort_by(key)
+            )
+            button.grid(row=1, column=column, sticky="ew", padx=(5, 2) if column == 0 else (2, 5 if column == last - 1 else 2), pady=5)
+            self.header_buttons[key] = button
+
+        # Body holds a fixed pool of row widgets that are recycled while scrolling
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.grid(row=2, column=0, columnspan=last, sticky="nsew", padx=5, pady=5)
+        for column in range(len(columns)):
+            self.body.grid_columnconfigure(column, weight=1, uniform="columns")
+        self.body.grid_propagate(False)
+        self.grid_rowconfigure(2, weight=1)
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=2, column=last, sticky="ns", pady=5)
+
+        self.count_label = ctk.CTkLabel(self, text="", anchor="w")
+        self.count_label.grid(row=3, column=0, columnspan=last + 1, sticky="ew", padx=5)
+
+        self.body.bind("<Configure>", self._on_resize)
+        self._bind_mousewheel(self.body)
+
         # Populate the table
         self.populate_table()
-    
+
     def populate_table(self):
-        """Populate the table with package data"""
-        # Clear existing widgets
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-            
-        # Sort packages by name
-        if self.packages:
-            self.packages.sort(key=lambda x: x.get("name", "").lower())
-        
-        # Add package rows
-        for i, package in enumerate(self.packages):
-            bg_color = ("gray95", "gray15") if i % 2 == 0 else ("gray90", "gray20")
-            
-            name_label = ctk.CTkLabel(
-                self.scrollable_frame, text=package.get("name", "Unknown"),
-                anchor="w", fg_color=bg_color, corner_radius=0
-            )
-            name_label.grid(row=i, column=0, sticky="ew", padx=0, pady=(0, 1))
-            
-            version_label = ctk.CTkLabel(
-                self.scrollable_frame, text=package.get("version", "Unknown"),
-                anchor="w", fg_color=bg_color, corner_radius=0
-            )
-            version_label.grid(row=i, column=1, sticky="ew", padx=0, pady=(0, 1))
+        """Rebuild the sorted and filtered view of the packages"""
+        # The filter matches any of the filter columns; newlines keep it from matching across them
+        self._all = [
+            ("\n".join(str(package.get(key, "Unknown")) for key in self.filter_keys).lower(), package)
+            for package in self.packages
+        ]
+        self._sort(self._all)
+        self._view = [entry for entry in self._all if self.filter_text in entry[0]]
+        self.first_row = 0
+        self.refresh()
+
+    def _sort(self, entries):
+        column = self.sort_column
+        key = self.sort_keys.get(column, _natural_key)
+        entries.sort(key=lambda entry: key(str(entry[1].get(column, ""))), reverse=self.sort_reverse)
+
+    def sort_by(self, column: str):
+        """Sort by column, toggling the direction when it is already the sort column"""
+        if column == self.sort_column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column = column
+            self.sort_reverse = False
+        self._sort(self._all)
+        self._sort(self._view)
+        for key, text in self.columns:
+            arrow = (" ▼" if self.sort_reverse else " ▲") if key == column else ""
+            self.header_buttons[key].configure(text=text + arrow)
+        self.refresh()
+
+    def apply_filter(self, text: str):
+        """Show only packages whose filter columns contain text"""
+        text = text.strip().lower()
+        # Narrowing the filter only needs to scan the current view
+        source = self._view if text.startswith(self.filter_text) else self._all
+        self._view = [entry for entry in source if text in entry[0]]
+        self.filter_text = text
+        self.first_row = 0
+        self.refresh()
+
+    def _visible_count(self) -> int:
+        return max(self.body.winfo_height() // ROW_HEIGHT, 1)
+
+    def _on_resize(self, event=None):
+        """Grow or shrink the pool of row widgets to fill the body"""
+        needed = self._visible_count()
+        while len(self._row_widgets) < needed:
+            row = len(self._row_widgets)
+            labels = []
+            for column in range(len(self.columns)):
+                label = ctk.CTkLabel(self.body, text="", anchor="w", corner_radius=0, height=ROW_HEIGHT - 1)
+                label.grid(row=row, column=column, sticky="ew", padx=0, pady=(0, 1))
+                self._bind_mousewheel(label)
+                labels.append(label)
+            self._row_widgets.append(labels)
+        while len(self._row_widgets) > needed:
+            for label in self._row_widgets.pop():
+                label.destroy()
+        self.refresh()
+
+    def refresh(self):
+        """Write the visible slice of the view into the recycled row widgets"""
+        visible = len(self._row_widgets)
+        self.first_row = max(min(self.first_row, len(self._view) - visible), 0)
+
+        for offset, labels in enumerate(self._row_widgets):
+            index = self.first_row + offset
+            if index < len(self._view):
+                package = self._view[index][1]
+                bg_color = ("gray95", "gray15") if index % 2 == 0 else ("gray90", "gray20")
+                values = [str(package.get(key, "Unknown")) for key, _ in self.columns]
+            else:
+                bg_color = "transparent"
+                values = [""] * len(self.columns)
+            for label, value in zip(labels, values):
+                label.configure(text=value, fg_color=bg_color)
+
+        total = len(self._view)
+        if total:
+            self.scrollbar.set(self.first_row / total, min((self.first_row + visible) / total, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        self.count_label.configure(text=f"{total} of {len(self.packages)} {self.noun}")
+
+    def scroll_to(self, first_row: int):
+        if first_row != self.first_row:
+            self.first_row = first_row
+            self.refresh()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self._view)))
+        elif action == "scroll":
+            step = len(self._row_widgets) if unit == "pages" else 1
+            self.scroll_to(self.first_row + int(amount) * step)
+
+    def _bind_mousewheel(self, widget):
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(sequence, self._on_mousewheel, add="+")
+
+    def _on_mousewheel(self, event):
+        if event.num == 4:
+            delta = -3
+        elif event.num == 5:
+            delta = 3
+        else:
+            delta = -3 if event.delta > 0 else 3
+        self.scroll_to(self.first_row + delta)
 
 
 class PackageListWindow(ctk.CTkToplevel):
@@ -72,10 +212,10 @@ class PackageListWindow(ctk.CTkToplevel):
         self.geometry("600x600")
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
-        
+
         # Create package table
         self.package_table = CTkPackageTable(self, packages)
         self.package_table.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
-        
+
         self.grab_set()
         self.focus_force()
@@ -0,0 +1,39 @@
+from typing import List, Tuple
+
+from src.ui.package_table import number_key
+from src.ui.results_window import MISSING, ResultsTableWindow
+from src.utils.profiling import compare_profiles
+
+
+class ProfileWindow(ResultsTableWindow):
+    """Window comparing cProfile function statistics across environments"""
+    def __init__(self, profiles: List[Tuple[str, dict]], title: str = "Function Profile Comparison"):
+        names = [name for name, _ in profiles]
+
+        rows = []
+        for row in compare_profiles(profiles):
+            table_row = {
+                "name": row["function"],
+                "ratio": f"{max(row['ratios'].values()):.2f}x" if row["ratios"] else MISSING,
+                "regression": f"{row['regression'] * 1000:+.2f} ms",
+            }
+            for index, name in enumerate(names):
+                stats = row["stats"][name]
+                table_row[f"env{index}"] = (
+                    f"{stats['cumtime'] * 1000:.2f} ms ({stats['tottime'] * 1000:.2f}, {stats['calls']} calls)"
+                    if stats else MISSING
+                )
+            rows.append(table_row)
+
+        columns = (
+            [("name", "Function")]
+            + [(f"env{index}", name) for index, name in enumerate(names)]
+            + [("ratio", "Max Ratio"), ("regression", "Regression")]
+        )
+        super().__init__(
+            title, f"{max(800, 240 * (len(profiles) + 3))}x700", columns, rows,
+            summary=f"Baseline: {names[0]}. Cells show cumulative time (own time, calls); "
+                    "rows are sorted by the largest cumulative-time regression.",
+            sort_keys={key: number_key for key, _ in columns[1:]}, sort_column="regression", sort_reverse=True,
+            placeholder_text="Filter functions by name", noun="functions"
+        )
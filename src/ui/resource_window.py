@@ -0,0 +1,109 @@
+import customtkinter as ctk
+import tkinter as tk
+from typing import Dict
+
+from src.ui.results_window import MISSING
+from src.utils.resources import summarize_samples
+
+
+LINE_COLORS = ("#75beff", "#f48771", "#89d185", "#dcdcaa", "#c586c0", "#4ec9b0", "#ce9178", "#9cdcfe")
+PLOT_MARGIN = 50
+
+
+def _format_bytes(value):
+    return f"{value / (1024 * 1024):.1f} MB" if value is not None else MISSING
+
+
+def _format_number(value, suffix=""):
+    return f"{value:.0f}{suffix}" if value is not None else MISSING
+
+
+class ResourcePlot(tk.Canvas):
+    """Line chart of one sampled resource, one line per environment"""
+    def __init__(self, master, series, key, label, scale=1.0, unit=""):
+        super().__init__(master, bg="#1e1e1e", highlightthickness=0, height=220)
+        self.series = series
+        self.key = key
+        self.label = label
+        self.scale = scale
+        self.unit = unit
+        self.bind("<Configure>", lambda event: self.redraw())
+
+    def redraw(self):
+        self.delete("all")
+        width, height = self.winfo_width(), self.winfo_height()
+        points = {
+            name: [(s["t"], s[self.key] * self.scale) for s in samples if s[self.key] is not None]
+            for name, samples in self.series
+        }
+        all_points = [point for values in points.values() for point in values]
+        self.create_text(PLOT_MARGIN, 12, text=self.label, fill="#f0f0f0", anchor="w")
+        if not all_points:
+            self.create_text(width / 2, height / 2, text="No samples", fill="#808080")
+            return
+
+        max_t = max(t for t, _ in all_points) or 1.0
+        max_v = max(v for _, v in all_points) or 1.0
+        left, top, right, bottom = PLOT_MARGIN, 25, width - 15, height - 25
+        self.create_rectangle(left, top, right, bottom, outline="#404040")
+        self.create_text(left - 5, top, text=f"{max_v:.0f}{self.unit}", fill="#a0a0a0", anchor="e")
+        self.create_text(left - 5, bottom, text=f"0{self.unit}", fill="#a0a0a0", anchor="e")
+        self.create_text(right, bottom + 12, text=f"{max_t:.2f}s", fill="#a0a0a0", anchor="e")
+
+        for index, (name, values) in enumerate(points.items()):
+            color = LINE_COLORS[index % len(LINE_COLORS)]
+            coords = []
+            for t, v in values:
+                coords += [left + (right - left) * t / max_t, bottom - (bottom - top) * v / max_v]
+            if len(coords) >= 4:
+                self.create_line(*coords, fill=color, width=2)
+            elif coords:
+                self.create_oval(coords[0] - 2, coords[1] - 2, coords[0] + 2, coords[1] + 2, fill=color, outline=color)
+            self.create_text(left + 10 + 150 * index, bottom + 12, text=name, fill=color, anchor="w")
+
+
+class ResourceWindow(ctk.CTkToplevel):
+    """Window showing CPU and memory usage of the last run of each environment side by side"""
+    def __init__(self, results: Dict[str, dict], title: str = "Resource Usage"):
+        super().__init__()
+        self.title(title)
+        self.geometry("1000x750")
+        self.grid_columnconfigure(0, weight=1)
+
+        summary_frame = ctk.CTkFrame(self)
+        summary_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 0))
+        headers = ["Environment", "Wall", "User CPU", "System CPU", "Peak RSS", "Mean CPU", "Peak CPU", "Threads", "FDs"]
+        for column, header in enumerate(headers):
+            ctk.CTkLabel(summary_frame, text=header, font=ctk.CTkFont(weight="bold")).grid(
+                row=0, column=column, padx=8, pady=(5, 0), sticky="w"
+            )
+
+        series = []
+        for row, (name, result) in enumerate(results.items(), start=1):
+            resources = result["resources"]
+            samples = resources["samples"]
+            summary = summarize_samples(samples)
+            # wait4 reports the true peak; sampling can miss short spikes
+            peak_rss = resources["peak_rss"] if resources["peak_rss"] is not None else summary["peak_rss"]
+            values = [
+                name,
+                f"{result['wall']:.2f}s" if result["wall"] is not None else MISSING,
+                f"{resources['user']:.2f}s" if resources["user"] is not None else MISSING,
+                f"{resources['sys']:.2f}s" if resources["sys"] is not None else MISSING,
+                _format_bytes(peak_rss),
+                _format_number(summary["mean_cpu_percent"], "%"),
+                _format_number(summary["peak_cpu_percent"], "%"),
+                _format_number(summary["peak_threads"]),
+                _format_number(summary["peak_fds"]),
+            ]
+            for column, value in enumerate(values):
+                ctk.CTkLabel(summary_frame, text=value).grid(row=row, column=column, padx=8, pady=2, sticky="w")
+            series.append((name, samples))
+
+        self.memory_plot = ResourcePlot(self, series, "rss", "Memory (RSS)", scale=1 / (1024 * 1024), unit=" MB")
+        self.memory_plot.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
+        self.cpu_plot = ResourcePlot(self, series, "cpu_percent", "CPU", unit="%")
+        self.cpu_plot.grid(row=2, column=0, sticky="nsew", padx=10, pady=(0, 10))
+        self.grid_rowconfigure((1, 2), weight=1)
+
+        self.focus_force()
@@ -0,0 +1,32 @@
+import customtkinter as ctk
+from typing import Dict, List, Sequence, Tuple
+
+from src.ui.package_table import CTkPackageTable
+
+
+# Cell text for an environment without a value
+MISSING = "—"
+
+
+class ResultsTableWindow(ctk.CTkToplevel):
+    """Window with a summary line above a sortable table; subclasses grid their controls above first_row"""
+    def __init__(self, title: str, geometry: str, columns: Sequence[Tuple[str, str]], rows: List[Dict[str, str]] = (),
+                 summary: str = "", first_row: int = 0, **table_options):
+        super().__init__()
+        self.title(title)
+        self.geometry(geometry)
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(first_row + 1, weight=1)
+
+        self.summary_label = ctk.CTkLabel(self, text=summary, justify="left", anchor="w")
+        self.summary_label.grid(row=first_row, column=0, sticky="ew", padx=15, pady=(10, 0))
+
+        self.table = CTkPackageTable(self, list(rows), columns=columns, **table_options)
+        self.table.grid(row=first_row + 1, column=0, sticky="nsew", padx=10, pady=10)
+
+        self.focus_force()
+
+    def show_rows(self, rows: List[Dict[str, str]]):
+        """Replace the table's rows, keeping its sorting and filter"""
+        self.table.packages = rows
+        self.table.populate_table()
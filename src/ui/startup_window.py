@@ -0,0 +1,48 @@
+from typing import List, Tuple
+
+from src.ui.package_table import number_key
+from src.ui.results_window import MISSING, ResultsTableWindow
+from src.utils.microbench import format_duration
+from src.utils.startup import rank_startup
+
+
+class StartupWindow(ResultsTableWindow):
+    """Window ranking interpreter startup times of every environment and command-line variant"""
+    def __init__(self, results: List[Tuple[str, dict]], title: str = "Startup Time Comparison"):
+        ranking = rank_startup(results)
+        lines = []
+        if ranking:
+            fastest = ranking[0]
+            lines.append(
+                f"Fastest: {fastest['environment']} ({fastest['version']}) with {fastest['label']}, "
+                f"median {format_duration(fastest['summary']['median'])}"
+            )
+        lines += [
+            f"{name}: {variant['label']} failed: {variant['error'].splitlines()[-1]}"
+            for name, result in results for variant in result["variants"] if variant["error"]
+        ]
+
+        rows = []
+        for rank, row in enumerate(ranking, start=1):
+            summary = row["summary"]
+            rows.append({
+                "rank": str(rank),
+                "environment": f"{row['environment']} ({row['version']})",
+                "variant": row["label"],
+                "median": f"{summary['median'] * 1000:.2f} ms",
+                "mean": f"{summary['mean'] * 1000:.2f} ms ± {(summary['ci'] or 0) * 1000:.2f}",
+                "min": f"{summary['min'] * 1000:.2f} ms",
+                "runs": str(summary["values"]),
+                "relative": f"{row['relative']:.2f}x" if row["relative"] else MISSING,
+            })
+
+        columns = (
+            ("rank", "Rank"), ("environment", "Environment"), ("variant", "Command Line"), ("median", "Median"),
+            ("mean", "Mean ± 95% CI"), ("min", "Min"), ("runs", "Runs"), ("relative", "vs Fastest"),
+        )
+        super().__init__(
+            title, "1000x650", columns, rows, summary="\n".join(lines),
+            sort_keys={key: number_key for key in ("rank", "median", "mean", "min", "runs", "relative")},
+            sort_column="rank", filter_keys=("environment", "variant"),
+            placeholder_text="Filter by environment or command line", noun="timings"
+        )
@@ -0,0 +1,96 @@
+import queue
+import sys
+import tkinter as tk
+
+
+FLUSH_INTERVAL_MS = 33  # ~30 frames per second
+MAX_CONSOLE_LINES = 10000
+
+
+class UiQueue:
+    """Queue of callbacks posted from worker threads and run on the Tk main loop"""
+    def __init__(self, widget, interval_ms: int = FLUSH_INTERVAL_MS):
+        self.widget = widget
+        self.interval_ms = interval_ms
+        self._queue = queue.SimpleQueue()
+        self.widget.after(self.interval_ms, self._tick)
+
+    def post(self, callback, *args):
+        """Run callback(*args) on the Tk main loop; safe to call from any thread"""
+        self._queue.put((callback, args))
+
+    def _drain(self):
+        """Take all currently queued items without blocking"""
+        items = []
+        while True:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                return items
+
+    def _tick(self):
+        try:
+            self.flush()
+        finally:
+            try:
+                if self.widget.winfo_exists():
+                    self.widget.after(self.interval_ms, self._tick)
+            except tk.TclError:
+                # The application is gone, stop flushing
+                pass
+
+    def _run(self, callback, *args):
+        """Run one callback; an error is reported like any Tk callback error and the batch goes on"""
+        try:
+            callback(*args)
+        except Exception:
+            # A TclError here is usually a widget removed since the callback was posted
+            self.widget.report_callback_exception(*sys.exc_info())
+
+    def flush(self):
+        """Run all queued callbacks"""
+        for callback, args in self._drain():
+            self._run(callback, *args)
+
+
+class ConsoleWriter(UiQueue):
+    """Batches text written from worker threads into a Text widget, trimming old lines"""
+    def __init__(self, console: tk.Text, max_lines: int = MAX_CONSOLE_LINES, interval_ms: int = FLUSH_INTERVAL_MS):
+        self.max_lines = max_lines
+        super().__init__(console, interval_ms)
+
+    def write(self, text: str):
+        """Queue text for the console; safe to call from any thread"""
+        self._queue.put((None, text))
+
+    def clear(self):
+        """Queue clearing the console, ordered with previously written text"""
+        self.post(self.widget.delete, "1.0", tk.END)
+
+    def flush(self):
+        """Insert queued text in one batch and run queued callbacks in order"""
+        pending = []
+        for callback, args in self._drain():
+            if callback is None:
+                pending.append(args)
+                continue
+            self._run(self._insert, pending)
+            pending = []
+            self._run(callback, *args)
+        self._run(self._insert, pending)
+
+    def _insert(self, pending):
+        if not pending:
+            return
+        text = "".join(pending)
+
+        # Text that would be trimmed right away is never inserted
+        parts = text.rsplit("\n", self.max_lines)
+        if len(parts) > self.max_lines:
+            text = "\n".join(parts[1:])
+
+        self.widget.insert(tk.END, text)
+        line_count = int(self.widget.index("end-1c").split(".")[0])
+        if line_count > self.max_lines:
+            self.widget.delete("1.0", f"{line_count - self.max_lines + 1}.0")
+        self.widget.see(tk.END)
@@ -0,0 +1,30 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Defines relative(filename) inside a target interpreter wrapper; expects os, sys and
+# sysconfig imported and sys.path[0] set to the script's directory. Paths become
+# relative to their root so the same file matches across interpreters.
+RELATIVE_PATHS = """
+roots = [(sys.path[0], "")]
+paths = sysconfig.get_paths()
+roots += [(paths[key], "<" + key + ">/") for key in ("purelib", "platlib", "stdlib", "platstdlib") if paths.get(key)]
+
+def relative(filename):
+    if filename.startswith("<frozen "):
+        # Frozen stdlib modules (3.11+) are plain files on older interpreters
+        return "<stdlib>/" + filename[8:-1].replace(".", "/") + ".py"
+    for root, label in roots:
+        if filename.startswith(root + os.sep):
+            return label + os.path.relpath(filename, root).replace(os.sep, "/")
+    return filename
+"""
+
+
+def run_all(function, environments, *args, max_workers=4):
+    """function(python_path, *args) for each (name, python_path) in parallel; returns name -> result"""
+    with ThreadPoolExecutor(max_workers=max(min(max_workers, len(environments)), 1)) as executor:
+        futures = {
+            name: executor.submit(function, python_path, *args)
+            for name, python_path in environments
+        }
+        return {name: future.result() for name, future in futures.items()}
@@ -0,0 +1,297 @@
+import asyncio
+import codecs
+import json
+import os
+import re
+import sys
+import threading
+import time
+
+from src.utils.output_stream import OutputBuffer, DEFAULT_MEMORY_LIMIT, READ_CHUNK_SIZE
+from src.utils.python_env import PROBE_SCRIPT, _pin_to_cpu, _unbuffered_env, default_cpu
+from src.utils.scheduler import SERIAL_PINNED, _safe_filename
+
+
+def _kill(process):
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+
+
+async def _communicate(args, timeout=None):
+    """Run a command to completion and return (returncode, stdout, stderr) as text"""
+    process = await asyncio.create_subprocess_exec(
+        *[str(arg) for arg in args], stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except BaseException:
+        # Timed out or cancelled: never leave the child running
+        _kill(process)
+        await process.wait()
+        raise
+    return (process.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace"))
+
+
+async def detect_python_version_async(python_path, timeout=None):
+    """Async detect_python_version"""
+    try:
+        returncode, stdout, stderr = await _communicate([python_path, "--version"], timeout)
+    except asyncio.CancelledError:
+        raise
+    except asyncio.TimeoutError:
+        return (None, -1, f"Timed out after {timeout} seconds")
+    except Exception as e:
+        return (None, -1, str(e))
+    if returncode != 0:
+        return (None, returncode, f"Failed to get Python version: {stderr}")
+
+    version_str = stdout.strip() or stderr.strip()
+    match = re.search(r'Python (\d+\.\d+\.\d+)', version_str)
+    if not match:
+        return (None, 0, f"Cannot parse version from: {version_str}")
+    return (match.group(1), 0, None)
+
+
+async def probe_interpreter_async(python_path, packages=True, timeout=None):
+    """Async probe_interpreter"""
+    args = ["-c", PROBE_SCRIPT] + (["--packages"] if packages else [])
+    try:
+        returncode, stdout, stderr = await _communicate([python_path, "-I", *args], timeout)
+        if returncode != 0:
+            # Interpreters before 3.4 have no -I; retry without isolation
+            returncode, stdout, stderr = await _communicate([python_path, *args], timeout)
+        if returncode != 0:
+            return (None, returncode, f"Interpreter probe failed: {stderr.strip()}")
+        return (json.loads(stdout), 0, None)
+    except asyncio.CancelledError:
+        raise
+    except asyncio.TimeoutError:
+        return (None, -1, f"Timed out after {timeout} seconds")
+    except Exception as e:
+        return (None, -1, str(e))
+
+
+async def get_installed_packages_async(python_path, timeout=None):
+    """Async get_installed_packages, falling back to pip when metadata probing fails"""
+    data, return_code, error = await probe_interpreter_async(python_path, timeout=timeout)
+    if data and data["packages"] is not None:
+        return (data["packages"], 0, None)
+    try:
+        returncode, stdout, stderr = await _communicate(
+            [python_path, "-m", "pip", "list", "--format=json"], timeout
+        )
+    except asyncio.CancelledError:
+        raise
+    except asyncio.TimeoutError:
+        return (None, -1, f"Timed out after {timeout} seconds")
+    except Exception as e:
+        return (None, -1, str(e))
+    if returncode != 0:
+        return (None, returncode, f"pip command failed: {stderr.strip() or 'Unknown error'}")
+    try:
+        return ([{"name": pkg["name"], "version": pkg["version"]} for pkg in json.loads(stdout)], 0, None)
+    except (ValueError, KeyError) as e:
+        return (None, -1, f"Failed to parse pip output: {e}")
+
+
+async def _read_stream(reader, stream, buffer, on_output, start):
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        data = await reader.read(READ_CHUNK_SIZE)
+        text = decoder.decode(data, final=not data)
+        if text:
+            timestamp = time.perf_counter() - start
+            buffer.append(stream, text, timestamp)
+            if on_output:
+                on_output(stream, text, timestamp)
+        if not data:
+            break
+
+
+async def execute_python_async(python_path, args, timeout=None, cpu=None, on_output=None,
+                               max_memory=DEFAULT_MEMORY_LIMIT, log_path=None):
+    """Async execute_python; cancelling the awaiting task kills the process"""
+    result = {
+        "stdout": None, "stderr": None, "returncode": -1, "status": "error", "wall": None, "output": None,
+        "resources": None,
+    }
+    buffer = None
+    try:
+        buffer = OutputBuffer(max_memory=max_memory, log_path=log_path)
+        start = time.perf_counter()
+        process = await asyncio.create_subprocess_exec(
+            str(python_path), *[str(arg) for arg in args],
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            preexec_fn=_pin_to_cpu(cpu), env=_unbuffered_env()
+        )
+    except Exception as e:
+        if buffer is not None:
+            buffer.discard()
+        result["stderr"] = str(e)
+        return result
+
+    readers = asyncio.gather(
+        _read_stream(process.stdout, "stdout", buffer, on_output, start),
+        _read_stream(process.stderr, "stderr", buffer, on_output, start),
+    )
+    status = "completed"
+    try:
+        try:
+            await asyncio.wait_for(process.wait(), timeout)
+        except asyncio.TimeoutError:
+            status = "timeout"
+            _kill(process)
+            await process.wait()
+        wall = time.perf_counter() - start
+        await readers
+    except asyncio.CancelledError:
+        _kill(process)
+        readers.cancel()
+        # Mark the readers' cancellation as seen so asyncio does not log it
+        readers.add_done_callback(lambda future: future.cancelled() or future.exception())
+        # Reap the child so its transport is closed while the loop still runs
+        await process.wait()
+        buffer.discard()
+        raise
+    buffer.close()
+
+    # Only the in-memory tail is returned as text; spilled output stays on disk
+    result.update(
+        stdout=buffer.text("stdout", memory_only=True), stderr=buffer.text("stderr", memory_only=True),
+        returncode=process.returncode, status=status, wall=wall, output=buffer
+    )
+    return result
+
+
+async def run_python_script_async(python_path, script_path, timeout=None):
+    """Async run_python_script, returning (stdout, stderr, returncode)"""
+    result = await execute_python_async(python_path, [script_path], timeout=timeout)
+    if result["output"] is not None:
+        result["output"].discard()
+    if result["status"] == "error":
+        return (None, result["stderr"], -1)
+    if result["status"] == "timeout":
+        return (result["stdout"], result["stderr"] + f"\nProcess timed out after {timeout} seconds", -1)
+    return (result["stdout"], result["stderr"], result["returncode"])
+
+
+def _use_pidfd_child_watcher(loop):
+    """Wait for children with pidfds instead of a thread per child (3.8 to 3.11)"""
+    if sys.platform == "win32" or sys.version_info >= (3, 12) or not hasattr(asyncio, "PidfdChildWatcher"):
+        return
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except (AttributeError, OSError):
+        # Kernel without pidfd support
+        return
+    watcher = asyncio.PidfdChildWatcher()
+    watcher.attach_loop(loop)
+    asyncio.get_event_loop_policy().set_child_watcher(watcher)
+
+
+class EventLoopThread:
+    """An asyncio event loop on one background thread, accepting coroutines from any thread"""
+    def __init__(self):
+        self.loop = None
+        self._lock = threading.Lock()
+
+    def _ensure_running(self):
+        with self._lock:
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+                _use_pidfd_child_watcher(self.loop)
+                threading.Thread(target=self.loop.run_forever, name="pyversioner-asyncio", daemon=True).start()
+        return self.loop
+
+    def submit(self, coroutine):
+        """Schedule a coroutine on the loop from any thread"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._ensure_running())
+
+    def call_soon(self, callback, *args):
+        self._ensure_running().call_soon_threadsafe(callback, *args)
+
+
+event_loop_thread = EventLoopThread()
+
+
+class AsyncRunScheduler:
+    """RunScheduler counterpart driving all runs from one event loop instead of a thread each"""
+    def __init__(self, concurrency=None, timeout=None, pin_cpu=None, max_memory=DEFAULT_MEMORY_LIMIT, log_dir=None,
+                 loop_thread=None):
+        if concurrency == SERIAL_PINNED:
+            concurrency = 1
+            pin_cpu = default_cpu() if pin_cpu is None else pin_cpu
+        # None runs every environment at once: waiting processes cost no threads
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.pin_cpu = pin_cpu
+        self.max_memory = max_memory
+        self.log_dir = log_dir
+        self.loop_thread = loop_thread or event_loop_thread
+        self._cancel_event = threading.Event()
+        self._futures = []
+        self._tasks = set()
+
+    def run(self, environments, script_path, on_start=None, on_output=None, on_result=None):
+        """Schedule script_path for each (name, python_path) pair, returning concurrent futures"""
+        # Like RunScheduler, earlier runs are left to finish; cancel() stops them
+        self.shutdown()
+        cancel_event = self._cancel_event = threading.Event()
+        tasks = self._tasks = set()
+
+        async def task(name, python_path, semaphore):
+            tasks.add(asyncio.current_task())
+            try:
+                if cancel_event.is_set():
+                    raise asyncio.CancelledError()
+                if semaphore:
+                    await semaphore.acquire()
+                try:
+                    if on_start:
+                        on_start(name)
+                    result = await execute_python_async(
+                        python_path, [script_path],
+                        timeout=self.timeout, cpu=self.pin_cpu,
+                        on_output=(lambda stream, text, timestamp: on_output(name, stream, text, timestamp)) if on_output else None,
+                        max_memory=self.max_memory,
+                        log_path=os.path.join(self.log_dir, f"{_safe_filename(name)}.log") if self.log_dir else None
+                    )
+                finally:
+                    if semaphore:
+                        semaphore.release()
+            except asyncio.CancelledError:
+                result = {"stdout": "", "stderr": "", "returncode": -1, "status": "cancelled", "wall": None,
+                          "output": None, "resources": None}
+            finally:
+                tasks.discard(asyncio.current_task())
+            result["name"] = name
+            result["python_path"] = python_path
+            if on_result:
+                on_result(name, result)
+            return result
+
+        async def create_semaphore():
+            # Created on the loop that uses it
+            return asyncio.Semaphore(self.concurrency) if self.concurrency else None
+
+        semaphore = self.loop_thread.submit(create_semaphore()).result()
+        self._futures = [self.loop_thread.submit(task(name, path, semaphore)) for name, path in environments]
+        return list(self._futures)
+
+    def cancel(self):
+        """Cancel queued runs and kill the running ones"""
+        # Runs not started yet see the event; running ones are cancelled on the loop
+        self._cancel_event.set()
+        tasks = self._tasks
+        self.loop_thread.call_soon(lambda: [task.cancel() for task in list(tasks)])
+
+    def wait(self):
+        """Block until all scheduled runs finish and return their results"""
+        return [future.result() for future in self._futures]
+
+    def shutdown(self):
+        """The shared loop keeps running; nothing to release"""
+        self._futures = []
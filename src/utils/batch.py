@@ -0,0 +1,243 @@
+import fnmatch
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.interpreter_cache import cache_dir, fingerprint, resolve_executable
+from src.utils.outcomes import CANCELLED, ERROR, FAILED, FINISHED, PASSED, STDERR_TAIL, TIMEOUT, digest
+from src.utils.output_stream import DEFAULT_MEMORY_LIMIT
+from src.utils.python_env import execute_python
+from src.utils.result_cache import script_digest
+from src.utils.run_history import REGRESSION
+from src.utils.scheduler import default_concurrency
+
+
+SAME = "same"
+DIFFERS = "differs"
+
+
+def find_scripts(directory, pattern="*.py", recursive=True):
+    """Scripts in a directory matching a glob pattern, sorted by path"""
+    scripts = []
+    for root, dirs, files in os.walk(directory):
+        # Skip hidden directories and virtual environments
+        dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d not in ("__pycache__", "venv", "env"))
+        scripts += [os.path.join(root, name) for name in files if fnmatch.fnmatch(name, pattern)]
+        if not recursive:
+            break
+    return sorted(scripts)
+
+
+def journal_path(directory, python_paths):
+    """Default journal location for a folder run against a set of interpreters"""
+    identity = json.dumps([os.path.abspath(directory), sorted(python_paths)])
+    name = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir(), "batches", f"{name}.jsonl")
+
+
+def cell_inputs(script_path, python_path):
+    """Hash of what a cell ran: the script with its local imports and the interpreter binary"""
+    try:
+        script = script_digest(script_path)
+    except OSError:
+        return None
+    return digest(json.dumps([script, fingerprint([resolve_executable(python_path)])]))
+
+
+class BatchJournal:
+    """Append-only JSON lines file of finished (passed or failed) cells, so an interrupted batch can resume"""
+    def __init__(self, path, key_fields=("script", "python_path")):
+        self.path = path
+        self.key_fields = key_fields
+        self._lock = threading.Lock()
+
+    def key(self, record):
+        return tuple(record[field] for field in self.key_fields)
+
+    def load(self):
+        """Map cell key to its last recorded result, leaving out unfinished cells and cells whose inputs changed"""
+        records = {}
+        inputs = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        key = self.key(record)
+                        if key not in inputs:
+                            inputs[key] = cell_inputs(*key)
+                        # Journals of older versions also hold timeouts and errors, and no inputs
+                        if record["status"] in FINISHED and inputs[key] and record.pop("inputs", None) == inputs[key]:
+                            records[key] = record
+                        else:
+                            records.pop(key, None)
+                    except (ValueError, KeyError, TypeError):
+                        # A crash can leave the last line half written
+                        continue
+        except OSError:
+            pass
+        return records
+
+    def append(self, record):
+        """Record a cell; timeouts, errors and cancellations are left out so a resume runs them again"""
+        if record.get("status") not in FINISHED:
+            return
+        with self._lock:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(dict(record, inputs=cell_inputs(*self.key(record)))) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def clear(self):
+        with self._lock:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+def run_cell(name, python_path, script_path, timeout=None, cancel_event=None, max_memory=DEFAULT_MEMORY_LIMIT):
+    """Run one script with one interpreter and describe the outcome as a journal record"""
+    result = execute_python(
+        python_path, [script_path], timeout=timeout, cancel_event=cancel_event, max_memory=max_memory
+    )
+    record = {
+        "script": script_path,
+        "environment": name,
+        "python_path": python_path,
+        "status": ERROR,
+        "returncode": result["returncode"],
+        "wall": result["wall"],
+        "stdout_sha256": None,
+        "stderr_tail": (result["stderr"] or "")[-STDERR_TAIL:],
+        "finished": time.time(),
+    }
+    output = result["output"]
+    if output is not None:
+        with output:
+            record["stdout_sha256"] = digest(output.text("stdout"))
+    if result["status"] == "completed":
+        record["status"] = PASSED if result["returncode"] == 0 else FAILED
+    elif result["status"] in (TIMEOUT, CANCELLED):
+        record["status"] = result["status"]
+    return record
+
+
+def output_status(record, baseline):
+    """Whether a cell printed the same stdout as the baseline environment's cell of the script"""
+    if not record or not baseline or record is baseline:
+        return None
+    if not record["stdout_sha256"] or not baseline["stdout_sha256"]:
+        return None
+    return SAME if record["stdout_sha256"] == baseline["stdout_sha256"] else DIFFERS
+
+
+class BatchRunner:
+    """Run every script against every environment on a bounded pool, skipping journaled and cached cells"""
+    def __init__(self, environments, scripts, concurrency=None, timeout=None, journal=None,
+                 max_memory=DEFAULT_MEMORY_LIMIT, cache=None, force=False, history=None):
+        self.environments = list(environments)
+        self.scripts = list(scripts)
+        self.concurrency = concurrency or default_concurrency()
+        self.timeout = timeout
+        self.journal = journal
+        self.max_memory = max_memory
+        self.cache = cache
+        self.force = force
+        self.history = history
+        self._cancel_event = threading.Event()
+        self._executor = None
+        self._futures = []
+
+    @property
+    def total(self):
+        return len(self.scripts) * len(self.environments)
+
+    def run(self, on_result=None, resume=True):
+        """Queue all cells; on_result(record) is called from worker threads as cells finish"""
+        self.shutdown()
+        self._cancel_event = threading.Event()
+        cancel_event = self._cancel_event
+        done = {}
+        if self.journal:
+            # A forced run reruns every cell, journaled ones included
+            if resume and not self.force:
+                done = self.journal.load()
+            else:
+                self.journal.clear()
+
+        pending = []
+        for script in self.scripts:
+            for name, python_path in self.environments:
+                previous = done.get((script, python_path))
+                if previous:
+                    record = dict(previous, environment=name, resumed=True)
+                    if on_result:
+                        on_result(record)
+                else:
+                    pending.append((name, python_path, script))
+        remaining = [len(pending)]
+        lock = threading.Lock()
+
+        def finish_batch():
+            # The journal only has to outlive interrupted batches
+            if self.journal and not cancel_event.is_set():
+                self.journal.clear()
+
+        def task(name, python_path, script):
+            try:
+                if cancel_event.is_set():
+                    record = {"script": script, "environment": name, "python_path": python_path, "status": CANCELLED}
+                else:
+                    record = self._run_cached(name, python_path, script, cancel_event)
+                    if self.journal:
+                        self.journal.append(record)
+                if on_result:
+                    on_result(record)
+                return record
+            finally:
+                with lock:
+                    remaining[0] -= 1
+                    last = not remaining[0]
+                if last:
+                    finish_batch()
+
+        if not pending:
+            finish_batch()
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="pyversioner-batch")
+        self._futures = [self._executor.submit(task, *cell) for cell in pending]
+        return list(self._futures)
+
+    def _run_cached(self, name, python_path, script, cancel_event):
+        key = None
+        if self.cache:
+            key = self.cache.key(python_path, script, {"kind": "batch", "timeout": self.timeout})
+        cached = self.cache.get(key) if key and not self.force else None
+        if cached:
+            return dict(cached, script=script, environment=name, python_path=python_path, cached=True)
+        record = run_cell(name, python_path, script, self.timeout, cancel_event, self.max_memory)
+        # Timeouts and cancellations depend on the machine's load, not on the inputs
+        if key and record["status"] in FINISHED:
+            self.cache.put(key, record)
+        if self.history and record["status"] in FINISHED:
+            rows = self.history.record(python_path, script, [dict(record, status="completed")], source="batch")
+            check = self.history.check(rows)
+            if check and check["status"] == REGRESSION:
+                record["regression"] = check
+        return record
+
+    def cancel(self):
+        """Cancel queued cells and kill the running ones"""
+        self._cancel_event.set()
+
+    def wait(self):
+        return [future.result() for future in self._futures]
+
+    def shutdown(self):
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
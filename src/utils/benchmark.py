@@ -0,0 +1,119 @@
+import statistics
+
+from src.utils.python_env import time_python_script
+from src.utils.worker_pool import worker_pool
+
+
+TIMING_KEYS = ("wall", "user", "sys", "peak_rss")
+
+
+def reject_outliers(samples, k=1.5):
+    """Split samples into (kept, rejected) using Tukey's IQR fences"""
+    if len(samples) < 4:
+        return (list(samples), [])
+
+    # The inclusive method keeps the IQR tight at the handful of runs a benchmark makes
+    q1, _, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+    spread = q3 - q1
+    low, high = q1 - k * spread, q3 + k * spread
+
+    kept = [s for s in samples if low <= s <= high]
+    rejected = [s for s in samples if s < low or s > high]
+    return (kept, rejected)
+
+
+def summarize(samples):
+    """Compute min/median/mean/stddev for samples after outlier rejection"""
+    samples = [s for s in samples if s is not None]
+    if not samples:
+        return None
+
+    kept, rejected = reject_outliers(samples)
+    return {
+        "min": min(kept),
+        "median": statistics.median(kept),
+        "mean": statistics.mean(kept),
+        "stddev": statistics.stdev(kept) if len(kept) > 1 else 0.0,
+        "runs": len(kept),
+        "outliers": len(rejected),
+    }
+
+
+def benchmark_python_script(python_path, script_path, runs=5, warmup=1, timeout=None, warm=False):
+    """Run a script repeatedly after warmup runs (in a warm worker with warm=True) and summarize the timings"""
+    if runs < 1:
+        return (None, -1, "Number of runs must be at least 1")
+    run_once = worker_pool.run if warm else time_python_script
+
+    for _ in range(warmup):
+        stdout, stderr, return_code, timing = run_once(python_path, script_path, timeout=timeout)
+        if timing is None:
+            return (None, return_code, stderr)
+
+    measurements = []
+    for _ in range(runs):
+        stdout, stderr, return_code, timing = run_once(python_path, script_path, timeout=timeout)
+        if timing is None:
+            return (None, return_code, stderr)
+        if timing["timed_out"]:
+            return (None, -1, f"Script timed out after {timeout} seconds during benchmark")
+        if return_code != 0:
+            return (None, return_code, f"Script failed during benchmark: {stderr.strip()}")
+        measurements.append(timing)
+
+    result = {"measurements": measurements, "mode": "warm" if warm else "cold"}
+    if warm:
+        result["worker_startup"] = worker_pool.worker(python_path).startup
+    for key in TIMING_KEYS:
+        result[key] = summarize([m[key] for m in measurements])
+    return (result, 0, None)
+
+
+def benchmark_warm_cold(python_path, script_path, runs=5, warmup=1, timeout=None):
+    """Benchmark a script with fresh interpreters and with a warm worker, returning {"cold", "warm", "speedup"}"""
+    cold, return_code, error = benchmark_python_script(python_path, script_path, runs, warmup, timeout)
+    if not cold:
+        return (None, return_code, error)
+    warm, return_code, error = benchmark_python_script(python_path, script_path, runs, warmup, timeout, warm=True)
+    if not warm:
+        return (None, return_code, f"Warm worker: {error}")
+    speedup = cold["wall"]["median"] / warm["wall"]["median"] if warm["wall"]["median"] > 0 else None
+    return ({"cold": cold, "warm": warm, "speedup": speedup}, 0, None)
+
+
+def format_benchmark(result):
+    """Format a benchmark result as a human readable report"""
+    lines = []
+    for key, label, scale, unit in (
+        ("wall", "Wall time", 1000, "ms"),
+        ("user", "User CPU", 1000, "ms"),
+        ("sys", "System CPU", 1000, "ms"),
+        ("peak_rss", "Peak RSS", 1 / (1024 * 1024), "MiB"),
+    ):
+        summary = result.get(key)
+        if not summary:
+            lines.append(f"{label}: not available")
+            continue
+        lines.append(
+            f"{label}: min {summary['min'] * scale:.2f} {unit}, "
+            f"median {summary['median'] * scale:.2f} {unit}, "
+            f"mean {summary['mean'] * scale:.2f} {unit}, "
+            f"stddev {summary['stddev'] * scale:.2f} {unit} "
+            f"({summary['runs']} runs, {summary['outliers']} outliers rejected)"
+        )
+    return "\n".join(lines)
+
+
+def format_warm_cold(result):
+    """Format a benchmark_warm_cold result as a human readable report"""
+    warm = result["warm"]
+    lines = [
+        "Cold (new interpreter per run):",
+        format_benchmark(result["cold"]),
+        "",
+        f"Warm (persistent worker, started once in {warm['worker_startup'] * 1000:.1f} ms):",
+        format_benchmark(warm),
+    ]
+    if result["speedup"]:
+        lines += ["", f"Warm runs are {result['speedup']:.1f}x faster (median wall time)"]
+    return "\n".join(lines)
@@ -0,0 +1,128 @@
+import glob
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.interpreter_cache import interpreter_cache
+from src.utils.package_diff import version_key
+
+
+PROBE_TIMEOUT = 5
+MAX_PROBE_WORKERS = 16
+
+IS_WINDOWS = sys.platform == "win32"
+# python, python3, python3.12, python3.13t, pypy3, pypy3.10 (plus .exe on Windows)
+INTERPRETER_NAME = re.compile(r"^(?:python|pypy)(?:\d+(?:\.\d+)?t?)?(?:\.exe)?$", re.IGNORECASE)
+
+
+def _env_python(env_dir):
+    """Interpreter inside a venv or conda env directory"""
+    if IS_WINDOWS:
+        candidates = [os.path.join(env_dir, "Scripts", "python.exe"), os.path.join(env_dir, "python.exe")]
+    else:
+        candidates = [os.path.join(env_dir, "bin", "python3"), os.path.join(env_dir, "bin", "python")]
+    return next((path for path in candidates if os.path.isfile(path)), None)
+
+
+def _path_candidates(skip_dirs=()):
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        if os.path.normcase(os.path.abspath(directory)) in skip_dirs:
+            continue
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            continue
+        for name in names:
+            if INTERPRETER_NAME.match(name):
+                yield os.path.join(directory, name)
+
+
+def _env_dirs(*patterns):
+    for pattern in patterns:
+        yield from glob.glob(os.path.expanduser(pattern))
+
+
+def _conda_roots():
+    roots = [os.environ.get("CONDA_PREFIX"), os.environ.get("CONDA_ROOT")]
+    roots += _env_dirs("~/miniconda*", "~/anaconda*", "~/miniforge*", "~/mambaforge*", "/opt/conda")
+    return [root for root in roots if root]
+
+
+def _conda_env_dirs():
+    for root in _conda_roots():
+        yield root
+        yield from _env_dirs(os.path.join(root, "envs", "*"))
+    # Environments created with `conda create -p` are listed here
+    try:
+        with open(os.path.expanduser("~/.conda/environments.txt"), encoding="utf-8") as f:
+            yield from (line.strip() for line in f if line.strip())
+    except OSError:
+        pass
+
+
+def candidate_paths(project_dirs=()):
+    """All interpreter paths worth probing, in discovery order"""
+    pyenv_root = os.environ.get("PYENV_ROOT") or os.path.expanduser("~/.pyenv")
+    # pyenv shims are slow shell wrappers around the versions scanned below
+    yield from _path_candidates({os.path.normcase(os.path.abspath(os.path.join(pyenv_root, "shims")))})
+
+    asdf_root = os.environ.get("ASDF_DATA_DIR") or os.path.expanduser("~/.asdf")
+    env_dirs = list(_env_dirs(
+        os.path.join(pyenv_root, "versions", "*"),
+        os.path.join(asdf_root, "installs", "python", "*"),
+        "~/.virtualenvs/*",
+    ))
+    env_dirs += _conda_env_dirs()
+    for project_dir in project_dirs:
+        env_dirs += [os.path.join(project_dir, name) for name in (".venv", "venv", "env")]
+
+    for env_dir in env_dirs:
+        python = _env_python(env_dir)
+        if python:
+            yield python
+
+    if not IS_WINDOWS:
+        for pattern in ("/usr/bin/python3.*", "/usr/local/bin/python3.*"):
+            yield from (path for path in glob.glob(pattern) if INTERPRETER_NAME.match(os.path.basename(path)))
+
+
+def dedupe_key(path):
+    """Identity of an interpreter installation: the resolved binary plus the venv it belongs to"""
+    env_dir = os.path.dirname(os.path.dirname(os.path.abspath(path)))
+    venv = env_dir if os.path.isfile(os.path.join(env_dir, "pyvenv.cfg")) else None
+    return (os.path.normcase(os.path.realpath(path)), venv)
+
+
+def discover_interpreters(project_dirs=(), timeout=PROBE_TIMEOUT, max_workers=MAX_PROBE_WORKERS):
+    """Find interpreters and probe them concurrently, returning (interpreters, failures)"""
+    unique = {}
+    for path in candidate_paths(project_dirs):
+        if not (os.path.isfile(path) and os.access(path, os.X_OK)):
+            continue
+        unique.setdefault(dedupe_key(path), path)
+    paths = list(unique.values())
+    if not paths:
+        return ([], {})
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        results = list(executor.map(lambda path: interpreter_cache.get_info(path, timeout=timeout, with_packages=False), paths))
+
+    interpreters, failures, seen = [], {}, set()
+    for path, (info, return_code, error) in zip(paths, results):
+        if not info:
+            failures[path] = error
+            continue
+        # Different names (python3, python3.12) can still be the same installation
+        key = (os.path.normcase(os.path.realpath(info["executable"] or path)), info.get("prefix"))
+        if key not in seen:
+            seen.add(key)
+            interpreters.append(dict(info, path=path))
+    interpreters.sort(key=lambda info: (info["implementation"], _version_key(info["version"]), info["path"]))
+    return (interpreters, failures)
+
+
+def _version_key(version):
+    """Sort key of an interpreter version; pre-releases sort before their final release"""
+    # Interpreters built from a checkout report e.g. "3.14.0a1+"
+    return version_key(version.rstrip("+"))
@@ -0,0 +1,88 @@
+import re
+
+from src.utils.python_env import execute_python
+
+
+# "import time:       367 |       2258 |     _elementtree"
+IMPORTTIME_LINE = re.compile(r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|( *)(\S.*)$")
+
+
+def parse_importtime(stderr):
+    """Parse -X importtime output into (tree, other_stderr), with times in microseconds"""
+    pending = {}
+    other_lines = []
+    for line in stderr.splitlines(keepends=True):
+        match = IMPORTTIME_LINE.match(line.rstrip("\r\n"))
+        if not match:
+            if not line.startswith("import time: self [us]"):
+                other_lines.append(line)
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        depth = max(len(indent) - 1, 0) // 2
+        node = {
+            "name": name.strip(),
+            "self": int(self_us),
+            "cumulative": int(cumulative_us),
+            "children": pending.pop(depth + 1, []),
+        }
+        pending.setdefault(depth, []).append(node)
+    return (pending.get(0, []), "".join(other_lines))
+
+
+def flatten_tree(tree):
+    """Map module name to its self and cumulative import time"""
+    modules = {}
+    stack = list(tree)
+    while stack:
+        node = stack.pop()
+        modules.setdefault(node["name"], {"self": node["self"], "cumulative": node["cumulative"]})
+        stack.extend(node["children"])
+    return modules
+
+
+def profile_imports(python_path, script_path, timeout=None):
+    """Run a script under -X importtime and return its import tree"""
+    result = execute_python(python_path, ["-X", "importtime", script_path], timeout=timeout)
+    if result["status"] == "error":
+        return (None, -1, result["stderr"])
+    # Importtime output can be large; read it all, including any part spilled to disk
+    with result["output"] as output:
+        tree, other_stderr = parse_importtime(output.text("stderr"))
+    if not tree:
+        return (None, result["returncode"], f"No import timings reported: {other_stderr.strip()}")
+    profile = {
+        "tree": tree,
+        "modules": flatten_tree(tree),
+        "total": sum(node["cumulative"] for node in tree),
+        "returncode": result["returncode"],
+        "stderr": other_stderr,
+    }
+    return (profile, 0, None)
+
+
+def profile_imports_all(environments, script_path, timeout=None):
+    """profile_imports for each (name, python_path), one after another so imports never compete for CPU"""
+    return {name: profile_imports(python_path, script_path, timeout) for name, python_path in environments}
+
+
+def compare_imports(profiles):
+    """Compare per-module import times of (name, profile) pairs against the first, biggest regression first"""
+    if not profiles:
+        return []
+    baseline_name, baseline = profiles[0]
+    names = set()
+    for _, profile in profiles:
+        names.update(profile["modules"])
+
+    rows = []
+    for module in names:
+        times = {}
+        for name, profile in profiles:
+            timing = profile["modules"].get(module)
+            times[name] = timing
+        base = times[baseline_name]["cumulative"] if times[baseline_name] else 0
+        others = [times[name]["cumulative"] for name, _ in profiles[1:] if times[name]]
+        regression = max(others) - base if others else 0
+        rows.append({"module": module, "times": times, "regression": regression})
+    rows.sort(key=lambda row: row["regression"], reverse=True)
+    return rows
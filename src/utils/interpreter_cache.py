@@ -0,0 +1,172 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from src.utils.python_env import get_installed_packages, probe_interpreter
+
+
+MAX_ENTRIES = 64
+# Bumped when the probe changes what it reports; entries of another format are stale
+FORMAT = 2
+
+
+def cache_dir():
+    """Per-user cache directory for pyversioner"""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "pyversioner")
+
+
+def resolve_executable(python_path):
+    """Absolute path of an interpreter, looking bare names up on PATH"""
+    path = shutil.which(python_path) or python_path
+    # Symlinks are kept: venvs link to their base interpreter but have their own site-packages
+    return os.path.abspath(path)
+
+
+def is_script_wrapper(executable):
+    """Whether executable is a shell script (e.g. a pyenv shim) that may switch interpreters"""
+    try:
+        with open(executable, "rb") as f:
+            return f.read(2) == b"#!"
+    except OSError:
+        return False
+
+
+def fingerprint(paths):
+    """mtime, size and inode of each path; changes when a binary or site-packages changes"""
+    result = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            result.append([path, stat.st_mtime_ns, stat.st_size, stat.st_ino])
+        except OSError:
+            result.append([path, None, None, None])
+    return result
+
+
+class InterpreterCache:
+    """On-disk cache of interpreter facts, invalidated by executable and site-packages fingerprints"""
+    def __init__(self, path=None, max_entries=MAX_ENTRIES):
+        self.path = path or os.path.join(cache_dir(), "interpreters.json")
+        self.max_entries = max_entries
+        self._entries = None
+        self._lock = threading.RLock()
+
+    def _load(self):
+        if self._entries is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        """Write entries atomically, keeping only the most recently used ones"""
+        entries = self._load()
+        if len(entries) > self.max_entries:
+            keep = sorted(entries, key=lambda key: entries[key]["last_used"], reverse=True)[:self.max_entries]
+            self._entries = entries = {key: entries[key] for key in keep}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(temp_path, self.path)
+        except OSError:
+            # The cache is an optimization; failing to persist it is not an error
+            pass
+
+    def _fingerprint_paths(self, executable, facts):
+        info = facts.get("info") or {}
+        paths = [executable]
+        if info.get("executable"):
+            paths.append(info["executable"])
+        return paths + info.get("site_packages", [])
+
+    def lookup(self, python_path):
+        """Cached facts for the interpreter, or None when missing or stale"""
+        executable = resolve_executable(python_path)
+        with self._lock:
+            entry = self._load().get(executable)
+            if entry is None:
+                return None
+            if entry.get("format") != FORMAT or entry["fingerprint"] != fingerprint(self._fingerprint_paths(executable, entry["facts"])):
+                del self._entries[executable]
+                return None
+            entry["last_used"] = time.time()
+            return entry["facts"]
+
+    def store(self, python_path, **facts):
+        """Merge facts into the interpreter's entry and persist the cache"""
+        executable = resolve_executable(python_path)
+        if is_script_wrapper(executable):
+            return
+        with self._lock:
+            current = self.lookup(python_path) or {}
+            current.update(facts)
+            self._load()[executable] = {
+                "format": FORMAT,
+                "fingerprint": fingerprint(self._fingerprint_paths(executable, current)),
+                "last_used": time.time(),
+                "facts": current,
+            }
+            self._save()
+
+    def invalidate(self, python_path=None):
+        """Drop one interpreter's entry, or the whole cache"""
+        with self._lock:
+            if python_path is None:
+                self._entries = {}
+            else:
+                self._load().pop(resolve_executable(python_path), None)
+            self._save()
+
+    def get_info(self, python_path, timeout=None, with_packages=True):
+        """Cached interpreter facts; a cache miss probes info and packages in one process"""
+        facts = self.lookup(python_path)
+        if facts and "info" in facts:
+            return (facts["info"], 0, None)
+        data, return_code, error = probe_interpreter(python_path, packages=with_packages, timeout=timeout)
+        if not data:
+            return (None, return_code, error)
+        if data["packages"] is not None:
+            self.store(python_path, info=data["info"], packages=data["packages"])
+        else:
+            self.store(python_path, info=data["info"])
+        return (data["info"], 0, None)
+
+    def get_version(self, python_path):
+        """Cached Python version, with the same result shape as detect_python_version"""
+        info, return_code, error = self.get_info(python_path)
+        if not info:
+            return (None, return_code, error)
+        return (info["version"], 0, None)
+
+    def get_packages(self, python_path):
+        """Cached get_installed_packages"""
+        facts = self.lookup(python_path)
+        if facts and "packages" in facts:
+            return (facts["packages"], 0, None)
+        if is_script_wrapper(resolve_executable(python_path)):
+            return get_installed_packages(python_path)
+        # Info is needed first so the entry can fingerprint the site-packages directories
+        info, return_code, error = self.get_info(python_path)
+        facts = self.lookup(python_path)
+        if facts and "packages" in facts:
+            return (facts["packages"], 0, None)
+        # The probe could not read metadata (or the entry is uncacheable); use pip directly
+        packages, return_code, error = get_installed_packages(python_path)
+        if packages is not None and info:
+            self.store(python_path, packages=packages)
+        return (packages, return_code, error)
+
+
+interpreter_cache = InterpreterCache()
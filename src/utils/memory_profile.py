@@ -0,0 +1,175 @@
+import json
+import os
+import tempfile
+
+from src.utils.analysis import RELATIVE_PATHS, run_all
+from src.utils.python_env import execute_python
+
+
+EXIT_SNAPSHOT = "exit"
+TOP_SITES = 20
+# Sites kept per snapshot, so a site in one environment's top list can be found in the others
+MAX_SITES = 500
+
+# Runs inside the target interpreter: runs the script like `python script.py` under
+# tracemalloc, turning "# snapshot" / "# snapshot: label" comment lines into snapshot
+# calls (line numbers are unchanged), and writes allocation statistics as JSON.
+MEMORY_WRAPPER = """
+import json, os, re, sys, sysconfig, types
+
+out_path, script, frames, max_sites = sys.argv[1], sys.argv[2], int(sys.argv[3]), int(sys.argv[4])
+sys.argv = sys.argv[2:]
+sys.path[0] = os.path.dirname(os.path.abspath(script))
+
+try:
+    import tracemalloc
+except ImportError:
+    sys.stderr.write("tracemalloc needs Python 3.4 or later\\n")
+    sys.exit(2)
+
+""" + RELATIVE_PATHS + """
+snapshots = []
+ignore = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<string>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+def statistics(snapshot, key_type):
+    groups = {}
+    for stat in snapshot.statistics(key_type):
+        frame = stat.traceback[0]
+        key = relative(frame.filename) + (":" + str(frame.lineno) if key_type == "lineno" else "")
+        # Files that map to one relative name are merged
+        entry = groups.setdefault(key, [0, 0])
+        entry[0] += stat.size
+        entry[1] += stat.count
+    ranked = sorted(groups.items(), key=lambda item: item[1][0], reverse=True)
+    return dict(ranked[:max_sites])
+
+def take_snapshot(label):
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot().filter_traces(ignore)
+    snapshots.append({
+        "label": label,
+        "current": current,
+        "peak": peak,
+        "sites": statistics(snapshot, "lineno"),
+        "files": statistics(snapshot, "filename"),
+    })
+
+def instrument(source):
+    lines = source.splitlines(True)
+    for index, line in enumerate(lines):
+        match = re.match(r"^(\\s*)#\\s*snapshot\\s*(?::\\s*(.*?))?\\s*$", line)
+        if match:
+            label = match.group(2) or "line %d" % (index + 1)
+            lines[index] = "%s__pyversioner_snapshot__(%r)\\n" % (match.group(1), label)
+    return "".join(lines)
+
+with open(script, "rb") as f:
+    source = f.read().decode("utf-8")
+main = types.ModuleType("__main__")
+main.__file__ = script
+main.__builtins__ = __builtins__
+main.__pyversioner_snapshot__ = take_snapshot
+sys.modules["__main__"] = main
+code = compile(instrument(source), script, "exec")
+
+tracemalloc.start(frames)
+try:
+    exec(code, main.__dict__)
+finally:
+    take_snapshot("exit")
+    tracemalloc.stop()
+    with open(out_path, "w") as f:
+        json.dump(snapshots, f)
+"""
+
+
+def memory_profile_script(python_path, script_path, timeout=None, frames=1, max_sites=MAX_SITES):
+    """Run a script under tracemalloc, snapshotting at `# snapshot` comment lines and at exit"""
+    fd, stats_path = tempfile.mkstemp(prefix="pyversioner-", suffix=".json")
+    os.close(fd)
+    try:
+        result = execute_python(
+            python_path, ["-c", MEMORY_WRAPPER, stats_path, script_path, str(frames), str(max_sites)],
+            timeout=timeout
+        )
+        if result["output"] is not None:
+            result["output"].discard()
+        if result["status"] == "error":
+            return (None, -1, result["stderr"])
+        try:
+            with open(stats_path, encoding="utf-8") as f:
+                raw = json.load(f)
+        except (OSError, ValueError):
+            return (None, result["returncode"], f"No memory statistics written: {result['stderr'].strip()}")
+    finally:
+        os.remove(stats_path)
+
+    snapshots = [
+        {
+            "label": snapshot["label"],
+            "current": snapshot["current"],
+            "peak": snapshot["peak"],
+            "sites": {key: {"size": size, "count": count} for key, (size, count) in snapshot["sites"].items()},
+            "files": {key: {"size": size, "count": count} for key, (size, count) in snapshot["files"].items()},
+        }
+        for snapshot in raw
+    ]
+    profile = {
+        "snapshots": snapshots,
+        "stdout": result["stdout"],
+        "stderr": result["stderr"],
+        "returncode": result["returncode"],
+        "status": result["status"],
+    }
+    return (profile, 0, None)
+
+
+def memory_profile_all(environments, script_path, timeout=None, max_workers=4):
+    """memory_profile_script for each (name, python_path); returns name -> (profile, code, error)"""
+    return run_all(memory_profile_script, environments, script_path, timeout, max_workers=max_workers)
+
+
+def snapshot_labels(profiles):
+    """Snapshot labels present in every profile, in the order the first one took them"""
+    labels = []
+    for snapshot in profiles[0][1]["snapshots"] if profiles else []:
+        if snapshot["label"] not in labels:
+            labels.append(snapshot["label"])
+    for _, profile in profiles[1:]:
+        present = {snapshot["label"] for snapshot in profile["snapshots"]}
+        labels = [label for label in labels if label in present]
+    return labels
+
+
+def find_snapshot(profile, label):
+    """The last snapshot with a label (a marked line in a loop snapshots every pass)"""
+    matches = [snapshot for snapshot in profile["snapshots"] if snapshot["label"] == label]
+    return matches[-1] if matches else None
+
+
+def compare_snapshots(profiles, label=EXIT_SNAPSHOT, group="sites", top=TOP_SITES):
+    """Merge one snapshot's allocation stats of (name, profile) pairs, grouped by sites or files"""
+    snapshots = [(name, find_snapshot(profile, label)) for name, profile in profiles]
+    snapshots = [(name, snapshot) for name, snapshot in snapshots if snapshot]
+    if not snapshots:
+        return []
+    baseline_name = snapshots[0][0]
+    keys = set()
+    for _, snapshot in snapshots:
+        keys.update(snapshot[group])
+
+    rows = []
+    for key in keys:
+        stats = {name: snapshot[group].get(key) for name, snapshot in snapshots}
+        base_size = stats[baseline_name]["size"] if stats[baseline_name] else 0
+        growth = max(
+            ((stats[name]["size"] if stats[name] else 0) - base_size for name, _ in snapshots[1:]), default=0
+        )
+        size = max(stat["size"] for stat in stats.values() if stat)
+        rows.append({"site": key, "stats": stats, "size": size, "growth": growth})
+    rows.sort(key=lambda row: row["size"], reverse=True)
+    return rows[:top]
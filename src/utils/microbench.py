@@ -0,0 +1,268 @@
+import json
+import os
+import re
+import statistics
+import tempfile
+import textwrap
+
+from src.utils.python_env import execute_python
+
+
+# "# benchmark" or "# benchmark: name" above a function or a snippet; snippets end at "# end benchmark"
+MARKER = re.compile(r"^\s*#\s*benchmark\s*(?::\s*(?P<name>\S.*?))?\s*$", re.IGNORECASE)
+END_MARKER = re.compile(r"^\s*#\s*end\s+benchmark\s*$", re.IGNORECASE)
+FUNCTION = re.compile(r"^def\s+(?P<name>\w+)\s*\(")
+
+PROCESSES = 5
+VALUES = 3
+WARMUPS = 1
+# Calibrated loop counts make one value last at least this long (seconds)
+MIN_TIME = 0.1
+MAX_LOOPS = 2 ** 32
+
+# Two-sided 95% critical values of Student's t by degrees of freedom; 1.96 beyond
+T_CRITICAL = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262, 10: 2.228,
+    11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093,
+    20: 2.086, 21: 2.080, 22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056, 27: 2.052, 28: 2.048,
+    29: 2.045, 30: 2.042, 40: 2.021, 60: 2.000, 120: 1.980,
+}
+
+
+# Runs inside the target interpreter (2.7 included): imports the script as a
+# module, so its `if __name__ == "__main__"` block does not run, and times each
+# marked function or snippet with a calibrated number of loops per value.
+RUNNER = r"""
+import gc, json, os, sys, time, traceback, types
+
+out_path, script, config = sys.argv[1], sys.argv[2], json.loads(sys.argv[3])
+sys.argv = [script]
+sys.path[0] = os.path.dirname(os.path.abspath(script))
+timer = getattr(time, "perf_counter", time.time)
+loop_range = getattr(__builtins__, "xrange", range)
+
+module = types.ModuleType("__pyversioner_bench__")
+module.__file__ = script
+sys.modules[module.__name__] = module
+with open(script, "rb") as f:
+    exec(compile(f.read(), script, "exec"), module.__dict__)
+
+
+def make_inner(benchmark):
+    if benchmark["kind"] == "function":
+        func = getattr(module, benchmark["function"])
+
+        def inner(loops):
+            t0 = timer()
+            for _ in loop_range(loops):
+                func()
+            return timer() - t0
+        return inner
+
+    # Like timeit: the snippet runs in the loop's frame, reading the module's globals
+    source = (
+        "def inner(_loops, _timer, _range):\n"
+        "    _t0 = _timer()\n"
+        "    for _i in _range(_loops):\n"
+        + "".join("        " + line + "\n" for line in benchmark["code"].splitlines()) +
+        "    return _timer() - _t0\n"
+    )
+    namespace = {}
+    exec(compile(source, "<benchmark %s>" % benchmark["name"], "exec"), module.__dict__, namespace)
+    return lambda loops: namespace["inner"](loops, timer, loop_range)
+
+
+def calibrate(inner):
+    loops = 1
+    while loops < config["max_loops"]:
+        if inner(loops) >= config["min_time"]:
+            break
+        loops *= 2
+    return loops
+
+
+results = {}
+for benchmark in config["benchmarks"]:
+    result = results[benchmark["name"]] = {"loops": None, "values": [], "warmups": [], "error": None}
+    try:
+        inner = make_inner(benchmark)
+        loops = config["loops"].get(benchmark["name"]) or calibrate(inner)
+        result["loops"] = loops
+        for index in range(config["warmups"] + config["values"]):
+            # Collections triggered by earlier values must not land in this one
+            gc.collect()
+            per_loop = inner(loops) / loops
+            (result["warmups"] if index < config["warmups"] else result["values"]).append(per_loop)
+    except Exception:
+        result["error"] = traceback.format_exc()
+
+with open(out_path, "w") as f:
+    json.dump(results, f)
+"""
+
+
+def find_benchmarks(script_path):
+    """Functions and snippets of a script marked with `# benchmark` comment lines"""
+    with open(script_path, encoding="utf-8", errors="replace") as f:
+        lines = f.read().splitlines()
+
+    benchmarks = []
+    index = 0
+    while index < len(lines):
+        match = MARKER.match(lines[index])
+        index += 1
+        if not match:
+            continue
+        start = index
+        label = match.group("name")
+        while index < len(lines) and (not lines[index].strip() or lines[index].startswith("@")):
+            index += 1
+        function = FUNCTION.match(lines[index]) if index < len(lines) else None
+        if function:
+            benchmarks.append({
+                "name": label or function.group("name"), "kind": "function", "line": start,
+                "function": function.group("name"),
+            })
+            continue
+        end = start
+        while end < len(lines) and not END_MARKER.match(lines[end]):
+            end += 1
+        if end == len(lines):
+            raise ValueError(f"Benchmark snippet starting on line {start} has no '# end benchmark' line")
+        benchmarks.append({
+            "name": label or f"snippet at line {start + 1}", "kind": "snippet", "line": start,
+            "code": textwrap.dedent("\n".join(lines[start:end])),
+        })
+        index = end + 1
+
+    names = [benchmark["name"] for benchmark in benchmarks]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Benchmark names must be unique: {', '.join(duplicates)}")
+    return benchmarks
+
+
+def _t_critical(degrees):
+    for limit in sorted(T_CRITICAL):
+        if degrees <= limit:
+            return T_CRITICAL[limit]
+    return 1.96
+
+
+def summarize_values(values):
+    """Mean, standard deviation, median and 95% confidence interval half-width of the mean"""
+    if not values:
+        return None
+    stdev = statistics.stdev(values) if len(values) > 1 else 0.0
+    ci = _t_critical(len(values) - 1) * stdev / len(values) ** 0.5 if len(values) > 1 else None
+    return {
+        "mean": statistics.mean(values),
+        "stdev": stdev,
+        "median": statistics.median(values),
+        "min": min(values),
+        "ci": ci,
+        "values": len(values),
+    }
+
+
+def run_worker(python_path, script_path, benchmarks, loops=None, values=VALUES, warmups=WARMUPS,
+               min_time=MIN_TIME, cpu=None, timeout=None):
+    """Time marked benchmarks in one fresh process; loops maps names to loop counts, None calibrates"""
+    config = {
+        "benchmarks": benchmarks, "loops": loops or {}, "values": values, "warmups": warmups,
+        "min_time": min_time, "max_loops": MAX_LOOPS,
+    }
+    fd, out_path = tempfile.mkstemp(prefix="pyversioner-", suffix=".json")
+    os.close(fd)
+    try:
+        result = execute_python(
+            python_path, ["-c", RUNNER, out_path, script_path, json.dumps(config)], timeout=timeout, cpu=cpu
+        )
+        if result["output"] is not None:
+            result["output"].discard()
+        if result["status"] == "timeout":
+            return (None, -1, f"Benchmark worker timed out after {timeout} seconds")
+        if result["status"] == "error":
+            return (None, -1, result["stderr"])
+        try:
+            with open(out_path, encoding="utf-8") as f:
+                return (json.load(f), 0, None)
+        except (OSError, ValueError):
+            return (None, result["returncode"], f"Benchmark worker failed: {result['stderr'].strip()}")
+    finally:
+        os.remove(out_path)
+
+
+def microbenchmark(python_path, script_path, benchmarks, processes=PROCESSES, values=VALUES, warmups=WARMUPS,
+                   min_time=MIN_TIME, cpu=None, timeout=None):
+    """Time marked benchmarks across several fresh processes, with loops calibrated by the first"""
+    collected = {benchmark["name"]: [] for benchmark in benchmarks}
+    loops, errors = {}, {}
+    for _ in range(processes):
+        pending = [benchmark for benchmark in benchmarks if benchmark["name"] not in errors]
+        if not pending:
+            break
+        results, return_code, error = run_worker(
+            python_path, script_path, pending, loops, values, warmups, min_time, cpu, timeout
+        )
+        if results is None:
+            return (None, return_code, error)
+        for name, result in results.items():
+            if result["error"]:
+                errors[name] = result["error"]
+                continue
+            loops[name] = result["loops"]
+            collected[name] += result["values"]
+
+    summaries = {}
+    for name, series in collected.items():
+        if name not in errors:
+            summaries[name] = dict(summarize_values(series), loops=loops[name])
+    return ({"benchmarks": summaries, "errors": errors, "processes": processes, "cpu": cpu}, 0, None)
+
+
+def microbenchmark_all(environments, script_path, benchmarks, cpu=None, timeout=None, **options):
+    """microbenchmark for each (name, python_path), one environment after another"""
+    return {
+        name: microbenchmark(python_path, script_path, benchmarks, cpu=cpu, timeout=timeout, **options)
+        for name, python_path in environments
+    }
+
+
+def compare_microbenchmarks(results):
+    """Speedup of each benchmark against the first environment, with a 95% interval"""
+    if not results:
+        return []
+    baseline_name, baseline = results[0]
+    names = []
+    for _, result in results:
+        names += [name for name in result["benchmarks"] if name not in names]
+
+    rows = []
+    for benchmark in names:
+        stats = {name: result["benchmarks"].get(benchmark) for name, result in results}
+        base = stats[baseline_name]
+        speedups = {}
+        for name, _ in results[1:]:
+            other = stats[name]
+            if not base or not other or other["mean"] <= 0:
+                continue
+            speedup = base["mean"] / other["mean"]
+            ci = None
+            if base["ci"] is not None and other["ci"] is not None and base["mean"] > 0:
+                ci = speedup * ((base["ci"] / base["mean"]) ** 2 + (other["ci"] / other["mean"]) ** 2) ** 0.5
+            speedups[name] = {
+                "speedup": speedup,
+                "ci": ci,
+                "significant": ci is not None and abs(speedup - 1) > ci,
+            }
+        rows.append({"benchmark": benchmark, "stats": stats, "speedups": speedups})
+    return rows
+
+
+def format_duration(seconds):
+    """Human readable duration of one loop, in the largest unit that keeps it above 1"""
+    for scale, unit in ((1, "s"), (1e-3, "ms"), (1e-6, "us"), (1e-9, "ns")):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
@@ -0,0 +1,20 @@
+import hashlib
+
+
+PASSED = "passed"
+FAILED = "failed"
+TIMEOUT = "timeout"
+CANCELLED = "cancelled"
+ERROR = "error"
+
+# Outcomes that depend on the script and interpreter; the others are worth retrying
+FINISHED = (PASSED, FAILED)
+
+# Characters of stderr kept to explain a failure
+STDERR_TAIL = 2000
+
+
+def digest(text):
+    """SHA-256 of a run's output; missing output hashes like empty output"""
+    return hashlib.sha256((text or "").encode("utf-8", errors="replace")).hexdigest()
+
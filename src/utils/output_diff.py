@@ -0,0 +1,89 @@
+import difflib
+import re
+
+
+# Normalization rules: name -> (pattern, replacement)
+NORMALIZATION_RULES = {
+    "timestamps": (
+        re.compile(r"\b(?:\d{4}-\d{2}-\d{2}[T ])?\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?"),
+        "<TIMESTAMP>",
+    ),
+    "addresses": (re.compile(r"\b0x[0-9a-fA-F]+\b"), "<ADDRESS>"),
+    "paths": (re.compile(r"(?:[A-Za-z]:\\|/)(?:[\w.\-]+[\\/])+[\w.\-]*"), "<PATH>"),
+    "versions": (re.compile(r"\b\d+\.\d+(?:\.\d+)*(?:[abc]|rc|\.dev|\.post)?\d*\b"), "<VERSION>"),
+}
+
+
+def normalize_text(text, rules):
+    """Apply normalization rules (names from NORMALIZATION_RULES) to text"""
+    for name in rules:
+        pattern, replacement = NORMALIZATION_RULES[name]
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def _line_ids(lines, ids):
+    """Map lines to small integers so equal lines compare in O(1)"""
+    return [ids.setdefault(line, len(ids)) for line in lines]
+
+
+def diff_outputs(text_a, text_b, rules=()):
+    """Line diff of two outputs after normalization, running difflib only on the differing region"""
+    lines_a = text_a.splitlines()
+    lines_b = text_b.splitlines()
+    ids = {}
+    # Rules never match across newlines, so whole-text normalization keeps line numbers aligned
+    ids_a = _line_ids(normalize_text(text_a, rules).splitlines() if rules else lines_a, ids)
+    ids_b = _line_ids(normalize_text(text_b, rules).splitlines() if rules else lines_b, ids)
+
+    prefix = 0
+    limit = min(len(ids_a), len(ids_b))
+    while prefix < limit and ids_a[prefix] == ids_b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and ids_a[-1 - suffix] == ids_b[-1 - suffix]:
+        suffix += 1
+
+    opcodes = []
+    if prefix:
+        opcodes.append(("equal", 0, prefix, 0, prefix))
+    middle = difflib.SequenceMatcher(
+        None, ids_a[prefix:len(ids_a) - suffix], ids_b[prefix:len(ids_b) - suffix], autojunk=False
+    )
+    for tag, i1, i2, j1, j2 in middle.get_opcodes():
+        opcodes.append((tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix))
+    if suffix:
+        opcodes.append(("equal", len(ids_a) - suffix, len(ids_a), len(ids_b) - suffix, len(ids_b)))
+
+    removed = sum(i2 - i1 for tag, i1, i2, _, _ in opcodes if tag in ("replace", "delete"))
+    added = sum(j2 - j1 for tag, _, _, j1, j2 in opcodes if tag in ("replace", "insert"))
+    return {
+        "identical": removed == 0 and added == 0,
+        "added": added,
+        "removed": removed,
+        "opcodes": opcodes,
+        "lines_a": lines_a,
+        "lines_b": lines_b,
+    }
+
+
+def iter_diff_lines(diff, context=3):
+    """Yield (kind, text) pairs of a unified-style diff; kind is " ", "-", "+" or "@" """
+    lines_a, lines_b = diff["lines_a"], diff["lines_b"]
+    opcodes = diff["opcodes"]
+    for index, (tag, i1, i2, j1, j2) in enumerate(opcodes):
+        if tag == "equal":
+            # Keep context after the previous change and before the next one
+            lead = 0 if index == 0 else min(context, i2 - i1)
+            trail = 0 if index == len(opcodes) - 1 else min(context, i2 - i1 - lead)
+            for line in lines_a[i1:i1 + lead]:
+                yield (" ", line)
+            if i2 - i1 > lead + trail and trail:
+                yield ("@", f"@@ line {i2 - trail + 1} / {j2 - trail + 1} @@")
+            for line in lines_a[i2 - trail:i2]:
+                yield (" ", line)
+            continue
+        for line in lines_a[i1:i2]:
+            yield ("-", line)
+        for line in lines_b[j1:j2]:
+            yield ("+", line)
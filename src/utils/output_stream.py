@@ -0,0 +1,124 @@
+import codecs
+import collections
+import json
+import os
+import tempfile
+import threading
+import time
+
+
+DEFAULT_MEMORY_LIMIT = 16 * 1024 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class OutputBuffer:
+    """Interleaved stdout/stderr chunks, capped in memory and spilled to disk beyond the cap"""
+    def __init__(self, max_memory=DEFAULT_MEMORY_LIMIT, log_path=None):
+        self.max_memory = max_memory
+        self.log_path = log_path
+        self.spill_path = None
+        self.memory_size = 0
+        self.total_size = 0
+        self._chunks = collections.deque()
+        self._lock = threading.Lock()
+        self._spill_file = None
+        self._log_file = open(log_path, "w", encoding="utf-8") if log_path else None
+
+    @property
+    def spilled(self):
+        return self.spill_path is not None
+
+    def append(self, stream, text, timestamp):
+        """Record a chunk of output from stream ("stdout" or "stderr")"""
+        with self._lock:
+            self._chunks.append((timestamp, stream, text))
+            self.memory_size += len(text)
+            self.total_size += len(text)
+            if self._log_file:
+                self._log_file.write(text)
+                self._log_file.flush()
+            while self.memory_size > self.max_memory and len(self._chunks) > 1:
+                self._spill(self._chunks.popleft())
+
+    def _spill(self, chunk):
+        """Move the oldest in-memory chunk to the spill file"""
+        if self._spill_file is None:
+            self._spill_file = tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", prefix="pyversioner-", suffix=".jsonl", delete=False
+            )
+            self.spill_path = self._spill_file.name
+        timestamp, stream, text = chunk
+        self._spill_file.write(json.dumps({"t": timestamp, "stream": stream, "text": text}) + "\n")
+        self.memory_size -= len(text)
+
+    def iter_chunks(self, memory_only=False):
+        """Yield (timestamp, stream, text) chunks in arrival order"""
+        with self._lock:
+            memory_chunks = list(self._chunks)
+            if self._spill_file:
+                self._spill_file.flush()
+        if self.spill_path and not memory_only:
+            with open(self.spill_path, encoding="utf-8") as spill_file:
+                for line in spill_file:
+                    chunk = json.loads(line)
+                    yield (chunk["t"], chunk["stream"], chunk["text"])
+        yield from memory_chunks
+
+    def text(self, stream=None, memory_only=False):
+        """Join the output of one stream (or both, interleaved) into a string"""
+        return "".join(
+            text for _, chunk_stream, text in self.iter_chunks(memory_only)
+            if stream is None or chunk_stream == stream
+        )
+
+    def close(self):
+        """Close the log and spill files; the spill file stays readable on disk"""
+        with self._lock:
+            for handle in (self._log_file, self._spill_file):
+                if handle:
+                    handle.close()
+            self._log_file = self._spill_file = None
+
+    def discard(self):
+        """Close the buffer and delete its spill file; only the in-memory tail remains"""
+        self.close()
+        with self._lock:
+            if self.spill_path:
+                try:
+                    os.remove(self.spill_path)
+                except OSError:
+                    pass
+                self.spill_path = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.discard()
+
+
+def start_stream_readers(process, buffer, on_output=None, start=None):
+    """Start threads that read the process pipes incrementally into buffer"""
+    start = time.perf_counter() if start is None else start
+
+    def read(pipe, stream):
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        while True:
+            data = pipe.read(READ_CHUNK_SIZE)
+            text = decoder.decode(data or b"", final=not data)
+            if text:
+                timestamp = time.perf_counter() - start
+                buffer.append(stream, text, timestamp)
+                if on_output:
+                    on_output(stream, text, timestamp)
+            if not data:
+                break
+        pipe.close()
+
+    readers = [
+        threading.Thread(target=read, args=(process.stdout, "stdout"), daemon=True),
+        threading.Thread(target=read, args=(process.stderr, "stderr"), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    return readers
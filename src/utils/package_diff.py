@@ -0,0 +1,110 @@
+import re
+
+
+# PEP 440 version scheme, as used by packaging.version
+VERSION_PATTERN = re.compile(r"""
+    v?
+    (?:(?P<epoch>[0-9]+)!)?
+    (?P<release>[0-9]+(?:\.[0-9]+)*)
+    (?P<pre>[-_.]?(?P<pre_l>a|b|c|rc|alpha|beta|pre|preview)[-_.]?(?P<pre_n>[0-9]+)?)?
+    (?P<post>(?:-(?P<post_n1>[0-9]+))|(?:[-_.]?(?P<post_l>post|rev|r)[-_.]?(?P<post_n2>[0-9]+)?))?
+    (?P<dev>[-_.]?(?P<dev_l>dev)[-_.]?(?P<dev_n>[0-9]+)?)?
+    (?:\+(?P<local>[a-z0-9]+(?:[-_.][a-z0-9]+)*))?
+""", re.VERBOSE | re.IGNORECASE)
+
+PRE_RELEASE_ORDER = {"a": 0, "alpha": 0, "b": 1, "beta": 1, "c": 2, "rc": 2, "pre": 2, "preview": 2}
+
+ADDED = "added"
+REMOVED = "removed"
+UPGRADED = "upgraded"
+DOWNGRADED = "downgraded"
+SAME = "same"
+
+
+def normalize_name(name):
+    """Normalize a project name per PEP 503"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def version_key(version):
+    """Sort key ordering versions per PEP 440; unparsable versions sort first, as text"""
+    match = VERSION_PATTERN.fullmatch(version.strip())
+    if not match:
+        return (-1, (), (), (), (), version)
+
+    release = [int(part) for part in match.group("release").split(".")]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()
+
+    # Dev releases sort before pre-releases, which sort before the final release
+    if match.group("pre"):
+        pre = (PRE_RELEASE_ORDER[match.group("pre_l").lower()], int(match.group("pre_n") or 0))
+    elif match.group("dev") and not match.group("post"):
+        pre = (-1, 0)
+    else:
+        pre = (3, 0)
+
+    post_number = match.group("post_n1") or match.group("post_n2")
+    post = (int(post_number or 0),) if match.group("post") else (-1,)
+    dev = (int(match.group("dev_n") or 0),) if match.group("dev") else (float("inf"),)
+    local = tuple(
+        (1, int(part), "") if part.isdigit() else (0, 0, part)
+        for part in re.split(r"[-_.]", match.group("local") or "") if part
+    )
+    return (int(match.group("epoch") or 0), tuple(release), pre, post, dev, local)
+
+
+def compare_versions(a, b):
+    """Return -1, 0 or 1 when version a is lower, equal or higher than b"""
+    key_a, key_b = version_key(a), version_key(b)
+    return (key_a > key_b) - (key_a < key_b)
+
+
+def index_packages(packages):
+    """Map normalized name to (display name, version) for one environment"""
+    return {normalize_name(pkg["name"]): (pkg["name"], pkg["version"]) for pkg in packages}
+
+
+def change_status(base_version, version):
+    """How a package changed between a baseline environment and another one"""
+    if base_version is None:
+        return ADDED if version is not None else None
+    if version is None:
+        return REMOVED
+    return {-1: DOWNGRADED, 0: SAME, 1: UPGRADED}[compare_versions(version, base_version)]
+
+
+def diff_packages(environments):
+    """Diff package lists of (name, packages) pairs against the first one"""
+    if not environments:
+        return {"baseline": None, "rows": [], "summary": {}}
+
+    names = [name for name, _ in environments]
+    indexes = [index_packages(packages) for _, packages in environments]
+    baseline = names[0]
+
+    all_keys = set()
+    for index in indexes:
+        all_keys.update(index)
+
+    summary = {name: {ADDED: 0, REMOVED: 0, UPGRADED: 0, DOWNGRADED: 0, SAME: 0} for name in names[1:]}
+    rows = []
+    for key in sorted(all_keys):
+        entries = [index.get(key) for index in indexes]
+        display_name = next(entry[0] for entry in entries if entry)
+        versions = {name: entry[1] if entry else None for name, entry in zip(names, entries)}
+
+        changes = {}
+        for name in names[1:]:
+            status = change_status(versions[baseline], versions[name])
+            if status:
+                changes[name] = status
+                summary[name][status] += 1
+        rows.append({"name": display_name, "key": key, "versions": versions, "changes": changes})
+
+    return {"baseline": baseline, "rows": rows, "summary": summary}
+
+
+def has_differences(row):
+    """Whether a diff row differs in any environment"""
+    return any(status != SAME for status in row["changes"].values())
@@ -0,0 +1,112 @@
+import json
+import os
+import tempfile
+
+from src.utils.analysis import RELATIVE_PATHS
+from src.utils.python_env import execute_python
+
+
+# Runs inside the target interpreter: profiles the script like `python script.py` and
+# writes the stats as JSON, since pstats files are marshal data tied to one version
+PROFILE_WRAPPER = """
+import cProfile, json, os, pstats, runpy, sys, sysconfig
+
+out_path, script = sys.argv[1], sys.argv[2]
+sys.argv = sys.argv[2:]
+sys.path[0] = os.path.dirname(os.path.abspath(script))
+""" + RELATIVE_PATHS + """
+def dump():
+    functions = {}
+    try:
+        stats = pstats.Stats(profiler).stats
+    except TypeError:
+        stats = {}
+    for (filename, line, name), (primitive, calls, tottime, cumtime, callers) in stats.items():
+        # Same-named functions in one file (e.g. several __init__) are aggregated
+        key = relative(filename) + ":" + name
+        if key.startswith("<stdlib>/runpy.py:") or "_lsprof.Profiler" in name:
+            # Frames of this wrapper rather than of the script
+            continue
+        entry = functions.setdefault(key, [0, 0, 0.0, 0.0])
+        entry[0] += calls
+        entry[1] += primitive
+        entry[2] += tottime
+        entry[3] += cumtime
+    with open(out_path, "w") as f:
+        json.dump(functions, f)
+
+profiler = cProfile.Profile()
+try:
+    profiler.enable()
+    try:
+        runpy.run_path(script, run_name="__main__")
+    finally:
+        profiler.disable()
+finally:
+    dump()
+"""
+
+
+def profile_python_script(python_path, script_path, timeout=None):
+    """Run a script under cProfile and collect per-function statistics"""
+    fd, stats_path = tempfile.mkstemp(prefix="pyversioner-", suffix=".json")
+    os.close(fd)
+    try:
+        result = execute_python(
+            python_path, ["-c", PROFILE_WRAPPER, stats_path, script_path], timeout=timeout
+        )
+        if result["output"] is not None:
+            result["output"].discard()
+        if result["status"] == "error":
+            return (None, -1, result["stderr"])
+        try:
+            with open(stats_path, encoding="utf-8") as f:
+                raw = json.load(f)
+        except (OSError, ValueError):
+            return (None, result["returncode"], f"No profile data written: {result['stderr'].strip()}")
+    finally:
+        os.remove(stats_path)
+
+    functions = {
+        key: {"calls": calls, "primitive_calls": primitive, "tottime": tottime, "cumtime": cumtime}
+        for key, (calls, primitive, tottime, cumtime) in raw.items()
+    }
+    profile = {
+        "functions": functions,
+        "stdout": result["stdout"],
+        "stderr": result["stderr"],
+        "returncode": result["returncode"],
+        "status": result["status"],
+    }
+    return (profile, 0, None)
+
+
+def profile_all(environments, script_path, timeout=None):
+    """profile_python_script for each (name, python_path), one after another so runs never compete for CPU"""
+    return {name: profile_python_script(python_path, script_path, timeout) for name, python_path in environments}
+
+
+def compare_profiles(profiles):
+    """Merge per-function stats of (name, profile) pairs against the first, biggest regression first"""
+    if not profiles:
+        return []
+    baseline_name = profiles[0][0]
+    keys = set()
+    for _, profile in profiles:
+        keys.update(profile["functions"])
+
+    rows = []
+    for key in keys:
+        stats = {name: profile["functions"].get(key) for name, profile in profiles}
+        base = stats[baseline_name]
+        ratios = {}
+        regression = 0.0
+        for name, _ in profiles[1:]:
+            other = stats[name]
+            if base and other and base["cumtime"] > 0:
+                ratios[name] = other["cumtime"] / base["cumtime"]
+            if other:
+                regression = max(regression, other["cumtime"] - (base["cumtime"] if base else 0.0))
+        rows.append({"function": key, "stats": stats, "ratios": ratios, "regression": regression})
+    rows.sort(key=lambda row: row["regression"], reverse=True)
+    return rows
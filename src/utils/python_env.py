@@ -1,7 +1,16 @@
+import signal
 import subprocess
+import tempfile
+import threading
+import time
+import sys
+import os
 import re
 import json
 
+from src.utils.output_stream import OutputBuffer, DEFAULT_MEMORY_LIMIT, start_stream_readers
+from src.utils.resources import ResourceSampler
+
 
 def detect_python_version(python_path):
     """Get Python version from executable"""
@@ -19,8 +28,106 @@ def detect_python_version(python_path):
         return (None, -1, str(e))
 
 
+# Runs inside the target interpreter (under -I, so PYTHON* variables and the working
+# directory cannot change what it sees, while site still processes .pth files) and
+# prints one JSON document; pass --packages to include the installed distributions
+PROBE_SCRIPT = """
+import json, os, platform, site, sys, sysconfig
+
+site_packages = []
+for path in getattr(site, "getsitepackages", lambda: [])() + [sysconfig.get_paths().get(key) for key in ("purelib", "platlib")]:
+    if path and path not in site_packages:
+        site_packages.append(path)
+# -I leaves out user site-packages, which scripts run normally do see
+user_site = site.getusersitepackages()
+if not os.environ.get("PYTHONNOUSERSITE") and os.path.isdir(user_site) and user_site not in site_packages:
+    site_packages.append(user_site)
+search_path = [path for path in sys.path if path]
+search_path += [path for path in site_packages if path not in search_path and os.path.isdir(path)]
+
+jit = getattr(sys, "_jit", None)
+info = {
+    "executable": sys.executable,
+    "prefix": sys.prefix,
+    "base_prefix": getattr(sys, "base_prefix", sys.prefix),
+    "version": platform.python_version(),
+    "version_info": list(sys.version_info),
+    "version_string": sys.version,
+    "implementation": sys.implementation.name,
+    "cache_tag": sys.implementation.cache_tag,
+    "abi": sysconfig.get_config_var("SOABI") or getattr(sys, "abiflags", ""),
+    "platform": sysconfig.get_platform(),
+    "free_threaded": bool(sysconfig.get_config_var("Py_GIL_DISABLED")),
+    "gil_enabled": getattr(sys, "_is_gil_enabled", lambda: True)(),
+    "debug": hasattr(sys, "gettotalrefcount"),
+    "jit": jit.is_enabled() if jit else "_Py_JIT" in (sysconfig.get_config_var("PY_CORE_CFLAGS") or ""),
+    "sys_path": search_path,
+    "site_packages": site_packages,
+}
+
+packages = None
+if "--packages" in sys.argv:
+    try:
+        from importlib import metadata
+    except ImportError:
+        pass
+    else:
+        seen = set()
+        packages = []
+        for dist in metadata.distributions(path=search_path):
+            name = dist.metadata["Name"]
+            key = name and name.lower().replace("_", "-").replace(".", "-")
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            packages.append({
+                "name": name,
+                "version": dist.version,
+                "location": str(dist.locate_file("")),
+                "requires": dist.requires or [],
+            })
+
+print(json.dumps({"info": info, "packages": packages}))
+"""
+
+
+def probe_interpreter(python_path, packages=True, timeout=None):
+    """Collect interpreter facts (and optionally installed packages) in a single process"""
+    args = ["-c", PROBE_SCRIPT] + (["--packages"] if packages else [])
+    try:
+        result = subprocess.run(
+            [python_path, "-I", *args],
+            capture_output=True, text=True, check=False, timeout=timeout
+        )
+        if result.returncode != 0:
+            # Interpreters before 3.4 have no -I; retry without isolation
+            result = subprocess.run(
+                [python_path, *args],
+                capture_output=True, text=True, check=False, timeout=timeout
+            )
+        if result.returncode != 0:
+            return (None, result.returncode, f"Interpreter probe failed: {result.stderr.strip()}")
+        return (json.loads(result.stdout), 0, None)
+    except Exception as e:
+        return (None, -1, str(e))
+
+
+def get_interpreter_info(python_path, timeout=None):
+    """Get version, implementation, ABI, build flags, platform and paths of an interpreter"""
+    data, return_code, error = probe_interpreter(python_path, packages=False, timeout=timeout)
+    return (data["info"] if data else None, return_code, error)
+
+
 def get_installed_packages(python_path):
-    """Get installed packages list"""
+    """Get installed packages list, falling back to pip when metadata probing fails"""
+    data, return_code, error = probe_interpreter(python_path)
+    if data and data["packages"] is not None:
+        return (data["packages"], 0, None)
+    return _pip_installed_packages(python_path)
+
+
+def _pip_installed_packages(python_path):
+    """Get installed packages list from pip"""
     try:
         result = subprocess.run(
             [python_path, "-m", "pip", "list", "--format=json"], 
@@ -44,13 +151,211 @@ def get_installed_packages(python_path):
         return (None, -1, str(e))
 
 
-def run_python_script(python_path, script_path):
-    """Run Python script with specified interpreter"""
+def _pin_to_cpu(cpu):
+    """Return a preexec function pinning the child process to one CPU core"""
+    if cpu is None or not hasattr(os, "sched_setaffinity"):
+        return None
+    return lambda: os.sched_setaffinity(0, {cpu})
+
+
+def default_cpu():
+    """Core pinned runs go to: the last one this process may use, usually the least busy"""
+    if not hasattr(os, "sched_getaffinity"):
+        return None
+    return max(os.sched_getaffinity(0))
+
+
+def _unbuffered_env():
+    """Environment for streamed runs: a child writing to a pipe would otherwise block-buffer stdout"""
+    return {**os.environ, "PYTHONUNBUFFERED": "1"}
+
+
+def _peak_rss_bytes(ru_maxrss):
+    """Normalize ru_maxrss to bytes (kilobytes on Linux, bytes on macOS)"""
+    return ru_maxrss if sys.platform == "darwin" else ru_maxrss * 1024
+
+
+def _start_reaper(process, usage):
+    """Reap the child with wait4 on a thread, recording its CPU time and peak RSS (None without wait4)"""
+    if not hasattr(os, "wait4"):
+        return None
+
+    def reap():
+        try:
+            _, status, rusage = os.wait4(process.pid, 0)
+        except ChildProcessError:
+            return
+        process.returncode = os.waitstatus_to_exitcode(status)
+        usage.update(user=rusage.ru_utime, sys=rusage.ru_stime, peak_rss=_peak_rss_bytes(rusage.ru_maxrss))
+
+    reaper = threading.Thread(target=reap, daemon=True)
+    reaper.start()
+    return reaper
+
+
+def _kill(process, reaper):
+    if reaper is None:
+        process.kill()
+        process.wait()
+        return
+    # Popen.kill polls the child first, which would race the reaper for its exit status
+    if reaper.is_alive():
+        try:
+            os.kill(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    reaper.join()
+
+
+def execute_python(python_path, args, timeout=None, cancel_event=None, cpu=None,
+                   on_output=None, max_memory=DEFAULT_MEMORY_LIMIT, log_path=None, poll_interval=0.1,
+                   sample_interval=None):
+    """Run interpreter with arguments, streaming output and supporting timeout, cancellation and CPU pinning"""
+    result = {
+        "stdout": None, "stderr": None, "returncode": -1, "status": "error", "wall": None, "output": None,
+        "resources": None,
+    }
+    buffer = None
     try:
-        result = subprocess.run(
-            [str(python_path), str(script_path)], 
-            capture_output=True, text=True, check=False
+        buffer = OutputBuffer(max_memory=max_memory, log_path=log_path)
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [str(python_path), *[str(arg) for arg in args]],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=0,
+            preexec_fn=_pin_to_cpu(cpu), env=_unbuffered_env()
         )
-        return (result.stdout, result.stderr, result.returncode)
+        readers = start_stream_readers(process, buffer, on_output, start)
+        sampler = ResourceSampler(process.pid, sample_interval, start).start() if sample_interval else None
+        usage = {"user": None, "sys": None, "peak_rss": None}
+        reaper = _start_reaper(process, usage)
+        
+        status = "completed"
+        while True:
+            wait = poll_interval if cancel_event is not None else None
+            if timeout is not None:
+                remaining = max(timeout - (time.perf_counter() - start), 0)
+                wait = remaining if wait is None else min(wait, remaining)
+            if reaper is not None:
+                reaper.join(timeout=wait)
+                if not reaper.is_alive():
+                    break
+            else:
+                try:
+                    process.wait(timeout=wait)
+                    break
+                except subprocess.TimeoutExpired:
+                    pass
+            if cancel_event is not None and cancel_event.is_set():
+                status = "cancelled"
+            elif timeout is not None and time.perf_counter() - start >= timeout:
+                status = "timeout"
+            else:
+                continue
+            _kill(process, reaper)
+            break
+        
+        wall = time.perf_counter() - start
+        if process.returncode is None:
+            # The reaper lost the exit status to a concurrent poll
+            process.wait()
+        for reader in readers:
+            reader.join()
+        buffer.close()
+        usage["samples"] = sampler.stop() if sampler else []
+        
+        # Only the in-memory tail is returned as text; spilled output stays on disk
+        result.update(
+            stdout=buffer.text("stdout", memory_only=True), stderr=buffer.text("stderr", memory_only=True),
+            returncode=process.returncode, status=status, wall=wall, output=buffer, resources=usage
+        )
+    except Exception as e:
+        if buffer:
+            buffer.discard()
+        result["stderr"] = str(e)
+    return result
+
+
+def run_python_script(python_path, script_path, timeout=None, cancel_event=None):
+    """Run Python script with specified interpreter"""
+    result = execute_python(python_path, [script_path], timeout=timeout, cancel_event=cancel_event)
+    if result["output"] is not None:
+        result["output"].discard()
+    if result["status"] == "error":
+        return (None, result["stderr"], -1)
+    if result["status"] == "timeout":
+        return (result["stdout"], result["stderr"] + f"\nProcess timed out after {timeout} seconds", -1)
+    if result["status"] == "cancelled":
+        return (result["stdout"], result["stderr"] + "\nProcess cancelled", -1)
+    return (result["stdout"], result["stderr"], result["returncode"])
+
+
+def time_python_script(python_path, script_path, timeout=None, sample_interval=None):
+    """Run Python script once and measure wall time, CPU time and peak memory"""
+    try:
+        with tempfile.TemporaryFile() as out_file, tempfile.TemporaryFile() as err_file:
+            start = time.perf_counter()
+            process = subprocess.Popen(
+                [str(python_path), str(script_path)],
+                stdout=out_file, stderr=err_file
+            )
+            sampler = ResourceSampler(process.pid, sample_interval, start).start() if sample_interval else None
+            use_wait4 = hasattr(os, "wait4")
+            lock = threading.Lock()
+            state = {"reaped": False, "timed_out": False}
+            
+            def kill():
+                with lock:
+                    if state["reaped"]:
+                        return
+                    state["timed_out"] = True
+                    if not use_wait4:
+                        process.kill()
+                        return
+                    # Popen.kill polls the child first, which would race wait4 for its exit status
+                    try:
+                        os.kill(process.pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+            
+            # wait4 cannot time out, so a timer kills the child instead
+            timer = threading.Timer(timeout, kill) if timeout else None
+            if timer:
+                timer.start()
+            user_time = sys_time = peak_rss = None
+            try:
+                if use_wait4:
+                    if hasattr(os, "waitid"):
+                        # Wait without reaping: the pid cannot be reused until the flag is set
+                        os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOWAIT)
+                        with lock:
+                            state["reaped"] = True
+                    # Without waitid (macOS before 3.13) the kill can only be stopped once wait4 returns
+                    _, status, usage = os.wait4(process.pid, 0)
+                    with lock:
+                        state["reaped"] = True
+                    wall_time = time.perf_counter() - start
+                    process.returncode = os.waitstatus_to_exitcode(status)
+                    user_time, sys_time = usage.ru_utime, usage.ru_stime
+                    peak_rss = _peak_rss_bytes(usage.ru_maxrss)
+                else:
+                    process.wait()
+                    wall_time = time.perf_counter() - start
+                    with lock:
+                        state["reaped"] = True
+            finally:
+                if timer:
+                    timer.cancel()
+                samples = sampler.stop() if sampler else None
+            timed_out = state["timed_out"]
+
+            out_file.seek(0)
+            err_file.seek(0)
+            stdout = out_file.read().decode(errors="replace")
+            stderr = err_file.read().decode(errors="replace")
+
+        timing = {"wall": wall_time, "user": user_time, "sys": sys_time, "peak_rss": peak_rss, "timed_out": timed_out}
+        if samples is not None:
+            timing["samples"] = samples
+        return (stdout, stderr, process.returncode, timing)
     except Exception as e:
-        return (None, str(e), -1)
+        return (None, str(e), -1, None)
@@ -0,0 +1,102 @@
+import os
+import threading
+import time
+
+
+DEFAULT_SAMPLE_INTERVAL = 0.1
+PROC_ROOT = "/proc"
+
+
+def sampling_supported():
+    """Whether per-process sampling through /proc is available"""
+    return os.path.isdir(os.path.join(PROC_ROOT, "self"))
+
+
+def _read_cpu_seconds(pid):
+    """User plus system CPU seconds of a process from /proc/<pid>/stat"""
+    with open(os.path.join(PROC_ROOT, str(pid), "stat"), encoding="ascii", errors="replace") as f:
+        # The command name may contain spaces; fields restart after the closing parenthesis
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def _read_status(pid):
+    """RSS in bytes and thread count from /proc/<pid>/status"""
+    rss = threads = None
+    with open(os.path.join(PROC_ROOT, str(pid), "status"), encoding="ascii", errors="replace") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                rss = int(line.split()[1]) * 1024
+            elif line.startswith("Threads:"):
+                threads = int(line.split()[1])
+    return (rss, threads)
+
+
+def _count_fds(pid):
+    try:
+        return len(os.listdir(os.path.join(PROC_ROOT, str(pid), "fd")))
+    except OSError:
+        return None
+
+
+class ResourceSampler:
+    """Samples CPU %, RSS, thread count and open file descriptors of a process on a thread"""
+    def __init__(self, pid, interval=DEFAULT_SAMPLE_INTERVAL, start=None):
+        self.pid = pid
+        self.interval = interval
+        self.start_time = time.perf_counter() if start is None else start
+        self.samples = []
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        if sampling_supported():
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop sampling and return the samples"""
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        return self.samples
+
+    def _run(self):
+        last_cpu = last_time = None
+        while not self._stop_event.is_set():
+            try:
+                now = time.perf_counter()
+                cpu = _read_cpu_seconds(self.pid)
+                rss, threads = _read_status(self.pid)
+                fds = _count_fds(self.pid)
+            except (OSError, IndexError, ValueError):
+                # Process exited (or became a zombie without status)
+                break
+            cpu_percent = None
+            if last_time is not None and now > last_time:
+                cpu_percent = 100.0 * (cpu - last_cpu) / (now - last_time)
+            last_cpu, last_time = cpu, now
+            self.samples.append({
+                "t": now - self.start_time,
+                "cpu_percent": cpu_percent,
+                "rss": rss,
+                "threads": threads,
+                "fds": fds,
+            })
+            self._stop_event.wait(self.interval)
+
+
+def summarize_samples(samples):
+    """Peak and average values of a sample series"""
+    def values(key):
+        return [sample[key] for sample in samples if sample[key] is not None]
+
+    cpu, rss, threads, fds = values("cpu_percent"), values("rss"), values("threads"), values("fds")
+    return {
+        "samples": len(samples),
+        "peak_rss": max(rss) if rss else None,
+        "mean_cpu_percent": sum(cpu) / len(cpu) if cpu else None,
+        "peak_cpu_percent": max(cpu) if cpu else None,
+        "peak_threads": max(threads) if threads else None,
+        "peak_fds": max(fds) if fds else None,
+    }
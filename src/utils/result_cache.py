@@ -0,0 +1,227 @@
+import ast
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from src.utils.interpreter_cache import (
+    cache_dir, fingerprint, interpreter_cache, is_script_wrapper, resolve_executable,
+)
+
+
+# Bump when the layout of cached values changes
+CACHE_VERSION = 1
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+# Results with more output than this are not worth keeping
+MAX_ENTRY_BYTES = 4 * 1024 * 1024
+
+
+def _module_files(directory, dotted):
+    """Files of a dotted module name and its parent packages under directory"""
+    files = []
+    parts = dotted.split(".")
+    for depth in range(1, len(parts) + 1):
+        base = os.path.join(directory, *parts[:depth])
+        for candidate in (base + ".py", os.path.join(base, "__init__.py")):
+            if os.path.isfile(candidate):
+                files.append(candidate)
+                break
+        else:
+            break
+    return files
+
+
+def _imported_names(tree, package_dir, root):
+    """Dotted names (relative to root) a module's import statements may load"""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield alias.name
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                # Relative import: resolve against the importing file's package
+                base = package_dir
+                for _ in range(node.level - 1):
+                    base = os.path.dirname(base)
+                prefix = os.path.relpath(base, root).replace(os.sep, ".")
+                module = ".".join(part for part in (prefix if prefix != "." else "", node.module or "") if part)
+            else:
+                module = node.module or ""
+            if module:
+                yield module
+            # `from package import submodule` loads a module too
+            for alias in node.names:
+                yield f"{module}.{alias.name}" if module else alias.name
+
+
+def local_imports(script_path):
+    """Modules next to the script that it imports, directly or through each other"""
+    root = os.path.dirname(os.path.abspath(script_path))
+    seen = set()
+    pending = [os.path.abspath(script_path)]
+    while pending:
+        path = pending.pop()
+        try:
+            with open(path, "rb") as f:
+                tree = ast.parse(f.read(), filename=path)
+        except (OSError, SyntaxError, ValueError):
+            continue
+        for name in _imported_names(tree, os.path.dirname(path), root):
+            for module_path in _module_files(root, name):
+                if module_path not in seen:
+                    seen.add(module_path)
+                    pending.append(module_path)
+    seen.discard(os.path.abspath(script_path))
+    return sorted(seen)
+
+
+def script_digest(script_path):
+    """Hash of the script and the local modules it imports"""
+    root = os.path.dirname(os.path.abspath(script_path))
+    digest = hashlib.sha256()
+    for path in [os.path.abspath(script_path)] + local_imports(script_path):
+        digest.update(os.path.relpath(path, root).encode("utf-8") + b"\0")
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+def package_set_digest(packages):
+    """Hash of an environment's installed distributions"""
+    pairs = sorted((package["name"].lower(), package["version"]) for package in packages)
+    return hashlib.sha256(json.dumps(pairs).encode("utf-8")).hexdigest()
+
+
+def environment_identity(python_path):
+    """Hashes identifying an interpreter binary and its package set, or None for shims"""
+    executable = resolve_executable(python_path)
+    if is_script_wrapper(executable):
+        return None
+    info, return_code, error = interpreter_cache.get_info(python_path)
+    packages, return_code, error = interpreter_cache.get_packages(python_path)
+    if not info or packages is None:
+        return None
+    # Timestamps identify the binary; its path is part of it so venvs stay apart.
+    # Entries cached by older versions have no version_string.
+    interpreter = json.dumps([info.get("version_string", info["version"]), fingerprint([executable, info["executable"]])])
+    return {
+        "interpreter": hashlib.sha256(interpreter.encode("utf-8")).hexdigest(),
+        "packages": package_set_digest(packages),
+        "version": info["version"],
+    }
+
+
+class ResultCache:
+    """Content-addressed store of run results with size-bounded LRU eviction"""
+    def __init__(self, directory=None, max_bytes=MAX_CACHE_BYTES):
+        self.directory = directory or os.path.join(cache_dir(), "results")
+        self.max_bytes = max_bytes
+        self._size = None
+        self._lock = threading.Lock()
+
+    def key(self, python_path, script_path, variant=None):
+        """Cache key of running script_path with python_path and variant settings, or None when uncacheable"""
+        environment = environment_identity(python_path)
+        if not environment:
+            return None
+        try:
+            identity = {
+                "version": CACHE_VERSION,
+                "script": script_digest(script_path),
+                "interpreter": environment["interpreter"],
+                "packages": environment["packages"],
+                "variant": variant,
+            }
+        except OSError:
+            return None
+        return hashlib.sha256(json.dumps(identity, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key):
+        """Cached value for key, or None"""
+        if not key:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+            # Reads refresh the mtime, which orders eviction
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return entry["value"]
+
+    def put(self, key, value):
+        """Store a value; entries too large to be worth caching are skipped"""
+        if not key:
+            return
+        data = json.dumps({"created": time.time(), "value": value}).encode("utf-8")
+        if len(data) > MAX_ENTRY_BYTES:
+            return
+        path = self._path(key)
+        with self._lock:
+            try:
+                # A refreshed entry (e.g. --force) replaces the old one, which no longer counts
+                replaced = os.path.getsize(path)
+            except OSError:
+                replaced = 0
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+            except OSError:
+                # The cache is an optimization; failing to persist it is not an error
+                return
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data) - replaced
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        """Remove least recently used entries until the cache is back under its limit"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self._size = total
+
+    def clear(self):
+        with self._lock:
+            for _, _, path in self._entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._size = 0
+
+
+result_cache = ResultCache()
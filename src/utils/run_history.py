@@ -0,0 +1,249 @@
+import os
+import sqlite3
+import statistics
+import threading
+import time
+
+from src.utils.interpreter_cache import cache_dir
+from src.utils.outcomes import digest
+from src.utils.resources import summarize_samples
+from src.utils.result_cache import environment_identity, script_digest
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started REAL NOT NULL,
+    source TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    script_path TEXT NOT NULL,
+    script_hash TEXT NOT NULL,
+    python_path TEXT NOT NULL,
+    python_version TEXT,
+    interpreter_hash TEXT NOT NULL,
+    packages_hash TEXT,
+    status TEXT NOT NULL,
+    returncode INTEGER,
+    wall REAL,
+    user REAL,
+    sys REAL,
+    peak_rss INTEGER,
+    peak_cpu_percent REAL,
+    peak_threads INTEGER,
+    peak_fds INTEGER,
+    stdout_sha256 TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_by_script ON runs (script_hash, interpreter_hash, mode, id);
+CREATE INDEX IF NOT EXISTS runs_by_interpreter ON runs (interpreter_hash, id);
+CREATE INDEX IF NOT EXISTS runs_by_path ON runs (script_path, id);
+"""
+
+COLUMNS = (
+    "started", "source", "mode", "script_path", "script_hash", "python_path", "python_version",
+    "interpreter_hash", "packages_hash", "status", "returncode", "wall", "user", "sys", "peak_rss",
+    "peak_cpu_percent", "peak_threads", "peak_fds", "stdout_sha256",
+)
+
+REGRESSION = "regression"
+IMPROVEMENT = "improvement"
+STEADY = "steady"
+
+# Baseline runs needed before a change can be told apart from noise
+MIN_HISTORY = 5
+# Earlier runs that form the baseline
+HISTORY_WINDOW = 50
+# Robust z-score beyond which a median has moved
+Z_THRESHOLD = 3.0
+# Smaller relative changes are not worth flagging however consistent they are
+MIN_CHANGE = 0.05
+# MAD of very stable timings can be zero; assume at least this much relative noise
+MIN_RELATIVE_SPREAD = 0.01
+
+
+def detect_regression(baseline, recent, threshold=Z_THRESHOLD, min_change=MIN_CHANGE, min_history=MIN_HISTORY):
+    """Compare the median of recent wall times with the median of their baseline, or None without enough history"""
+    baseline = [value for value in baseline if value is not None]
+    recent = [value for value in recent if value is not None]
+    if len(baseline) < min_history or not recent:
+        return None
+
+    baseline_median = statistics.median(baseline)
+    recent_median = statistics.median(recent)
+    mad = statistics.median(abs(value - baseline_median) for value in baseline)
+    sigma = max(1.4826 * mad, MIN_RELATIVE_SPREAD * baseline_median)
+    standard_error = 1.2533 * sigma / len(recent) ** 0.5
+    z = (recent_median - baseline_median) / standard_error if standard_error > 0 else 0.0
+    change = (recent_median - baseline_median) / baseline_median if baseline_median > 0 else 0.0
+
+    status = STEADY
+    if z > threshold and change > min_change:
+        status = REGRESSION
+    elif z < -threshold and change < -min_change:
+        status = IMPROVEMENT
+    return {
+        "status": status,
+        "baseline_median": baseline_median,
+        "baseline_mad": mad,
+        "baseline_runs": len(baseline),
+        "median": recent_median,
+        "runs": len(recent),
+        "change": change,
+        "z": z,
+    }
+
+
+def format_regression(check):
+    """One line describing a detect_regression result"""
+    if not check:
+        return "Not enough history to detect regressions yet."
+    verdict = {
+        REGRESSION: "Slower than usual",
+        IMPROVEMENT: "Faster than usual",
+        STEADY: "In line with history",
+    }[check["status"]]
+    text = (
+        f"{verdict}: median {check['median'] * 1000:.1f} ms vs {check['baseline_median'] * 1000:.1f} ms "
+        f"over {check['baseline_runs']} earlier runs ({check['change']:+.1%}, z={check['z']:.1f})"
+    )
+    if check.get("packages_changed"):
+        text += "; installed packages changed since"
+    return text
+
+
+class RunHistory:
+    """SQLite store of every run: what ran (script, interpreter, packages) and how it went"""
+    def __init__(self, path=None):
+        self.path = path or os.path.join(cache_dir(), "history.sqlite3")
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._connection is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            # Shared between worker threads; every use holds the lock
+            connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            # WAL lets the CLI and the GUI write to one history at the same time
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _insert(self, rows):
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                ids = []
+                for row in rows:
+                    cursor = connection.execute(
+                        f"INSERT INTO runs ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                        [row.get(column) for column in COLUMNS],
+                    )
+                    ids.append(cursor.lastrowid)
+        return ids
+
+    def _query(self, sql, parameters=()):
+        with self._lock:
+            return [dict(row) for row in self._connect().execute(sql, parameters)]
+
+    def record(self, python_path, script_path, measurements, source="run", mode="cold"):
+        """Store the runs of one script with one interpreter, returning the rows written"""
+        environment = environment_identity(python_path)
+        if not environment:
+            return []
+        try:
+            script_hash = script_digest(script_path)
+        except OSError:
+            return []
+
+        rows = []
+        for measurement in measurements:
+            resources = summarize_samples(measurement.get("samples") or [])
+            stdout_sha256 = measurement.get("stdout_sha256")
+            if not stdout_sha256 and measurement.get("stdout") is not None:
+                stdout_sha256 = digest(measurement["stdout"])
+            rows.append({
+                "started": measurement.get("started", time.time()),
+                "source": source,
+                "mode": mode,
+                "script_path": os.path.abspath(script_path),
+                "script_hash": script_hash,
+                "python_path": python_path,
+                "python_version": environment["version"],
+                "interpreter_hash": environment["interpreter"],
+                "packages_hash": environment["packages"],
+                "status": measurement["status"],
+                "returncode": measurement.get("returncode"),
+                "wall": measurement.get("wall"),
+                "user": measurement.get("user"),
+                "sys": measurement.get("sys"),
+                "peak_rss": measurement.get("peak_rss"),
+                "peak_cpu_percent": resources["peak_cpu_percent"],
+                "peak_threads": resources["peak_threads"],
+                "peak_fds": resources["peak_fds"],
+                "stdout_sha256": stdout_sha256,
+            })
+        for row, row_id in zip(rows, self._insert(rows)):
+            row["id"] = row_id
+        return rows
+
+    def record_result(self, python_path, script_path, result, source="run"):
+        """Store an execute_python result"""
+        resources = result.get("resources") or {}
+        output = result.get("output")
+        return self.record(python_path, script_path, [{
+            "status": result["status"],
+            "returncode": result["returncode"],
+            "wall": result["wall"],
+            "user": resources.get("user"),
+            "sys": resources.get("sys"),
+            "peak_rss": resources.get("peak_rss"),
+            "samples": resources.get("samples"),
+            # Hash the full output, including any part spilled to disk
+            "stdout": output.text("stdout") if output is not None else result.get("stdout"),
+        }], source=source)
+
+    def check(self, rows, window=HISTORY_WINDOW, **thresholds):
+        """Regression check of freshly recorded rows against the successful runs before them"""
+        recent = [row for row in rows if row["status"] == "completed" and row["returncode"] == 0]
+        if not recent:
+            return None
+        first = recent[0]
+        baseline = self._query(
+            "SELECT wall, packages_hash FROM runs"
+            " WHERE script_hash = ? AND interpreter_hash = ? AND mode = ? AND id < ?"
+            " AND status = 'completed' AND returncode = 0 AND wall IS NOT NULL"
+            " ORDER BY id DESC LIMIT ?",
+            (first["script_hash"], first["interpreter_hash"], first["mode"], min(row["id"] for row in recent), window),
+        )
+        result = detect_regression([row["wall"] for row in baseline], [row["wall"] for row in recent], **thresholds)
+        if result:
+            result["packages_changed"] = baseline[0]["packages_hash"] != first["packages_hash"]
+        return result
+
+    def runs(self, script_path=None, python_path=None, limit=500):
+        """Most recent runs first, optionally only those of one script or interpreter path"""
+        conditions, parameters = [], []
+        if script_path:
+            conditions.append("script_path = ?")
+            parameters.append(os.path.abspath(script_path))
+        if python_path:
+            conditions.append("python_path = ?")
+            parameters.append(python_path)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self._query(f"SELECT * FROM runs{where} ORDER BY id DESC LIMIT ?", (*parameters, limit))
+
+    def clear(self):
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM runs")
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+run_history = RunHistory()
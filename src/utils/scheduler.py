@@ -0,0 +1,84 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.python_env import default_cpu, execute_python
+from src.utils.output_stream import DEFAULT_MEMORY_LIMIT
+
+
+SERIAL_PINNED = "serial-pinned"
+
+
+def default_concurrency():
+    """Default number of parallel runs, leaving one core for the UI"""
+    return max((os.cpu_count() or 2) - 1, 1)
+
+
+def _safe_filename(name):
+    """Turn an environment name into a file name"""
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+
+
+class RunScheduler:
+    """Run one script across many Python environments on a bounded worker pool"""
+    def __init__(self, concurrency=None, timeout=None, pin_cpu=None, max_memory=DEFAULT_MEMORY_LIMIT, log_dir=None,
+                 sample_interval=None):
+        if concurrency == SERIAL_PINNED:
+            # Fair timing: one run at a time, always on the same core (one the affinity mask allows)
+            concurrency = 1
+            pin_cpu = default_cpu() if pin_cpu is None else pin_cpu
+        self.concurrency = concurrency or default_concurrency()
+        self.timeout = timeout
+        self.pin_cpu = pin_cpu
+        self.max_memory = max_memory
+        self.log_dir = log_dir
+        self.sample_interval = sample_interval
+        self._cancel_event = threading.Event()
+        self._executor = None
+        self._futures = []
+
+    def run(self, environments, script_path, on_start=None, on_output=None, on_result=None):
+        """Schedule script_path for each (name, python_path) pair, returning futures"""
+        self.shutdown()
+        self._cancel_event = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="pyversioner-run")
+        cancel_event = self._cancel_event
+
+        def task(name, python_path):
+            if cancel_event.is_set():
+                result = {"stdout": "", "stderr": "", "returncode": -1, "status": "cancelled", "wall": None, "output": None,
+                          "resources": None}
+            else:
+                if on_start:
+                    on_start(name)
+                result = execute_python(
+                    python_path, [script_path],
+                    timeout=self.timeout, cancel_event=cancel_event, cpu=self.pin_cpu,
+                    on_output=(lambda stream, text, timestamp: on_output(name, stream, text, timestamp)) if on_output else None,
+                    max_memory=self.max_memory,
+                    log_path=os.path.join(self.log_dir, f"{_safe_filename(name)}.log") if self.log_dir else None,
+                    sample_interval=self.sample_interval
+                )
+            result["name"] = name
+            result["python_path"] = python_path
+            if on_result:
+                on_result(name, result)
+            return result
+
+        self._futures = [self._executor.submit(task, name, path) for name, path in environments]
+        return list(self._futures)
+
+    def cancel(self):
+        """Cancel queued runs and kill the running ones"""
+        # Queued tasks see the event and report themselves as cancelled
+        self._cancel_event.set()
+
+    def wait(self):
+        """Block until all scheduled runs finish and return their results"""
+        return [future.result() for future in self._futures]
+
+    def shutdown(self):
+        """Release the worker pool without waiting for running tasks"""
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
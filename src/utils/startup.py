@@ -0,0 +1,115 @@
+import re
+import subprocess
+import time
+
+from src.utils.microbench import summarize_values
+from src.utils.python_env import _pin_to_cpu, detect_python_version
+
+
+WARMUP = 3
+MIN_RUNS = 10
+MAX_RUNS = 100
+# Stop repeating once the 95% confidence interval of every mean is this tight
+TARGET_CI = 0.05
+RUN_TIMEOUT = 30
+MODULE_NAME = re.compile(r"^[A-Za-z_]\w*(\.[A-Za-z_]\w*)*$")
+
+# key, label, interpreter arguments, first version supporting them
+VARIANTS = (
+    ("default", "python -c pass", ["-c", "pass"], None),
+    ("no_site", "-S", ["-S", "-c", "pass"], None),
+    ("isolated", "-I", ["-I", "-c", "pass"], (3, 4)),
+    ("isolated_no_site", "-I -S", ["-I", "-S", "-c", "pass"], (3, 4)),
+    ("frozen_on", "-X frozen_modules=on", ["-X", "frozen_modules=on", "-c", "pass"], (3, 11)),
+    ("frozen_off", "-X frozen_modules=off", ["-X", "frozen_modules=off", "-c", "pass"], (3, 11)),
+)
+
+
+def startup_variants(version_info, modules=()):
+    """Command lines worth timing for an interpreter, as dicts with key, label and args"""
+    variants = [
+        {"key": key, "label": label, "args": args}
+        for key, label, args, minimum in VARIANTS
+        if minimum is None or tuple(version_info[:2]) >= minimum
+    ]
+    invalid = [module for module in modules if not MODULE_NAME.match(module)]
+    if invalid:
+        raise ValueError(f"Not a module name: {', '.join(invalid)}")
+    if modules:
+        statement = "import " + ", ".join(modules)
+        variants.append({"key": "imports", "label": statement, "args": ["-c", statement]})
+    return variants
+
+
+def time_startup(python_path, args, cpu=None, timeout=RUN_TIMEOUT):
+    """Wall time of one interpreter launch, returning (seconds, returncode, stderr)"""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [str(python_path), *args], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE, timeout=timeout, preexec_fn=_pin_to_cpu(cpu), check=False
+    )
+    return (time.perf_counter() - start, result.returncode, result.stderr.decode(errors="replace"))
+
+
+def measure_startup(python_path, modules=(), warmup=WARMUP, min_runs=MIN_RUNS, max_runs=MAX_RUNS,
+                    target_ci=TARGET_CI, cpu=None, timeout=RUN_TIMEOUT):
+    """Time interpreter startup under each variant, round-robin, until the means are stable"""
+    # `--version` answers on every interpreter; the JSON probe needs 3.x
+    version, return_code, error = detect_python_version(python_path)
+    if not version:
+        return (None, return_code, error)
+    try:
+        variants = startup_variants([int(part) for part in version.split(".")], modules)
+    except ValueError as e:
+        return (None, -1, str(e))
+    times = {variant["key"]: [] for variant in variants}
+    errors = {}
+
+    try:
+        for round_index in range(warmup + max_runs):
+            for variant in variants:
+                if variant["key"] in errors:
+                    continue
+                seconds, returncode, stderr = time_startup(python_path, variant["args"], cpu, timeout)
+                if returncode != 0:
+                    errors[variant["key"]] = stderr.strip() or f"Exited with code {returncode}"
+                elif round_index >= warmup:
+                    times[variant["key"]].append(seconds)
+            runs = round_index + 1 - warmup
+            if runs >= min_runs and all(
+                _is_stable(summarize_values(values), target_ci) for key, values in times.items() if key not in errors
+            ):
+                break
+    except subprocess.TimeoutExpired:
+        return (None, -1, f"Interpreter did not start within {timeout} seconds")
+    except OSError as e:
+        return (None, -1, str(e))
+
+    for variant in variants:
+        variant["summary"] = summarize_values(times[variant["key"]]) if variant["key"] not in errors else None
+        variant["error"] = errors.get(variant["key"])
+    return ({"version": version, "variants": variants}, 0, None)
+
+
+def _is_stable(summary, target_ci):
+    return summary is not None and summary["ci"] is not None and summary["ci"] <= target_ci * summary["mean"]
+
+
+def measure_startup_all(environments, modules=(), **options):
+    """measure_startup for each (name, python_path), one after another so launches never overlap"""
+    return {name: measure_startup(python_path, modules, **options) for name, python_path in environments}
+
+
+def rank_startup(results):
+    """Every measured (environment, variant) pair, fastest median first"""
+    rows = [
+        {"environment": name, "version": result["version"], "variant": variant["key"], "label": variant["label"],
+         "summary": variant["summary"]}
+        for name, result in results for variant in result["variants"] if variant["summary"]
+    ]
+    rows.sort(key=lambda row: row["summary"]["median"])
+    if rows:
+        fastest = rows[0]["summary"]["median"]
+        for row in rows:
+            row["relative"] = row["summary"]["median"] / fastest if fastest > 0 else None
+    return rows
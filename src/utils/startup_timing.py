@@ -0,0 +1,54 @@
+import os
+import sys
+import time
+
+
+# Seconds from process start until the window is painted and every interpreter probed
+STARTUP_BUDGET = 0.5
+BUDGET_VARIABLE = "PYVERSIONER_STARTUP_BUDGET"
+# Set to print the report even when startup is within budget
+REPORT_VARIABLE = "PYVERSIONER_STARTUP_REPORT"
+
+
+def startup_budget():
+    """Startup budget in seconds, overridable through PYVERSIONER_STARTUP_BUDGET"""
+    try:
+        return float(os.environ[BUDGET_VARIABLE])
+    except (KeyError, ValueError):
+        return STARTUP_BUDGET
+
+
+class StartupTimer:
+    """Timestamps of the application's startup phases, reported when over budget"""
+    def __init__(self, started=None, budget=None):
+        self.started = time.perf_counter() if started is None else started
+        self.budget = startup_budget() if budget is None else budget
+        self.marks = []
+        self.reported = False
+
+    def mark(self, name):
+        """Record that a phase has just completed"""
+        self.marks.append((name, time.perf_counter()))
+
+    @property
+    def elapsed(self):
+        """Seconds from start to the last mark"""
+        return self.marks[-1][1] - self.started if self.marks else 0.0
+
+    def format_report(self):
+        lines = [f"Startup took {self.elapsed * 1000:.0f} ms (budget {self.budget * 1000:.0f} ms):"]
+        previous = self.started
+        for name, timestamp in self.marks:
+            lines.append(
+                f"  {name:<24} {(timestamp - previous) * 1000:8.1f} ms  {(timestamp - self.started) * 1000:8.1f} ms"
+            )
+            previous = timestamp
+        return "\n".join(lines)
+
+    def report(self, stream=None):
+        """Print the report once if startup went over budget or one was requested; returns whether within budget"""
+        within = self.elapsed <= self.budget
+        if not self.reported and (not within or os.environ.get(REPORT_VARIABLE)):
+            print(self.format_report(), file=stream or sys.stderr)
+        self.reported = True
+        return within
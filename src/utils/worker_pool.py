@@ -0,0 +1,312 @@
+import json
+import os
+import queue
+import subprocess
+import threading
+import time
+
+
+STARTUP_TIMEOUT = 30
+# Extra time a worker gets to report a run it has already killed for timing out
+RESPONSE_GRACE = 5
+
+# Runs inside the target interpreter: a long-lived worker that reads one JSON
+# request per line and answers with one JSON line. Where fork is available each
+# script runs in a child forked from the warm worker, so it gets a fresh
+# namespace without paying interpreter startup; elsewhere it runs in-process
+# and the modules it imported are dropped afterwards.
+WORKER_SCRIPT = r"""
+import atexit, gc, importlib, io, json, os, runpy, signal, sys, tempfile, threading, time, traceback
+# run_path imports pkgutil (and with it re and typing) lazily; do it once here, not in every child
+import pkgutil
+
+# The protocol owns the original pipes; stray writes of the worker go nowhere
+requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+protocol = os.fdopen(os.dup(1), "w", encoding="utf-8")
+devnull = os.open(os.devnull, os.O_RDWR)
+os.dup2(devnull, 0)
+os.dup2(devnull, 1)
+
+FORK = hasattr(os, "fork") and hasattr(os, "wait4")
+WORKER_PATH0 = sys.path[0]
+
+
+def send(message):
+    protocol.write(json.dumps(message) + "\n")
+    protocol.flush()
+
+
+def exit_status(code):
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    sys.stderr.write(str(code) + "\n")
+    return 1
+
+
+def execute(script, argv):
+    sys.argv = [script] + list(argv)
+    sys.path[0] = os.path.dirname(os.path.abspath(script))
+    try:
+        runpy.run_path(script, run_name="__main__")
+        return 0
+    except SystemExit as e:
+        return exit_status(e.code)
+    except BaseException:
+        traceback.print_exc()
+        return 1
+
+
+def waitstatus_to_exitcode(status):
+    return -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+
+
+def run_forked(script, argv, timeout):
+    with tempfile.TemporaryFile() as out_file, tempfile.TemporaryFile() as err_file:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        start = time.perf_counter()
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                os.dup2(out_file.fileno(), 1)
+                os.dup2(err_file.fileno(), 2)
+                code = execute(script, argv)
+                if hasattr(atexit, "_run_exitfuncs"):
+                    atexit._run_exitfuncs()
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(code)
+        lock = threading.Lock()
+        state = {"reaped": False, "timed_out": False}
+
+        def kill():
+            with lock:
+                if state["reaped"]:
+                    return
+                state["timed_out"] = True
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except OSError:
+                    pass
+
+        timer = threading.Timer(timeout, kill) if timeout else None
+        if timer:
+            timer.start()
+        try:
+            if hasattr(os, "waitid"):
+                # Wait without reaping: the pid cannot be reused until the flag is set
+                os.waitid(os.P_PID, pid, os.WEXITED | os.WNOWAIT)
+                with lock:
+                    state["reaped"] = True
+            _, status, usage = os.wait4(pid, 0)
+            wall = time.perf_counter() - start
+            with lock:
+                state["reaped"] = True
+        finally:
+            if timer:
+                # Joined so the next fork happens with a single thread
+                timer.cancel()
+                timer.join()
+        out_file.seek(0)
+        err_file.seek(0)
+        peak_rss = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+        return {
+            "stdout": out_file.read().decode(errors="replace"),
+            "stderr": err_file.read().decode(errors="replace"),
+            "returncode": waitstatus_to_exitcode(status),
+            "timing": {
+                "wall": wall, "user": usage.ru_utime, "sys": usage.ru_stime, "peak_rss": peak_rss,
+                "timed_out": state["timed_out"],
+            },
+        }
+
+
+def run_in_process(script, argv, timeout):
+    out, err = io.StringIO(), io.StringIO()
+    saved = (sys.stdout, sys.stderr, sys.argv, list(sys.modules))
+    sys.stdout, sys.stderr = out, err
+    # An in-process run cannot be interrupted; the timer only notes that it overran
+    overran = threading.Event()
+    deadline = threading.Timer(timeout, overran.set) if timeout else None
+    if deadline:
+        deadline.start()
+    start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        code = execute(script, argv)
+    finally:
+        wall, cpu = time.perf_counter() - start, time.process_time() - cpu_start
+        if deadline:
+            deadline.cancel()
+            deadline.join()
+        sys.stdout, sys.stderr, sys.argv = saved[:3]
+        sys.path[0] = WORKER_PATH0
+        for name in set(sys.modules) - set(saved[3]):
+            del sys.modules[name]
+    return {
+        "stdout": out.getvalue(),
+        "stderr": err.getvalue(),
+        "returncode": code,
+        "timing": {
+            "wall": wall, "user": cpu, "sys": None, "peak_rss": None,
+            "timed_out": overran.is_set(),
+        },
+    }
+
+
+preloaded, errors = [], {}
+for name in sys.argv[1:]:
+    try:
+        importlib.import_module(name)
+        preloaded.append(name)
+    except Exception as e:
+        errors[name] = "%s: %s" % (type(e).__name__, e)
+if FORK and hasattr(gc, "freeze"):
+    # Keep forked children from touching (and copying) the preloaded objects
+    gc.freeze()
+send({"ready": True, "fork": FORK, "pid": os.getpid(), "preloaded": preloaded, "errors": errors})
+
+for line in requests:
+    try:
+        request = json.loads(line)
+        run = run_forked if FORK else run_in_process
+        response = run(request["script"], request.get("args", []), request.get("timeout"))
+    except Exception:
+        response = {"error": traceback.format_exc()}
+    send(response)
+"""
+
+
+class InterpreterWorker:
+    """A pre-warmed interpreter process that runs scripts sent over a pipe"""
+    def __init__(self, python_path, preload=()):
+        self.python_path = python_path
+        self.preload = tuple(preload)
+        self.process = None
+        self.info = None
+        self.startup = None
+        self.runs = 0
+        self._responses = queue.Queue()
+        self._lock = threading.Lock()
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def start(self, timeout=STARTUP_TIMEOUT):
+        """Launch the worker and wait until it is ready; returns (info, code, error)"""
+        start = time.perf_counter()
+        try:
+            self.process = subprocess.Popen(
+                [str(self.python_path), "-c", WORKER_SCRIPT, *self.preload],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                text=True, encoding="utf-8", bufsize=1
+            )
+        except Exception as e:
+            return (None, -1, str(e))
+        self._responses = queue.Queue()
+        threading.Thread(target=self._read_responses, args=(self.process, self._responses), daemon=True).start()
+
+        info = self._receive(timeout)
+        if not info or not info.get("ready"):
+            self.stop()
+            return (None, -1, "Worker failed to start")
+        self.info = info
+        self.startup = time.perf_counter() - start
+        return (info, 0, None)
+
+    @staticmethod
+    def _read_responses(process, responses):
+        for line in process.stdout:
+            try:
+                responses.put(json.loads(line))
+            except ValueError:
+                continue
+        # EOF: the worker exited
+        responses.put(None)
+
+    def _receive(self, timeout):
+        try:
+            return self._responses.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def run(self, script_path, args=(), timeout=None):
+        """Run a script in the warm worker, returning what time_python_script does"""
+        with self._lock:
+            if not self.alive:
+                info, return_code, error = self.start()
+                if not info:
+                    return (None, error, return_code, None)
+
+            request = {"script": os.path.abspath(str(script_path)), "args": [str(arg) for arg in args], "timeout": timeout}
+            try:
+                self.process.stdin.write(json.dumps(request) + "\n")
+                self.process.stdin.flush()
+            except OSError as e:
+                self.stop()
+                return (None, f"Worker died: {e}", -1, None)
+
+            response = self._receive(timeout + RESPONSE_GRACE if timeout else None)
+            if response is None:
+                # Hung (an in-process run cannot be interrupted) or crashed: start over next time
+                self.stop()
+                error = f"Worker did not respond within {timeout} seconds" if timeout else "Worker exited unexpectedly"
+                return (None, error, -1, None)
+            if "error" in response:
+                return (None, response["error"], -1, None)
+
+            self.runs += 1
+            timing = dict(response["timing"], mode="warm")
+            return (response["stdout"], response["stderr"], response["returncode"], timing)
+
+    def stop(self):
+        """Terminate the worker process"""
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+
+
+class WorkerPool:
+    """One warm worker per interpreter, started on first use and reused afterwards"""
+    def __init__(self, preload=()):
+        self.preload = tuple(preload)
+        self._workers = {}
+        self._lock = threading.Lock()
+
+    def worker(self, python_path):
+        key = os.path.normcase(os.path.abspath(str(python_path)))
+        with self._lock:
+            if key not in self._workers:
+                self._workers[key] = InterpreterWorker(python_path, self.preload)
+            return self._workers[key]
+
+    def run(self, python_path, script_path, args=(), timeout=None):
+        """Run a script in the warm worker of an interpreter; same result shape as time_python_script"""
+        return self.worker(python_path).run(script_path, args=args, timeout=timeout)
+
+    def close(self, python_path=None):
+        """Stop the worker of one interpreter, or all workers"""
+        with self._lock:
+            if python_path is None:
+                workers, self._workers = list(self._workers.values()), {}
+            else:
+                key = os.path.normcase(os.path.abspath(str(python_path)))
+                workers = [self._workers.pop(key)] if key in self._workers else []
+        for worker in workers:
+            worker.stop()
+
+
+worker_pool = WorkerPool()
@@ -0,0 +1,25 @@
+import subprocess
+import sys
+
+from src.utils.analysis import RELATIVE_PATHS, run_all
+
+
+def test_run_all_maps_each_environment_to_its_result():
+    results = run_all(lambda python_path, suffix: python_path + suffix, [("a", "x"), ("b", "y")], "!")
+    assert results == {"a": "x!", "b": "y!"}
+
+
+def test_run_all_with_no_environments():
+    assert run_all(lambda python_path: python_path, []) == {}
+
+
+def test_relative_paths_in_target_interpreter(tmp_path):
+    code = "import os, sys, sysconfig\nsys.path[0] = sys.argv[1]\n" + RELATIVE_PATHS + (
+        "print(relative(os.path.join(sys.argv[1], 'pkg', 'mod.py')))\n"
+        "print(relative(os.__file__))\n"
+        "print(relative('<frozen importlib._bootstrap>'))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code, str(tmp_path)], capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    assert output == ["pkg/mod.py", "<stdlib>/os.py", "<stdlib>/importlib/_bootstrap.py"]
@@ -0,0 +1,34 @@
+import asyncio
+import sys
+
+from src.utils import async_env
+from src.utils.async_env import AsyncRunScheduler, execute_python_async
+
+
+def test_rerun_leaves_earlier_runs_running(tmp_path):
+    slow = tmp_path / "slow.py"
+    slow.write_text("import time\ntime.sleep(0.5)\nprint('done')\n")
+    fast = tmp_path / "fast.py"
+    fast.write_text("print('ok')\n")
+    scheduler = AsyncRunScheduler()
+    [first] = scheduler.run([("a", sys.executable)], str(slow))
+    [second] = scheduler.run([("b", sys.executable)], str(fast))
+    assert second.result(timeout=10)["status"] == "completed"
+    result = first.result(timeout=10)
+    assert (result["status"], result["stdout"]) == ("completed", "done\n")
+    for future in (first, second):
+        future.result()["output"].discard()
+
+
+def test_failed_launch_discards_the_buffer(tmp_path, monkeypatch):
+    discarded = []
+
+    class RecordingBuffer(async_env.OutputBuffer):
+        def discard(self):
+            discarded.append(self)
+            super().discard()
+
+    monkeypatch.setattr(async_env, "OutputBuffer", RecordingBuffer)
+    result = asyncio.run(execute_python_async(str(tmp_path / "missing-python"), ["-c", "pass"]))
+    assert result["status"] == "error"
+    assert len(discarded) == 1
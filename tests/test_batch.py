@@ -0,0 +1,114 @@
+import json
+import sys
+
+import pytest
+
+from src.utils.batch import BatchJournal, BatchRunner, cell_inputs
+from src.utils.outcomes import CANCELLED, ERROR, FAILED, PASSED, TIMEOUT
+
+
+@pytest.fixture
+def scripts(tmp_path):
+    paths = []
+    for name in ("a.py", "b.py"):
+        path = tmp_path / name
+        path.write_text("print(1)\n")
+        paths.append(str(path))
+    return paths
+
+
+def cell(script, status):
+    return {"script": script, "python_path": sys.executable, "status": status}
+
+
+def test_journal_round_trip_keeps_the_last_record_per_cell(tmp_path, scripts):
+    a, b = scripts
+    journal = BatchJournal(str(tmp_path / "journal.jsonl"))
+    journal.append(cell(a, FAILED))
+    journal.append(cell(a, PASSED))
+    journal.append(cell(b, FAILED))
+    records = journal.load()
+    assert {key: record["status"] for key, record in records.items()} == {
+        (a, sys.executable): PASSED, (b, sys.executable): FAILED,
+    }
+
+
+def test_journal_leaves_out_timeouts_and_errors(tmp_path, scripts):
+    a, b = scripts
+    journal = BatchJournal(str(tmp_path / "journal.jsonl"))
+    journal.append(cell(a, TIMEOUT))
+    journal.append(cell(b, ERROR))
+    assert journal.load() == {}
+
+
+def test_journal_retries_cells_whose_last_record_is_unfinished(tmp_path, scripts):
+    a, _ = scripts
+    path = tmp_path / "journal.jsonl"
+    # As written by versions that journaled every status
+    records = [dict(cell(a, PASSED), inputs=cell_inputs(a, sys.executable)), cell(a, TIMEOUT)]
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    assert BatchJournal(str(path)).load() == {}
+
+
+def test_journal_skips_a_half_written_last_line(tmp_path, scripts):
+    a, _ = scripts
+    path = tmp_path / "journal.jsonl"
+    BatchJournal(str(path)).append(cell(a, PASSED))
+    with open(path, "a") as f:
+        f.write('{"script": "b.py", "sta')
+    assert list(BatchJournal(str(path)).load()) == [(a, sys.executable)]
+
+
+def test_journal_drops_cells_whose_script_changed(tmp_path, scripts):
+    a, b = scripts
+    journal = BatchJournal(str(tmp_path / "journal.jsonl"))
+    journal.append(cell(a, PASSED))
+    journal.append(cell(b, PASSED))
+    with open(a, "w") as f:
+        f.write("raise SystemExit(5)\n")
+    assert list(journal.load()) == [(b, sys.executable)]
+
+
+def test_resume_reruns_interrupted_cells_and_a_finished_batch_drops_the_journal(tmp_path):
+    fast = tmp_path / "fast.py"
+    fast.write_text("print('ok')\n")
+    slow = tmp_path / "slow.py"
+    slow.write_text("import time\ntime.sleep(30)\n")
+    journal = BatchJournal(str(tmp_path / "journal.jsonl"))
+    scripts = [str(fast), str(slow)]
+
+    runner = BatchRunner([("env", sys.executable)], scripts, timeout=0.5, journal=journal)
+    # Interrupt the batch as soon as the fast script is done
+    runner.run(on_result=lambda record: record["status"] == PASSED and runner.cancel())
+    assert [record["status"] for record in runner.wait()] == [PASSED, CANCELLED]
+
+    resumed = []
+    runner = BatchRunner([("env", sys.executable)], scripts, timeout=0.5, journal=journal)
+    runner.run(on_result=resumed.append)
+    assert [record["status"] for record in runner.wait()] == [TIMEOUT]
+    assert {record["script"]: bool(record.get("resumed")) for record in resumed} == {str(fast): True, str(slow): False}
+    assert journal.load() == {}
+
+
+def test_resume_does_not_replay_a_cell_whose_script_changed(tmp_path):
+    script = tmp_path / "script.py"
+    script.write_text("print(1)\n")
+    journal = BatchJournal(str(tmp_path / "journal.jsonl"))
+    journal.append(cell(str(script), PASSED))
+    script.write_text("raise SystemExit(5)\n")
+
+    runner = BatchRunner([("env", sys.executable)], [str(script)], journal=journal)
+    runner.run()
+    [record] = runner.wait()
+    assert record["status"] == FAILED and not record.get("resumed")
+
+
+def test_forced_run_ignores_the_journal(tmp_path, scripts):
+    a, _ = scripts
+    journal = BatchJournal(str(tmp_path / "journal.jsonl"))
+    journal.append(cell(a, FAILED))
+
+    runner = BatchRunner([("env", sys.executable)], [a], journal=journal, force=True)
+    runner.run()
+    [record] = runner.wait()
+    assert record["status"] == PASSED and not record.get("resumed")
@@ -0,0 +1,25 @@
+from src.utils.benchmark import reject_outliers, summarize
+
+
+def test_rejects_gross_outlier_at_default_run_count():
+    summary = summarize([1, 1.1, 1.05, 0.95, 10])
+    assert summary["outliers"] == 1
+    assert summary["runs"] == 4
+    assert summary["min"] == 0.95
+    assert summary["median"] == 1.025
+
+
+def test_keeps_all_samples_when_too_few_for_quartiles():
+    assert reject_outliers([1, 100, 1000]) == ([1, 100, 1000], [])
+
+
+def test_keeps_tightly_clustered_samples():
+    kept, rejected = reject_outliers([1.0, 1.01, 0.99, 1.02, 0.98, 1.0])
+    assert rejected == []
+    assert len(kept) == 6
+
+
+def test_summarize_skips_missing_values():
+    assert summarize([None, None]) is None
+    summary = summarize([None, 2.0])
+    assert summary == {"min": 2.0, "median": 2.0, "mean": 2.0, "stddev": 0.0, "runs": 1, "outliers": 0}
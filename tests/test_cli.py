@@ -0,0 +1,52 @@
+import json
+import os
+import sys
+
+import pytest
+
+from src.cli import main
+from src.utils.interpreter_cache import cache_dir, interpreter_cache
+from src.utils.result_cache import result_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keep the interpreter cache, result cache and run history out of the developer's own cache directory"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    # The shared caches resolved their paths at import time
+    monkeypatch.setattr(interpreter_cache, "path", os.path.join(cache_dir(), "interpreters.json"))
+    monkeypatch.setattr(interpreter_cache, "_entries", None)
+    monkeypatch.setattr(result_cache, "directory", os.path.join(cache_dir(), "results"))
+    monkeypatch.setattr(result_cache, "_size", None)
+    return tmp_path / "cache"
+
+
+def test_runs_scripts_and_writes_a_json_report(tmp_path):
+    passing = tmp_path / "passing.py"
+    passing.write_text("print('hello')\n")
+    failing = tmp_path / "failing.py"
+    failing.write_text("raise SystemExit(3)\n")
+    report_path = tmp_path / "report.json"
+
+    code = main([str(passing), str(failing), "-p", sys.executable, "--json", str(report_path)])
+    assert code == 1
+    report = json.loads(report_path.read_text())
+    assert [cell["status"] for cell in report["results"]] == ["passed", "failed"]
+
+
+def test_resume_skips_journaled_cells(tmp_path, capsys):
+    script = tmp_path / "script.py"
+    script.write_text("print('hello')\n")
+    journal = tmp_path / "journal.jsonl"
+    assert main([str(script), "-p", sys.executable, "--resume", str(journal)]) == 0
+    capsys.readouterr()
+    assert main([str(script), "-p", sys.executable, "--resume", str(journal)]) == 0
+    assert "(resumed)" in capsys.readouterr().out
+
+
+def test_history_is_kept_in_the_cache_directory(tmp_path, cache_home):
+    script = tmp_path / "script.py"
+    script.write_text("print('hello')\n")
+    assert main([str(script), "-p", sys.executable, "--history"]) == 0
+    assert (cache_home / "pyversioner" / "history.sqlite3").exists()
+    assert (cache_home / "pyversioner" / "interpreters.json").exists()
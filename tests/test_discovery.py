@@ -0,0 +1,6 @@
+from src.utils.discovery import _version_key
+
+
+def test_pre_releases_sort_before_the_final_release():
+    versions = ["3.13.0", "3.13.0rc1", "3.12.10", "3.12.9", "3.13.0b2", "3.14.0a1+"]
+    assert sorted(versions, key=_version_key) == ["3.12.9", "3.12.10", "3.13.0b2", "3.13.0rc1", "3.13.0", "3.14.0a1+"]
@@ -0,0 +1,35 @@
+from src.utils.importtime import compare_imports, flatten_tree, parse_importtime
+
+
+STDERR = """import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     _codecs
+import time:       300 |        400 |   codecs
+import time:        50 |         50 |   _stat
+import time:       200 |        650 | encodings
+warning: something else
+import time:        10 |         10 | site
+"""
+
+
+def test_parse_builds_the_import_tree():
+    tree, other = parse_importtime(STDERR)
+    assert [node["name"] for node in tree] == ["encodings", "site"]
+    encodings = tree[0]
+    assert [child["name"] for child in encodings["children"]] == ["codecs", "_stat"]
+    assert encodings["children"][0]["children"][0] == {"name": "_codecs", "self": 100, "cumulative": 100, "children": []}
+    assert other == "warning: something else\n"
+
+
+def test_flatten_tree_maps_every_module():
+    tree, _ = parse_importtime(STDERR)
+    modules = flatten_tree(tree)
+    assert set(modules) == {"encodings", "codecs", "_codecs", "_stat", "site"}
+    assert modules["codecs"] == {"self": 300, "cumulative": 400}
+
+
+def test_compare_imports_sorts_by_regression():
+    base = {"modules": {"a": {"self": 1, "cumulative": 10}, "b": {"self": 1, "cumulative": 10}}}
+    other = {"modules": {"a": {"self": 1, "cumulative": 50}, "b": {"self": 1, "cumulative": 5}, "c": {"self": 1, "cumulative": 7}}}
+    rows = compare_imports([("base", base), ("other", other)])
+    assert [(row["module"], row["regression"]) for row in rows] == [("a", 40), ("c", 7), ("b", -5)]
+    assert rows[1]["times"]["base"] is None
@@ -0,0 +1,43 @@
+from src.utils.microbench import compare_microbenchmarks, find_benchmarks, summarize_values
+
+
+def test_find_benchmarks_functions_and_snippets(tmp_path):
+    script = tmp_path / "bench.py"
+    script.write_text(
+        "import functools\n"
+        "# benchmark\n"
+        "@functools.lru_cache(None)\n"
+        "def cached():\n"
+        "    return 1\n"
+        "\n"
+        "# benchmark: joins\n"
+        "items = [str(i) for i in range(10)]\n"
+        "text = ','.join(items)\n"
+        "# end benchmark\n"
+    )
+    benchmarks = find_benchmarks(str(script))
+    assert [(benchmark["name"], benchmark["kind"]) for benchmark in benchmarks] == [
+        ("cached", "function"), ("joins", "snippet"),
+    ]
+    assert benchmarks[0]["function"] == "cached"
+
+
+def test_summarize_values():
+    assert summarize_values([]) is None
+    single = summarize_values([2.0])
+    assert (single["mean"], single["stdev"], single["ci"]) == (2.0, 0.0, None)
+    summary = summarize_values([1.0, 2.0, 3.0])
+    assert summary["median"] == 2.0
+    # t(2) = 4.303 for a 95% interval
+    assert round(summary["ci"], 3) == round(4.303 * 1.0 / 3 ** 0.5, 3)
+
+
+def test_compare_microbenchmarks_speedups():
+    def result(mean, ci):
+        return {"benchmarks": {"loop": {"mean": mean, "ci": ci}}}
+
+    rows = compare_microbenchmarks([("base", result(2.0, 0.01)), ("fast", result(1.0, 0.01)), ("same", result(2.0, 0.5))])
+    speedups = rows[0]["speedups"]
+    assert speedups["fast"]["speedup"] == 2.0
+    assert speedups["fast"]["significant"]
+    assert not speedups["same"]["significant"]
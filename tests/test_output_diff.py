@@ -0,0 +1,23 @@
+from src.utils.output_diff import diff_outputs, iter_diff_lines, normalize_text
+
+
+def test_identical_outputs():
+    diff = diff_outputs("a\nb\n", "a\nb\n")
+    assert diff["identical"]
+    assert (diff["added"], diff["removed"]) == (0, 0)
+
+
+def test_counts_changed_lines_between_common_prefix_and_suffix():
+    diff = diff_outputs("a\nb\nc\nd\n", "a\nx\ny\nd\n")
+    assert (diff["added"], diff["removed"]) == (2, 2)
+    assert [line for kind, line in iter_diff_lines(diff) if kind in "-+"] == ["b", "c", "x", "y"]
+
+
+def test_normalization_rules():
+    text = "at 0x7f3a2b 2024-01-02 10:20:30 in /usr/lib/python3.12/os.py"
+    assert normalize_text(text, ["addresses", "timestamps", "paths"]) == "at <ADDRESS> <TIMESTAMP> in <PATH>"
+
+
+def test_normalized_differences_are_ignored():
+    assert not diff_outputs("object at 0x1234\n", "object at 0xabcd\n")["identical"]
+    assert diff_outputs("object at 0x1234\n", "object at 0xabcd\n", rules=["addresses"])["identical"]
@@ -0,0 +1,38 @@
+from src.utils.package_diff import (
+    ADDED, DOWNGRADED, REMOVED, SAME, UPGRADED, diff_packages, has_differences, normalize_name, version_key,
+)
+
+
+def test_version_key_orders_per_pep_440():
+    versions = ["1.0.post1", "1.0", "1.0rc1", "1.0b2", "1.0a1", "1.0.dev0", "0.9", "1.0+local.2", "2!0.1", "1.10"]
+    ordered = sorted(versions, key=version_key)
+    assert ordered == ["0.9", "1.0.dev0", "1.0a1", "1.0b2", "1.0rc1", "1.0", "1.0+local.2", "1.0.post1", "1.10", "2!0.1"]
+
+
+def test_version_key_ignores_trailing_zeros():
+    assert version_key("1.0") == version_key("1.0.0")
+    assert version_key("v1.2") == version_key("1.2")
+
+
+def test_unparsable_versions_sort_first():
+    assert sorted(["1.0", "unknown"], key=version_key) == ["unknown", "1.0"]
+
+
+def test_normalize_name():
+    assert normalize_name("Foo_Bar.baz") == "foo-bar-baz"
+
+
+def test_diff_packages_against_the_baseline():
+    diff = diff_packages([
+        ("base", [{"name": "a", "version": "1.0"}, {"name": "b", "version": "2.0"}, {"name": "c", "version": "1"}]),
+        ("other", [{"name": "A", "version": "1.1"}, {"name": "b", "version": "1.9"}, {"name": "d", "version": "1"}]),
+    ])
+    changes = {row["key"]: row["changes"]["other"] for row in diff["rows"]}
+    assert changes == {"a": UPGRADED, "b": DOWNGRADED, "c": REMOVED, "d": ADDED}
+    assert diff["summary"]["other"] == {ADDED: 1, REMOVED: 1, UPGRADED: 1, DOWNGRADED: 1, SAME: 0}
+
+
+def test_identical_environments_have_no_differences():
+    packages = [{"name": "a", "version": "1.0"}]
+    diff = diff_packages([("x", packages), ("y", packages)])
+    assert not any(has_differences(row) for row in diff["rows"])
@@ -0,0 +1,53 @@
+import os
+import sys
+import venv
+
+import pytest
+
+from src.utils.python_env import execute_python, probe_interpreter, time_python_script
+
+
+def write_script(tmp_path, source):
+    script = tmp_path / "script.py"
+    script.write_text(source)
+    return str(script)
+
+
+def test_time_python_script_reports_timeout_from_the_kill(tmp_path):
+    script = write_script(tmp_path, "import time\ntime.sleep(30)\n")
+    stdout, stderr, returncode, timing = time_python_script(sys.executable, script, timeout=0.5)
+    assert timing["timed_out"]
+    assert returncode != 0
+
+
+def test_time_python_script_slow_run_within_timeout_is_not_timed_out(tmp_path):
+    script = write_script(tmp_path, "import time\ntime.sleep(0.2)\nprint('done')\n")
+    stdout, stderr, returncode, timing = time_python_script(sys.executable, script, timeout=10)
+    assert (stdout, returncode, timing["timed_out"]) == ("done\n", 0, False)
+
+
+def test_execute_python_streams_before_exit(tmp_path):
+    script = write_script(tmp_path, "import time\nprint('first')\ntime.sleep(1)\nprint('second')\n")
+    chunks = []
+    result = execute_python(sys.executable, [script], on_output=lambda stream, text, timestamp: chunks.append(timestamp))
+    assert result["status"] == "completed"
+    # The first line arrived well before the process slept and exited
+    assert chunks[0] < 0.9
+
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="venv layout differs on Windows")
+def test_probe_sees_paths_added_by_pth_files(tmp_path):
+    venv.create(tmp_path / "venv", with_pip=False)
+    python = str(tmp_path / "venv" / "bin" / "python")
+    dist_info = tmp_path / "extra" / "demo_pkg-1.0.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: demo-pkg\nVersion: 1.0\n")
+    data, returncode, error = probe_interpreter(python, packages=False)
+    site_packages = data["info"]["site_packages"][0]
+    with open(os.path.join(site_packages, "extra.pth"), "w") as f:
+        f.write(str(tmp_path / "extra") + "\n")
+
+    data, returncode, error = probe_interpreter(python)
+    assert error is None
+    assert "demo-pkg" in [package["name"] for package in data["packages"]]
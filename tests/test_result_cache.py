@@ -0,0 +1,36 @@
+from src.utils.result_cache import ResultCache
+
+
+def test_refreshing_an_entry_does_not_inflate_the_size(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=10 ** 6)
+    key = "ab" * 32
+    for _ in range(5):
+        cache.put(key, {"stdout": "x" * 100})
+    assert cache._size == cache._scan_size()
+
+
+def test_refreshes_do_not_evict_other_entries(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    cache.put("aa" * 32, {"stdout": "first"})
+    cache.max_bytes = cache._scan_size() * 3
+    for _ in range(10):
+        cache.put("bb" * 32, {"stdout": "second"})
+    assert cache.get("aa" * 32) == {"stdout": "first"}
+
+
+def test_evicts_least_recently_used_entries_over_the_limit(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    cache.put("aa" * 32, {"stdout": "old"})
+    entry_size = cache._scan_size()
+    cache.max_bytes = entry_size * 2
+    cache.put("bb" * 32, {"stdout": "new"})
+    cache.put("cc" * 32, {"stdout": "newest"})
+    assert cache._size <= cache.max_bytes
+    assert cache.get("cc" * 32) == {"stdout": "newest"}
+
+
+def test_missing_key_is_neither_read_nor_stored(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    cache.put(None, {"stdout": "x"})
+    assert cache.get(None) is None
+    assert cache._scan_size() == 0
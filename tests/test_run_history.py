@@ -0,0 +1,43 @@
+from src.utils.run_history import IMPROVEMENT, REGRESSION, STEADY, detect_regression, format_regression
+
+
+BASELINE = [1.00, 1.02, 0.98, 1.01, 0.99, 1.00, 1.03, 0.97]
+
+
+def test_needs_enough_history():
+    assert detect_regression(BASELINE[:4], [2.0]) is None
+    assert detect_regression(BASELINE, []) is None
+
+
+def test_flags_a_clear_slowdown():
+    check = detect_regression(BASELINE, [1.30, 1.31, 1.29])
+    assert check["status"] == REGRESSION
+    assert round(check["change"], 2) == 0.30
+
+
+def test_flags_a_clear_speedup():
+    assert detect_regression(BASELINE, [0.70, 0.71, 0.69])["status"] == IMPROVEMENT
+
+
+def test_noise_within_the_history_spread_is_steady():
+    assert detect_regression(BASELINE, [1.01, 0.99, 1.02])["status"] == STEADY
+
+
+def test_stray_slow_runs_in_the_history_do_not_hide_a_regression():
+    check = detect_regression(BASELINE + [5.0, 6.0], [1.30, 1.31, 1.29])
+    assert check["status"] == REGRESSION
+
+
+def test_small_changes_are_steady_even_with_a_tight_history():
+    baseline = [1.0] * 10
+    assert detect_regression(baseline, [1.03] * 5)["status"] == STEADY
+
+
+def test_missing_values_are_ignored():
+    check = detect_regression(BASELINE + [None], [None, 1.3])
+    assert check["runs"] == 1
+    assert check["baseline_runs"] == len(BASELINE)
+
+
+def test_format_regression_without_history():
+    assert format_regression(None) == "Not enough history to detect regressions yet."
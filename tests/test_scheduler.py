@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+from src.utils.scheduler import RunScheduler, SERIAL_PINNED
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_getaffinity"), reason="CPU affinity is Linux-only")
+def test_serial_pinned_uses_an_allowed_cpu():
+    scheduler = RunScheduler(concurrency=SERIAL_PINNED)
+    assert scheduler.concurrency == 1
+    assert scheduler.pin_cpu in os.sched_getaffinity(0)
+
+
+def test_rerun_releases_the_previous_pool(tmp_path):
+    script = tmp_path / "script.py"
+    script.write_text("print('ok')\n")
+    scheduler = RunScheduler(concurrency=2)
+    for _ in range(2):
+        scheduler.run([("a", sys.executable), ("b", sys.executable)], str(script))
+        results = scheduler.wait()
+        assert [result["status"] for result in results] == ["completed", "completed"]
+    scheduler.shutdown()
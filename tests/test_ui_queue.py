@@ -0,0 +1,45 @@
+import tkinter as tk
+
+from src.ui.ui_queue import UiQueue
+
+
+class FakeWidget:
+    """Just enough of a Tk widget for UiQueue: records scheduled ticks and reported errors"""
+    def __init__(self):
+        self.exists = True
+        self.scheduled = []
+        self.errors = []
+
+    def after(self, interval_ms, callback):
+        self.scheduled.append(callback)
+
+    def winfo_exists(self):
+        return self.exists
+
+    def report_callback_exception(self, exc_type, exc_value, traceback):
+        self.errors.append(exc_type)
+
+
+def fail(error):
+    raise error
+
+
+def test_failing_callbacks_do_not_drop_the_batch_or_stop_the_loop():
+    widget = FakeWidget()
+    ui_queue = UiQueue(widget)
+    ran = []
+    ui_queue.post(fail, ValueError("boom"))
+    ui_queue.post(fail, tk.TclError("invalid command name"))
+    ui_queue.post(ran.append, 1)
+    widget.scheduled.pop()()
+    assert ran == [1]
+    assert widget.errors == [ValueError, tk.TclError]
+    assert len(widget.scheduled) == 1
+
+
+def test_loop_stops_once_the_widget_is_destroyed():
+    widget = FakeWidget()
+    ui_queue = UiQueue(widget)
+    widget.exists = False
+    widget.scheduled.pop()()
+    assert widget.scheduled == []
@@ -0,0 +1,36 @@
+import sys
+
+from src.utils.worker_pool import WorkerPool
+
+
+def test_warm_worker_runs_scripts_repeatedly(tmp_path):
+    script = tmp_path / "script.py"
+    script.write_text("import sys\nprint('args', sys.argv[1:])\n")
+    failing = tmp_path / "failing.py"
+    failing.write_text("raise SystemExit(4)\n")
+    pool = WorkerPool()
+    try:
+        for _ in range(2):
+            stdout, stderr, returncode, timing = pool.run(sys.executable, str(script), args=["x"])
+            assert (stdout, returncode) == ("args ['x']\n", 0)
+            assert timing["wall"] > 0
+        stdout, stderr, returncode, timing = pool.run(sys.executable, str(failing))
+        assert returncode == 4
+    finally:
+        pool.close()
+
+
+def test_timed_out_comes_from_the_kill_timer(tmp_path):
+    slow = tmp_path / "slow.py"
+    slow.write_text("import time\ntime.sleep(30)\n")
+    fast = tmp_path / "fast.py"
+    fast.write_text("pass\n")
+    pool = WorkerPool()
+    try:
+        stdout, stderr, returncode, timing = pool.run(sys.executable, str(slow), timeout=0.5)
+        assert timing["timed_out"] and returncode == -9
+        assert timing["wall"] < 10
+        stdout, stderr, returncode, timing = pool.run(sys.executable, str(fast), timeout=5)
+        assert not timing["timed_out"] and returncode == 0
+    finally:
+        pool.close()